@@ -0,0 +1,61 @@
+"""Benchmark LinearSvmModel.predict_batch per-row cost across batch sizes.
+
+Usage:
+    python benchmarks/bench_predict_batch.py [--dtype float32] [--repeats 5]
+
+Reports the best-of-repeats wall time per call and per row for N = 1, 100,
+1e5 and 1e6, alongside the dict-based predict() loop for small N.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from synheart_emotion import LinearSvmModel
+
+BATCH_SIZES = [1, 100, 100_000, 1_000_000]
+
+
+def _best_time(fn, repeats: int, inner: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(inner):
+            fn()
+        best = min(best, (time.perf_counter() - start) / inner)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dtype", default="float64", choices=["float64", "float32"])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    model = LinearSvmModel.create_default(dtype=args.dtype)
+    rng = np.random.default_rng(0)
+
+    print(f"predict_batch ({args.dtype}, best of {args.repeats})")
+    print(f"{'N':>10} {'per call':>12} {'per row':>12} {'dict loop/row':>14}")
+
+    for n in BATCH_SIZES:
+        features = np.column_stack(
+            [rng.normal(72.0, 12.0, n), rng.normal(45.0, 18.0, n), rng.normal(32.0, 12.0, n)]
+        ).astype(args.dtype)
+        out = np.empty((n, len(model.labels)), dtype=args.dtype)
+        inner = max(1, 20_000 // n)
+
+        per_call = _best_time(lambda: model.predict_batch(features, out=out), args.repeats, inner)
+
+        loop_per_row = ""
+        if n <= 100:
+            dicts = [dict(zip(model.feature_names, row.tolist())) for row in features]
+            per_loop = _best_time(lambda: [model.predict(d) for d in dicts], args.repeats, inner)
+            loop_per_row = f"{per_loop / n * 1e6:11.2f} us"
+
+        print(f"{n:>10} {per_call * 1e6:9.2f} us {per_call / n * 1e6:9.4f} us {loop_per_row:>14}")
+
+
+if __name__ == "__main__":
+    main()
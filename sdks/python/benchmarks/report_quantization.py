@@ -0,0 +1,53 @@
+"""Accuracy-parity report for QuantizedLinearModel against its float model.
+
+Usage:
+    python benchmarks/report_quantization.py [--model path/to/model.json] [--samples 100000]
+
+Prints a JSON report with max/mean absolute probability error and top-1
+agreement for float and int8 inputs, plus model sizes and per-row latency.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from synheart_emotion import LinearSvmModel, QuantizedLinearModel
+from synheart_emotion.quantized import quantization_report
+
+
+def _per_row_us(fn, rows: int, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best / rows * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", help="svm_json model file (default: embedded model)")
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    model = LinearSvmModel.from_json(args.model) if args.model else LinearSvmModel.create_default()
+    quantized = QuantizedLinearModel.from_linear(model)
+    report = quantization_report(model, quantized, n_samples=args.samples, seed=args.seed)
+
+    rng = np.random.default_rng(args.seed)
+    features = quantized.mean + rng.normal(size=(args.samples, len(model.feature_names)))
+    features = (features * np.where(quantized.std > 0, quantized.std, 1.0)).astype(np.float32)
+    inputs_q = quantized.quantize_inputs(features)
+    report["latency_us_per_row"] = {
+        "float64_model": _per_row_us(lambda: model.predict_batch(features), args.samples),
+        "float_input": _per_row_us(lambda: quantized.predict_batch(features), args.samples),
+        "int8_input": _per_row_us(lambda: quantized.predict_batch(inputs_q), args.samples),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
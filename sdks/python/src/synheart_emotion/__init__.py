@@ -6,18 +6,42 @@ RR interval data, designed for wearable devices and health monitoring apps.
 
 __version__ = "0.1.0"
 
+from .cache import FeatureCache
+from .cascade import CascadeModel
 from .config import EmotionConfig
 from .engine import EmotionEngine
 from .error import EmotionError
-from .features import FeatureExtractor
+from .features import DEFAULT_FEATURE_REGISTRY, FeatureExtractor, FeaturePlan, FeatureRegistry
+from .gaussian import GaussianModel
 from .models import LinearSvmModel
+from .neighbors import KNeighborsModel
+from .onnx_model import OnnxEmotionModel
+from .quantized import QuantizedLinearModel
+from .rbf_svm import RbfSvmModel
+from .registry import ModelRegistry, default_registry
 from .result import EmotionResult
+from .shadow import ShadowEvaluator
+from .trees import TreeEnsembleModel
 
 __all__ = [
+    "CascadeModel",
     "EmotionConfig",
     "EmotionEngine",
     "EmotionError",
     "EmotionResult",
+    "FeatureCache",
+    "DEFAULT_FEATURE_REGISTRY",
     "FeatureExtractor",
+    "FeaturePlan",
+    "FeatureRegistry",
+    "GaussianModel",
+    "KNeighborsModel",
     "LinearSvmModel",
+    "ModelRegistry",
+    "OnnxEmotionModel",
+    "QuantizedLinearModel",
+    "RbfSvmModel",
+    "ShadowEvaluator",
+    "TreeEnsembleModel",
+    "default_registry",
 ]
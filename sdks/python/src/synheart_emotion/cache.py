@@ -0,0 +1,253 @@
+"""Content-addressed cache for extracted window features."""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from .features import DEFAULT_FEATURE_NAMES, FEATURE_SET_VERSION, FeatureExtractor
+
+
+class FeatureCache:
+    """LRU cache around FeatureExtractor.extract_features.
+
+    Entries are keyed by a BLAKE2b hash of the window's HR and RR arrays, the
+    motion data, the requested feature names, the compute dtype and
+    FEATURE_SET_VERSION, so identical windows featurized by different models
+    or reruns share one entry. The in-memory tier evicts least recently used
+    entries once its byte budget is exceeded; an optional on-disk tier keeps
+    entries across processes.
+
+    Attributes:
+        max_bytes: In-memory byte budget
+        disk_dir: Optional directory for the on-disk tier
+        hits: Lookups answered from memory
+        disk_hits: Lookups answered from disk
+        misses: Lookups that required feature extraction
+        evictions: Entries evicted from memory
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize feature cache.
+
+        Args:
+            max_bytes: In-memory byte budget (default: 64 MiB)
+            disk_dir: Optional directory for the on-disk tier (created if missing)
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        hr_values: Sequence[float],
+        rr_intervals_ms: Sequence[float],
+        motion: Optional[Dict[str, float]] = None,
+        feature_names: Optional[Sequence[str]] = None,
+        dtype: Optional[str] = None,
+    ) -> str:
+        """Compute the content-addressed key for a window.
+
+        Args:
+            hr_values: Heart rate values in BPM
+            rr_intervals_ms: RR intervals in milliseconds
+            motion: Optional motion data
+            feature_names: Requested features (default: hr_mean, sdnn, rmssd)
+            dtype: Compute dtype
+
+        Returns:
+            Hex digest identifying the window and feature set
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        names = feature_names if feature_names is not None else DEFAULT_FEATURE_NAMES
+        header = [FEATURE_SET_VERSION, str(dtype), list(names)]
+        if motion:
+            header.append(sorted(motion.items()))
+        digest.update(json.dumps(header).encode())
+
+        hr = np.ascontiguousarray(hr_values, dtype=np.float64)
+        rr = np.ascontiguousarray(rr_intervals_ms, dtype=np.float64)
+        digest.update(np.int64(hr.size).tobytes())
+        digest.update(hr.tobytes())
+        digest.update(rr.tobytes())
+
+        return digest.hexdigest()
+
+    def extract_features(
+        self,
+        hr_values: Sequence[float],
+        rr_intervals_ms: Sequence[float],
+        motion: Optional[Dict[str, float]] = None,
+        feature_names: Optional[Sequence[str]] = None,
+        dtype: Optional[str] = None,
+    ) -> Dict[str, float]:
+        """Cached equivalent of FeatureExtractor.extract_features.
+
+        Args:
+            hr_values: Heart rate values in BPM
+            rr_intervals_ms: RR intervals in milliseconds
+            motion: Optional motion data as key-value pairs
+            feature_names: Features to compute (default: hr_mean, sdnn, rmssd)
+            dtype: Compute dtype
+
+        Returns:
+            Dictionary of extracted features (a fresh copy the caller may modify)
+        """
+        key = self.make_key(hr_values, rr_intervals_ms, motion, feature_names, dtype)
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        features = FeatureExtractor.extract_features(
+            hr_values=hr_values,
+            rr_intervals_ms=rr_intervals_ms,
+            motion=motion,
+            feature_names=feature_names,
+            dtype=dtype,
+        )
+        self.put(key, features)
+        return dict(features)
+
+    def get(self, key: str) -> Optional[Dict[str, float]]:
+        """Look up features by key, counting a hit or a miss.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Copy of the cached features, or None on a miss
+        """
+        with self._lock:
+            features = self._entries.get(key)
+            if features is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(features)
+
+        features = self._read_disk(key)
+        with self._lock:
+            if features is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._insert(key, features)
+        return dict(features)
+
+    def put(self, key: str, features: Dict[str, float]) -> None:
+        """Store features under key in memory and, if enabled, on disk.
+
+        Args:
+            key: Key from make_key
+            features: Extracted features
+        """
+        features = dict(features)
+        with self._lock:
+            self._insert(key, features)
+        self._write_disk(key, features)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary of counters and memory usage
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset counters (disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _insert(self, key: str, features: Dict[str, float]) -> None:
+        """Insert an entry and evict down to the byte budget (lock held)."""
+        if key in self._entries:
+            self._bytes -= self._sizes[key]
+
+        size = _entry_size(key, features)
+        self._entries[key] = features
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        self._bytes += size
+
+        while self._bytes > self.max_bytes and self._entries:
+            old_key, _ = self._entries.popitem(last=False)
+            self._bytes -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, float]]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "r") as f:
+                return {name: float(value) for name, value in json.load(f).items()}
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, features: Dict[str, float]) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write atomically so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(features, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _entry_size(key: str, features: Dict[str, float]) -> int:
+    """Approximate memory held by one cache entry."""
+    size = sys.getsizeof(key) + sys.getsizeof(features)
+    for name, value in features.items():
+        size += sys.getsizeof(name) + sys.getsizeof(value)
+    return size
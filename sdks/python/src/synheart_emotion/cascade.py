@@ -0,0 +1,392 @@
+"""Confidence-gated cascade of a fast model and slower, more accurate ones."""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .error import BadInputError, ModelIncompatibleError, ModelLoadError
+from .features import FeatureExtractor
+from .registry import ModelRegistry, register_format
+
+
+class CascadeModel:
+    """Runs models in order, escalating only the rows the current stage is unsure of.
+
+    A row is answered by the first stage whose top-1 probability is at least
+    min_confidence and whose top-1 minus top-2 margin is at least
+    min_margin; the last stage answers everything that reaches it. Each
+    stage sees only its own features, taken from the union of all stages'
+    features, and its probabilities are reordered to the first stage's
+    labels.
+
+    Counters for stats() are kept per instance. Models from ModelRegistry
+    are shared process-wide, so a registry-loaded cascade reports the
+    traffic of every engine using it.
+
+    Attributes:
+        model_id: Model identifier
+        version: Model version
+        stages: Models in evaluation order (cheapest first)
+        labels: Class labels, in output order (those of the first stage)
+        feature_names: Union of the stages' feature names
+        min_confidence: Minimum top-1 probability to stop at a stage
+        min_margin: Minimum top-1 minus top-2 probability to stop at a stage
+    """
+
+    FORMAT = "cascade"
+
+    def __init__(
+        self,
+        model_id: str,
+        stages: Sequence[Any],
+        min_confidence: float = 0.8,
+        min_margin: float = 0.0,
+        version: str = "1.0",
+    ):
+        if len(stages) < 2:
+            raise ModelLoadError("a cascade needs at least two stages")
+        if not 0.0 <= min_confidence <= 1.0 or not 0.0 <= min_margin <= 1.0:
+            raise ModelLoadError("min_confidence and min_margin must be between 0.0 and 1.0")
+
+        self.model_id = model_id
+        self.version = version
+        self.stages = list(stages)
+        self.labels = list(self.stages[0].labels)
+        self.feature_names = list(
+            dict.fromkeys(name for stage in self.stages for name in stage.feature_names)
+        )
+        self.min_confidence = float(min_confidence)
+        self.min_margin = float(min_margin)
+
+        # Per stage: columns of its features in feature_names, and its label order
+        positions = {name: i for i, name in enumerate(self.feature_names)}
+        self._columns = [
+            np.array([positions[name] for name in stage.feature_names]) for stage in self.stages
+        ]
+        self._label_order = []
+        for stage in self.stages:
+            if sorted(stage.labels) != sorted(self.labels):
+                raise ModelIncompatibleError(len(self.labels), len(stage.labels))
+            self._label_order.append(np.array([stage.labels.index(label) for label in self.labels]))
+
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def _prepare(self, features: np.ndarray) -> np.ndarray:
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != len(self.feature_names):
+            actual = features.shape[-1] if features.ndim else 0
+            raise ModelIncompatibleError(len(self.feature_names), actual)
+        return features
+
+    def _confident(self, probabilities: np.ndarray) -> np.ndarray:
+        """Mask of rows whose top-1 probability and top-2 margin pass the gate."""
+        top = np.partition(probabilities, -2, axis=1)
+        return (top[:, -1] >= self.min_confidence) & (top[:, -1] - top[:, -2] >= self.min_margin)
+
+    def predict_stages(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Predict class probabilities and the answering stage for many rows.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+
+        Returns:
+            Tuple of (N x C probabilities ordered as labels, N stage indices)
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+        """
+        features = self._prepare(features)
+        probabilities = np.empty((features.shape[0], len(self.labels)))
+        answered_by = np.zeros(features.shape[0], dtype=np.int64)
+        evaluated = [0] * len(self.stages)
+        answered = [0] * len(self.stages)
+        seconds = [0.0] * len(self.stages)
+
+        pending = np.arange(features.shape[0])
+        last = len(self.stages) - 1
+        for k, stage in enumerate(self.stages):
+            if pending.size == 0:
+                break
+            rows = features[np.ix_(pending, self._columns[k])]
+            start = time.perf_counter()
+            stage_probabilities = stage.predict_batch(rows)[:, self._label_order[k]]
+            seconds[k] = time.perf_counter() - start
+
+            done = (
+                np.ones(pending.size, dtype=bool)
+                if k == last
+                else self._confident(stage_probabilities)
+            )
+            probabilities[pending[done]] = stage_probabilities[done]
+            answered_by[pending[done]] = k
+            evaluated[k] = int(pending.size)
+            answered[k] = int(np.count_nonzero(done))
+            pending = pending[~done]
+
+        with self._stats_lock:
+            self._stats["predictions"] += int(features.shape[0])
+            for k in range(len(self.stages)):
+                self._evaluated[k] += evaluated[k]
+                self._answered[k] += answered[k]
+                self._seconds[k] += seconds[k]
+        return probabilities, answered_by
+
+    def predict_batch(self, features: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predict class probabilities for many rows.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+            out: Optional N x C float64 buffer to write probabilities into
+
+        Returns:
+            N x C probabilities ordered as labels (out, if given)
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+            BadInputError: If out has the wrong shape or dtype
+        """
+        probabilities, _ = self.predict_stages(features)
+        if out is None:
+            return probabilities
+        if out.shape != probabilities.shape or out.dtype != np.float64:
+            raise BadInputError(f"out must have shape {probabilities.shape} and dtype float64")
+        out[...] = probabilities
+        return out
+
+    def predict_vector(self, features: np.ndarray) -> np.ndarray:
+        """Predict class probabilities for one raw feature vector.
+
+        Args:
+            features: Feature values ordered as feature_names
+
+        Returns:
+            Probabilities ordered as labels
+        """
+        return self.predict_stages(np.asarray(features)[np.newaxis, :])[0][0]
+
+    def predict_with_metadata(
+        self, features: Dict[str, float]
+    ) -> Tuple[Dict[str, float], Dict[str, Any]]:
+        """Predict emotion probabilities and describe the stage that answered.
+
+        EmotionEngine uses this instead of predict/get_metadata, so results
+        carry ``"stage"`` (index) and ``"stage_id"`` in their model metadata.
+
+        Args:
+            features: Dictionary of feature values
+
+        Returns:
+            Tuple of (dictionary of emotion probabilities, model metadata)
+
+        Raises:
+            BadInputError: If features are invalid or missing
+        """
+        if not FeatureExtractor.validate_features(features, self.feature_names):
+            raise BadInputError("Invalid features: missing required features or NaN values")
+
+        vector = np.array([[features[name] for name in self.feature_names]])
+        probabilities, answered_by = self.predict_stages(vector)
+        stage = int(answered_by[0])
+
+        metadata = self.get_metadata()
+        metadata["stage"] = stage
+        metadata["stage_id"] = self.stages[stage].model_id
+        return dict(zip(self.labels, probabilities[0].tolist())), metadata
+
+    def predict(self, features: Dict[str, float]) -> Dict[str, float]:
+        """Predict emotion probabilities from features.
+
+        Args:
+            features: Dictionary of feature values
+
+        Returns:
+            Dictionary of emotion probabilities
+
+        Raises:
+            BadInputError: If features are invalid or missing
+        """
+        return self.predict_with_metadata(features)[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get escalation and latency counters.
+
+        Latency is measured per stage call and divided over the rows of the
+        call. The latency saved by a row answered early is the mean per-row
+        latency of the stages it skipped.
+
+        Returns:
+            Dictionary with predictions, per-stage answered counts, escalation_rate
+            (fraction of rows passed beyond the first stage), per-stage mean
+            row latency, avg_latency_ms and avg_latency_saved_ms
+        """
+        with self._stats_lock:
+            predictions = self._stats["predictions"]
+            evaluated = list(self._evaluated)
+            answered = list(self._answered)
+            seconds = list(self._seconds)
+
+        stage_ms = [1e3 * s / n if n else 0.0 for s, n in zip(seconds, evaluated)]
+        saved_ms = sum(count * sum(stage_ms[k + 1 :]) for k, count in enumerate(answered))
+        return {
+            "predictions": predictions,
+            "answered": answered,
+            "escalation_rate": evaluated[1] / predictions if predictions else 0.0,
+            "stage_latency_ms": stage_ms,
+            "avg_latency_ms": 1e3 * sum(seconds) / predictions if predictions else 0.0,
+            "avg_latency_saved_ms": saved_ms / predictions if predictions else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the counters reported by stats()."""
+        with self._stats_lock:
+            self._stats = {"predictions": 0}
+            self._evaluated = [0] * len(self.stages)
+            self._answered = [0] * len(self.stages)
+            self._seconds = [0.0] * len(self.stages)
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get model metadata.
+
+        Returns:
+            Dictionary of model metadata
+        """
+        return {
+            "id": self.model_id,
+            "version": self.version,
+            "type": self.FORMAT,
+            "labels": self.labels,
+            "feature_names": self.feature_names,
+            "num_classes": len(self.labels),
+            "num_features": len(self.feature_names),
+            "stages": [stage.model_id for stage in self.stages],
+            "min_confidence": self.min_confidence,
+            "min_margin": self.min_margin,
+        }
+
+    def astype(self, dtype: str) -> "CascadeModel":
+        """Return a cascade whose stages compute in the given dtype where supported.
+
+        Args:
+            dtype: Target dtype ("float64" or "float32")
+
+        Returns:
+            This model if no stage changes, otherwise a new cascade
+        """
+        stages = [
+            stage.astype(dtype) if hasattr(stage, "astype") else stage for stage in self.stages
+        ]
+        if all(new is old for new, old in zip(stages, self.stages)):
+            return self
+        return CascadeModel(
+            self.model_id, stages, self.min_confidence, self.min_margin, self.version
+        )
+
+    def validate(self) -> bool:
+        """Validate every stage.
+
+        Returns:
+            True if all stages are valid
+        """
+        return all(stage.validate() for stage in self.stages if hasattr(stage, "validate"))
+
+    def freeze(self) -> "CascadeModel":
+        """Freeze every stage so the cascade can be shared safely.
+
+        Returns:
+            This model
+        """
+        for stage in self.stages:
+            if hasattr(stage, "freeze"):
+                stage.freeze()
+        return self
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Save a JSON descriptor referencing the stages by model id.
+
+        The descriptor carries ``"format": "cascade"`` for ModelRegistry.
+        Stages are not written; they are resolved by id when loading.
+
+        Args:
+            path: Path of the JSON descriptor to write
+
+        Returns:
+            Path of the written descriptor
+        """
+        path = Path(path)
+        descriptor = {
+            "model_id": self.model_id,
+            "version": self.version,
+            "format": self.FORMAT,
+            "stages": [stage.model_id for stage in self.stages],
+            "min_confidence": self.min_confidence,
+            "min_margin": self.min_margin,
+        }
+        with open(path, "w") as f:
+            json.dump(descriptor, f, indent=2)
+        return path
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        path: Union[str, Path],
+        dtype: str = "float64",
+        registry: Optional[ModelRegistry] = None,
+    ) -> "CascadeModel":
+        """Create a cascade from a parsed descriptor, loading its stages by id.
+
+        Args:
+            data: Parsed JSON descriptor
+            path: Path of the descriptor
+            dtype: Floating point dtype for the stages
+            registry: Registry to load stages from (default: the descriptor's
+                directory plus packaged models)
+
+        Returns:
+            CascadeModel instance
+
+        Raises:
+            ModelLoadError: If the descriptor is invalid or a stage cannot be loaded
+        """
+        registry = registry or ModelRegistry(search_paths=[Path(path).parent])
+        try:
+            model_id = str(data["model_id"])
+            stage_ids: List[str] = list(data["stages"])
+            if model_id in stage_ids:
+                raise ValueError(f"cascade '{model_id}' lists itself as a stage")
+            return cls(
+                model_id=model_id,
+                stages=[registry.load(stage_id, dtype=dtype) for stage_id in stage_ids],
+                min_confidence=float(data.get("min_confidence", 0.8)),
+                min_margin=float(data.get("min_margin", 0.0)),
+                version=str(data.get("version", "1.0")),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ModelLoadError(f"invalid cascade descriptor {path}: {e}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path], dtype: str = "float64") -> "CascadeModel":
+        """Load a cascade saved with save().
+
+        Args:
+            path: Path of the JSON descriptor
+            dtype: Floating point dtype for the stages
+
+        Returns:
+            CascadeModel instance
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ModelLoadError(f"cannot read {path}: {e}")
+        return cls.from_dict(data, path, dtype)
+
+
+register_format(
+    CascadeModel.FORMAT, lambda data, path, dtype: CascadeModel.from_dict(data, path, dtype)
+)
@@ -15,6 +15,8 @@ class EmotionConfig:
         return_all_probas: Whether to return all label probabilities (default: True)
         hr_baseline: Optional HR baseline for personalization
         priors: Optional label priors for calibration
+        dtype: Floating point dtype for window buffers, features and model
+            weights, "float64" or "float32" (default: float64)
     """
 
     model_id: str = "svm_linear_wrist_sdnn_v1_0"
@@ -24,6 +26,7 @@ class EmotionConfig:
     return_all_probas: bool = True
     hr_baseline: Optional[float] = None
     priors: Optional[Dict[str, float]] = None
+    dtype: str = "float64"
 
     def __str__(self) -> str:
         return (
@@ -2,13 +2,22 @@
 import threading
 from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, Callable, Deque, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
 
+import numpy as np
+
+from .cache import FeatureCache
 from .config import EmotionConfig
-from .error import ModelIncompatibleError
-from .features import FeatureExtractor
+from .error import ModelIncompatibleError, ModelLoadError
+from .features import DEFAULT_FEATURE_REGISTRY, FeatureExtractor, resolve_dtype
 from .models import LinearSvmModel
+from .registry import default_registry
 from .result import EmotionResult
+from .shadow import ShadowEvaluator
+
+# Synthetic resting window (~70 BPM) used to warm up models before a swap
+_WARMUP_HR_VALUES = [70.0, 71.0, 69.0, 70.0]
+_WARMUP_RR_INTERVALS_MS = [857.0, 845.0, 870.0, 862.0, 850.0, 866.0, 855.0, 848.0]
 
 
 class DataPoint:
@@ -18,7 +27,7 @@ class DataPoint:
         self,
         timestamp: datetime,
         hr: float,
-        rr_intervals_ms: List[float],
+        rr_intervals_ms: np.ndarray,
         motion: Optional[Dict[str, float]] = None,
     ):
         self.timestamp = timestamp
@@ -41,6 +50,8 @@ class EmotionEngine:
         config: EmotionConfig,
         model: LinearSvmModel,
         on_log: Optional[Callable[[str, str, Optional[Dict[str, Any]]], None]] = None,
+        feature_cache: Optional[FeatureCache] = None,
+        shadow: Optional[ShadowEvaluator] = None,
     ):
         """Initialize emotion engine.
 
@@ -48,10 +59,20 @@ class EmotionEngine:
             config: Engine configuration
             model: Linear SVM model for inference
             on_log: Optional logging callback (level, message, context)
+            feature_cache: Optional cache shared across engines and reruns
+            shadow: Optional shadow models evaluated on the same window features
+
+        Raises:
+            BadInputError: If config.dtype is not supported
         """
         self.config = config
         self.model = model
         self.on_log = on_log
+        self.feature_cache = feature_cache
+        self.shadow = shadow
+
+        # Floating point dtype for buffered RR intervals and features
+        self._dtype = resolve_dtype(config.dtype)
 
         # Ring buffer for sliding window
         self._buffer: Deque[DataPoint] = deque()
@@ -68,37 +89,152 @@ class EmotionEngine:
         config: EmotionConfig,
         model: Optional[LinearSvmModel] = None,
         on_log: Optional[Callable[[str, str, Optional[Dict[str, Any]]], None]] = None,
+        feature_cache: Optional[FeatureCache] = None,
+        shadow: Optional[ShadowEvaluator] = None,
     ) -> "EmotionEngine":
         """Create engine from pretrained model.
 
         Args:
             config: Engine configuration
-            model: Optional custom model (defaults to WESAD model)
+            model: Optional custom model (defaults to config.model_id from the
+                default model registry)
             on_log: Optional logging callback
+            feature_cache: Optional feature cache
+            shadow: Optional shadow models evaluated on the same window features
 
         Returns:
             EmotionEngine instance
 
         Raises:
             ModelIncompatibleError: If model is incompatible
+            ModelLoadError: If config.model_id cannot be loaded
         """
-        svm_model = model or LinearSvmModel.create_default()
-
-        # Validate model compatibility
-        has_required_features = (
-            len(svm_model.feature_names) == cls.EXPECTED_FEATURE_COUNT
-            and "hr_mean" in svm_model.feature_names
-            and "sdnn" in svm_model.feature_names
-            and "rmssd" in svm_model.feature_names
+        svm_model = model or default_registry().load(config.model_id, dtype=config.dtype)
+        svm_model = cls._prepare_model(config, svm_model)
+
+        return cls(
+            config=config,
+            model=svm_model,
+            on_log=on_log,
+            feature_cache=feature_cache,
+            shadow=shadow,
         )
 
+    @classmethod
+    def _prepare_model(cls, config: EmotionConfig, model: Any) -> Any:
+        """Convert a model to the configured dtype and check its inputs.
+
+        Raises:
+            ModelIncompatibleError: If the model needs unregistered features
+        """
+        if hasattr(model, "astype"):
+            model = model.astype(config.dtype)
+
+        # Validate model compatibility: every model input must be a registered feature
+        registered = DEFAULT_FEATURE_REGISTRY.feature_names
+        supported = [name for name in model.feature_names if name in registered]
+        has_required_features = bool(supported) and len(supported) == len(model.feature_names)
+
         if not has_required_features:
             raise ModelIncompatibleError(
-                cls.EXPECTED_FEATURE_COUNT,
-                len(svm_model.feature_names),
+                len(supported),
+                len(model.feature_names),
             )
 
-        return cls(config=config, model=svm_model, on_log=on_log)
+        return model
+
+    @staticmethod
+    def _warm_up(model: Any) -> None:
+        """Validate a model and run one prediction on a synthetic resting window.
+
+        Raises:
+            ModelLoadError: If validation or the warm-up prediction fails
+        """
+        if hasattr(model, "validate") and not model.validate():
+            raise ModelLoadError(f"model '{model.model_id}' failed validation")
+
+        features = DEFAULT_FEATURE_REGISTRY.plan(model.feature_names).evaluate(
+            _WARMUP_HR_VALUES, _WARMUP_RR_INTERVALS_MS
+        )
+        try:
+            probabilities = model.predict(features)
+        except Exception as e:
+            raise ModelLoadError(f"warm-up prediction failed for '{model.model_id}': {e}")
+        if set(probabilities) != set(model.labels):
+            raise ModelLoadError(f"warm-up prediction of '{model.model_id}' returned wrong labels")
+
+    def swap_model(self, model: Any, warm_up: bool = True) -> Any:
+        """Replace the model of this running engine without touching its window.
+
+        The new model is converted, validated and warmed up before the swap.
+        Only the reference assignment happens under the engine lock, so pushes
+        are not paused and an emission already in progress finishes on the
+        old model. Results carry the id and version of the model that
+        produced them.
+
+        Args:
+            model: New model
+            warm_up: Whether to validate and run a warm-up prediction first
+
+        Returns:
+            The previous model
+
+        Raises:
+            ModelIncompatibleError: If the model needs unregistered features
+            ModelLoadError: If validation or warm-up fails
+        """
+        return self.swap_models([self], model, warm_up=warm_up)[0]
+
+    @classmethod
+    def swap_models(
+        cls, engines: List["EmotionEngine"], model: Any, warm_up: bool = True
+    ) -> List[Any]:
+        """Atomically replace the model of several running engines.
+
+        The model is prepared and warmed up once per distinct config dtype.
+        All engine locks are then taken together, so no engine emits on the
+        new model before every engine has switched.
+
+        Args:
+            engines: Engines to update
+            model: New model
+            warm_up: Whether to validate and run a warm-up prediction first
+
+        Returns:
+            Previous model of each engine, in the order given
+
+        Raises:
+            ModelIncompatibleError: If the model needs unregistered features
+            ModelLoadError: If validation or warm-up fails (no engine is changed)
+        """
+        prepared: Dict[str, Any] = {}
+        for engine in engines:
+            dtype = engine.config.dtype
+            if dtype not in prepared:
+                prepared[dtype] = cls._prepare_model(engine.config, model)
+                if warm_up:
+                    cls._warm_up(prepared[dtype])
+
+        # Lock in a fixed order so concurrent swaps cannot deadlock
+        ordered = sorted(set(engines), key=id)
+        for engine in ordered:
+            engine._lock.acquire()
+        try:
+            previous = [engine.model for engine in engines]
+            for engine in engines:
+                engine.model = prepared[engine.config.dtype]
+        finally:
+            for engine in reversed(ordered):
+                engine._lock.release()
+
+        for engine, old in zip(engines, previous):
+            new = engine.model
+            engine._log(
+                "info",
+                f"Swapped model {old.model_id} -> {new.model_id}",
+                {"old_version": old.version, "new_version": new.version},
+            )
+        return previous
 
     def push(
         self,
@@ -134,7 +270,7 @@ class EmotionEngine:
                 data_point = DataPoint(
                     timestamp=timestamp,
                     hr=hr,
-                    rr_intervals_ms=list(rr_intervals_ms),
+                    rr_intervals_ms=np.array(rr_intervals_ms, dtype=self._dtype),
                     motion=motion,
                 )
 
@@ -169,25 +305,45 @@ class EmotionEngine:
                 if len(self._buffer) < 2:
                     return results  # Not enough data
 
-                # Extract features from current window
-                features = self._extract_window_features()
+                # Pin the model so the whole emission uses one model even across a swap
+                model = self.model
+                shadow = self.shadow
+
+                # Extract features from current window (once for primary and shadow models)
+                shadow_names = shadow.feature_names if shadow is not None else []
+                features = self._extract_window_features(model, shadow_names)
                 if features is None:
                     return results  # Feature extraction failed
 
-                # Run inference
-                probabilities = self.model.predict(features)
+                primary_features = features
+                if shadow is not None:
+                    shadow_only = set(shadow_names) - set(model.feature_names)
+                    primary_features = {
+                        name: value for name, value in features.items() if name not in shadow_only
+                    }
+
+                # Run inference (cascades also report which stage answered)
+                if hasattr(model, "predict_with_metadata"):
+                    probabilities, metadata = model.predict_with_metadata(primary_features)
+                else:
+                    probabilities = model.predict(primary_features)
+                    metadata = model.get_metadata()
 
                 # Create result
                 result = EmotionResult.from_inference(
                     timestamp=now,
                     probabilities=probabilities,
-                    features=features,
-                    model=self.model.get_metadata(),
+                    features=primary_features,
+                    model=metadata,
                 )
 
                 results.append(result)
                 self._last_emission = now
 
+                # Hand off to shadow models without waiting for them
+                if shadow is not None:
+                    shadow.submit(now, features, result)
+
                 self._log(
                     "info",
                     f"Emitted result: {result.emotion} ({result.confidence * 100:.1f}%)",
@@ -198,29 +354,38 @@ class EmotionEngine:
 
         return results
 
-    def _extract_window_features(self) -> Optional[Dict[str, float]]:
+    def _extract_window_features(
+        self, model: Any = None, extra_feature_names: Sequence[str] = ()
+    ) -> Optional[Dict[str, float]]:
         """Extract features from current window.
 
+        Args:
+            model: Model whose features to extract (default: the engine's model)
+            extra_feature_names: Additional registered features to extract
+
         Returns:
             Dictionary of features or None if extraction failed
         """
         if not self._buffer:
             return None
+        model = model or self.model
 
         # Collect all HR values and RR intervals in window
         hr_values = []
-        all_rr_intervals = []
+        rr_chunks = []
         motion_aggregate: Dict[str, float] = {}
 
         for point in self._buffer:
             hr_values.append(point.hr)
-            all_rr_intervals.extend(point.rr_intervals_ms)
+            rr_chunks.append(point.rr_intervals_ms)
 
             # Aggregate motion data
             if point.motion:
                 for key, value in point.motion.items():
                     motion_aggregate[key] = motion_aggregate.get(key, 0.0) + value
 
+        all_rr_intervals = np.concatenate(rr_chunks)
+
         # Check minimum RR count
         if len(all_rr_intervals) < self.config.min_rr_count:
             self._log(
@@ -229,15 +394,24 @@ class EmotionEngine:
             )
             return None
 
-        # Extract features
-        features = FeatureExtractor.extract_features(
+        # Extract only the registered features the model (and any shadows) consume
+        registered = DEFAULT_FEATURE_REGISTRY.feature_names
+        names = dict.fromkeys(list(model.feature_names) + list(extra_feature_names))
+        extract = (
+            self.feature_cache.extract_features
+            if self.feature_cache is not None
+            else FeatureExtractor.extract_features
+        )
+        features = extract(
             hr_values=hr_values,
             rr_intervals_ms=all_rr_intervals,
             motion=motion_aggregate if motion_aggregate else None,
+            feature_names=[name for name in names if name in registered],
+            dtype=self.config.dtype,
         )
 
         # Apply personalization if configured
-        if self.config.hr_baseline is not None:
+        if self.config.hr_baseline is not None and "hr_mean" in features:
             features["hr_mean"] -= self.config.hr_baseline
 
         return features
@@ -46,3 +46,10 @@ class FeatureExtractionError(EmotionError):
 
     def __init__(self, reason: str):
         super().__init__(f"Feature extraction failed: {reason}")
+
+
+class ModelLoadError(EmotionError):
+    """Model could not be found, parsed or validated."""
+
+    def __init__(self, reason: str, context: Optional[Dict[str, Any]] = None):
+        super().__init__(f"Model load failed: {reason}", context)
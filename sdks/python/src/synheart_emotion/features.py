@@ -1,8 +1,10 @@
 """Feature extraction utilities for emotion inference."""
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+from .error import BadInputError, FeatureExtractionError
+
 
 class FeatureExtractor:
     """Feature extraction utilities for emotion inference.
@@ -91,22 +93,29 @@ class FeatureExtractor:
         hr_values: List[float],
         rr_intervals_ms: List[float],
         motion: Optional[Dict[str, float]] = None,
+        feature_names: Optional[Sequence[str]] = None,
+        dtype: Optional[str] = None,
     ) -> Dict[str, float]:
         """Extract all features for emotion inference.
 
+        Features are evaluated through the default feature registry, so
+        intermediates such as the cleaned RR series are computed once per call.
+
         Args:
             hr_values: List of heart rate values in BPM
             rr_intervals_ms: List of RR intervals in milliseconds
             motion: Optional motion data as key-value pairs
+            feature_names: Features to compute (default: hr_mean, sdnn, rmssd)
+            dtype: Compute dtype, "float32" or "float64" (default: keep input
+                arrays' dtype, float64 for lists)
 
         Returns:
             Dictionary of extracted features
         """
-        features = {
-            "hr_mean": FeatureExtractor.extract_hr_mean(hr_values),
-            "sdnn": FeatureExtractor.extract_sdnn(rr_intervals_ms),
-            "rmssd": FeatureExtractor.extract_rmssd(rr_intervals_ms),
-        }
+        if feature_names is None:
+            feature_names = DEFAULT_FEATURE_NAMES
+        plan = DEFAULT_FEATURE_REGISTRY.plan(feature_names)
+        features = plan.evaluate(hr_values, rr_intervals_ms, dtype=dtype)
 
         # Add motion features if provided
         if motion:
@@ -114,6 +123,137 @@ class FeatureExtractor:
 
         return features
 
+    @staticmethod
+    def extract_features_batch(
+        rr_values: np.ndarray,
+        rr_offsets: np.ndarray,
+        hr_values: Optional[np.ndarray] = None,
+        hr_offsets: Optional[np.ndarray] = None,
+        feature_names: Optional[Sequence[str]] = None,
+    ) -> np.ndarray:
+        """Extract features for many windows given as CSR-style ragged arrays.
+
+        Window ``i`` owns ``rr_values[rr_offsets[i]:rr_offsets[i + 1]]`` (and
+        likewise for HR). All reductions are segment reductions over the flat
+        arrays; the only Python loop is the RR cleaning scan, which steps over
+        positions within a window (bounded by the longest window), not over
+        windows.
+
+        Args:
+            rr_values: Flat array of RR intervals in milliseconds
+            rr_offsets: Window offsets into rr_values (length N + 1)
+            hr_values: Optional flat array of HR values in BPM
+            hr_offsets: Offsets into hr_values (length N + 1, required with hr_values)
+            feature_names: Columns to compute, from BATCH_FEATURE_NAMES
+                (default: hr_mean, sdnn, rmssd)
+
+        Returns:
+            N x F feature matrix with columns in feature_names order
+
+        Raises:
+            BadInputError: If offsets are malformed
+            FeatureExtractionError: If a feature has no batch kernel
+        """
+        if feature_names is None:
+            feature_names = DEFAULT_FEATURE_NAMES
+        for name in feature_names:
+            if name not in BATCH_FEATURE_NAMES:
+                raise FeatureExtractionError(f"no batch kernel for feature '{name}'")
+
+        rr = np.asarray(rr_values, dtype=float)
+        offsets = _validate_offsets(rr_offsets, rr.size, "rr_offsets")
+        n_windows = offsets.size - 1
+
+        columns: Dict[str, np.ndarray] = {}
+
+        if "hr_mean" in feature_names:
+            hr_mean = np.zeros(n_windows)
+            if hr_values is not None:
+                if hr_offsets is None:
+                    raise BadInputError("hr_offsets is required with hr_values")
+                hr = np.asarray(hr_values, dtype=float)
+                hr_offs = _validate_offsets(hr_offsets, hr.size, "hr_offsets")
+                if hr_offs.size != offsets.size:
+                    raise BadInputError(
+                        "hr_offsets and rr_offsets describe different window counts"
+                    )
+                hr_counts = np.diff(hr_offs)
+                hr_sums = _segment_sum(hr, hr_offs)
+                np.divide(hr_sums, hr_counts, out=hr_mean, where=hr_counts > 0)
+            columns["hr_mean"] = hr_mean
+
+        if "sdnn" in feature_names or "rmssd" in feature_names:
+            keep = FeatureExtractor._clean_rr_mask_batch(rr, offsets)
+            cleaned = rr[keep]
+            clean_offsets = np.concatenate(([0], np.cumsum(keep)))[offsets]
+            counts = np.diff(clean_offsets)
+            enough = counts >= 2
+
+            if "sdnn" in feature_names:
+                means = np.zeros(n_windows)
+                np.divide(_segment_sum(cleaned, clean_offsets), counts, out=means, where=counts > 0)
+                deviations = cleaned - np.repeat(means, counts)
+                sq_dev_sums = _segment_sum(deviations**2, clean_offsets)
+                sdnn = np.zeros(n_windows)
+                np.divide(sq_dev_sums, counts - 1, out=sdnn, where=enough)
+                columns["sdnn"] = np.sqrt(sdnn)
+
+            if "rmssd" in feature_names:
+                # Successive differences that cross a window boundary are zeroed;
+                # the trailing pad keeps diffs aligned with their left element.
+                window_ids = np.repeat(np.arange(n_windows), counts)
+                sq_diffs = np.zeros(cleaned.size)
+                if cleaned.size > 1:
+                    same_window = window_ids[1:] == window_ids[:-1]
+                    sq_diffs[:-1] = np.where(same_window, np.diff(cleaned) ** 2, 0.0)
+                rmssd = np.zeros(n_windows)
+                np.divide(
+                    _segment_sum(sq_diffs, clean_offsets), counts - 1, out=rmssd, where=enough
+                )
+                columns["rmssd"] = np.sqrt(rmssd)
+
+        if not feature_names:
+            return np.zeros((n_windows, 0))
+        return np.column_stack([columns[name] for name in feature_names])
+
+    @staticmethod
+    def _clean_rr_mask_batch(rr: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """Vectorized equivalent of _clean_rr_intervals over ragged windows.
+
+        The jump guard compares against the previously kept interval, which is
+        inherently sequential; the scan therefore walks positions within a
+        window while processing every window at once.
+
+        Args:
+            rr: Flat array of RR intervals in milliseconds
+            offsets: Window offsets into rr (length N + 1)
+
+        Returns:
+            Boolean mask over rr marking intervals that survive cleaning
+        """
+        in_range = (rr >= FeatureExtractor.MIN_VALID_RR_MS) & (
+            rr <= FeatureExtractor.MAX_VALID_RR_MS
+        )
+        keep = np.zeros(rr.size, dtype=bool)
+
+        starts = offsets[:-1]
+        lengths = np.diff(offsets)
+        max_length = int(lengths.max()) if lengths.size else 0
+
+        prev = np.full(starts.size, np.nan)
+        for position in range(max_length):
+            active = np.nonzero(lengths > position)[0]
+            index = starts[active] + position
+            value = rr[index]
+            last = prev[active]
+            ok = in_range[index] & (
+                np.isnan(last) | (np.abs(value - last) <= FeatureExtractor.MAX_RR_JUMP_MS)
+            )
+            keep[index] = ok
+            prev[active] = np.where(ok, value, last)
+
+        return keep
+
     @staticmethod
     def _clean_rr_intervals(rr_intervals_ms: List[float]) -> List[float]:
         """Clean RR intervals by removing invalid values and artifacts.
@@ -148,6 +288,125 @@ class FeatureExtractor:
 
         return cleaned
 
+    @staticmethod
+    def clean_rr_mask(rr_intervals_ms: Sequence[float]) -> np.ndarray:
+        """Boolean mask of intervals kept by _clean_rr_intervals.
+
+        Args:
+            rr_intervals_ms: RR intervals in milliseconds
+
+        Returns:
+            Mask with True for every interval that survives cleaning
+        """
+        rr = _float_array(rr_intervals_ms)
+        mask = np.zeros(rr.size, dtype=bool)
+        prev_value = None
+
+        for i, value in enumerate(rr.tolist()):
+            if value < FeatureExtractor.MIN_VALID_RR_MS or value > FeatureExtractor.MAX_VALID_RR_MS:
+                continue
+            if prev_value is not None and abs(value - prev_value) > FeatureExtractor.MAX_RR_JUMP_MS:
+                continue
+            mask[i] = True
+            prev_value = value
+
+        return mask
+
+    @staticmethod
+    def sliding_window_features(
+        rr_intervals_ms: Sequence[float],
+        window_seconds: float = 60.0,
+        step_seconds: float = 1.0,
+        clean_mask: Optional[np.ndarray] = None,
+        beat_times_ms: Optional[np.ndarray] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Compute mean RR, SDNN and RMSSD for every window of a recording.
+
+        Uses prefix sums of RR, RR^2 and squared successive differences over
+        the cleaned series, so all windows cost O(N) in total instead of one
+        extract_features call per window.
+
+        Cleaning follows _clean_rr_intervals rules, applied once over the
+        whole recording (see clean_rr_mask). This matches per-window cleaning
+        except right after an artifact at a window's left edge, where the
+        jump guard compares against a beat outside the window. Pass
+        clean_mask to supply a different (e.g. precomputed) mask.
+
+        Args:
+            rr_intervals_ms: RR intervals in milliseconds for the full recording
+            window_seconds: Window length (default: 60s)
+            step_seconds: Hop between window starts (default: 1s)
+            clean_mask: Optional mask of intervals to keep (default: clean_rr_mask)
+            beat_times_ms: Optional beat timestamps in ms (default: cumulative RR)
+
+        Returns:
+            Dictionary of arrays with one entry per window: start_ms,
+            count (clean intervals), mean_rr, sdnn and rmssd. Statistics are
+            0.0 for windows with fewer than two clean intervals.
+
+        Raises:
+            BadInputError: If array lengths or window parameters are invalid
+        """
+        rr = np.asarray(rr_intervals_ms, dtype=np.float64)
+        if window_seconds <= 0 or step_seconds <= 0:
+            raise BadInputError("window_seconds and step_seconds must be positive")
+
+        if clean_mask is None:
+            clean_mask = FeatureExtractor.clean_rr_mask(rr)
+        clean_mask = np.asarray(clean_mask, dtype=bool)
+        times = np.cumsum(rr) if beat_times_ms is None else np.asarray(beat_times_ms, np.float64)
+        if clean_mask.shape != rr.shape or times.shape != rr.shape:
+            raise BadInputError("clean_mask and beat_times_ms must match rr_intervals_ms")
+
+        window_ms = window_seconds * 1000.0
+        step_ms = step_seconds * 1000.0
+        duration = float(times[-1]) if times.size else 0.0
+        n_windows = (
+            int(np.floor((duration - window_ms) / step_ms)) + 1 if duration >= window_ms else 0
+        )
+        starts = np.arange(n_windows) * step_ms
+
+        kept = rr[clean_mask]
+        kept_times = times[clean_mask]
+        lo = np.searchsorted(kept_times, starts, side="left")
+        hi = np.searchsorted(kept_times, starts + window_ms, side="left")
+        count = hi - lo
+
+        # Center on the global mean so the RR^2 prefix sums stay well conditioned
+        reference = float(kept.mean()) if kept.size else 0.0
+        centered = kept - reference
+        prefix = np.concatenate(([0.0], np.cumsum(centered)))
+        prefix_sq = np.concatenate(([0.0], np.cumsum(centered**2)))
+        prefix_diff_sq = np.concatenate(([0.0], np.cumsum(np.diff(kept) ** 2)))
+
+        enough = count >= 2
+        sums = prefix[hi] - prefix[lo]
+        sq_sums = prefix_sq[hi] - prefix_sq[lo]
+
+        mean_rr = np.zeros(n_windows)
+        np.divide(sums, count, out=mean_rr, where=count > 0)
+        mean_rr[count > 0] += reference
+
+        # Sample variance: (sum(x^2) - sum(x)^2 / n) / (n - 1)
+        correction = np.zeros(n_windows)
+        np.divide(sums**2, count, out=correction, where=count > 0)
+        variance = np.zeros(n_windows)
+        np.divide(sq_sums - correction, count - 1, out=variance, where=enough)
+
+        # Squared differences of pairs (k, k + 1) with both beats in [lo, hi)
+        pair_hi = np.maximum(hi - 1, lo)
+        diff_sums = prefix_diff_sq[pair_hi] - prefix_diff_sq[lo]
+        mean_sq_diff = np.zeros(n_windows)
+        np.divide(diff_sums, count - 1, out=mean_sq_diff, where=enough)
+
+        return {
+            "start_ms": starts,
+            "count": count,
+            "mean_rr": mean_rr,
+            "sdnn": np.sqrt(np.maximum(variance, 0.0)),
+            "rmssd": np.sqrt(np.maximum(mean_sq_diff, 0.0)),
+        }
+
     @staticmethod
     def validate_features(features: Dict[str, float], required_features: List[str]) -> bool:
         """Validate feature vector for model compatibility.
@@ -200,3 +459,286 @@ class FeatureExtractor:
                 normalized[feature_name] = value
 
         return normalized
+
+
+# Version of the feature definitions; bump when any feature's output changes
+FEATURE_SET_VERSION = "1"
+
+# Floating point dtypes supported for buffers, features and model weights
+SUPPORTED_DTYPES = ("float32", "float64")
+
+# Default feature set used by the bundled models
+DEFAULT_FEATURE_NAMES = ("hr_mean", "sdnn", "rmssd")
+
+# Features with vectorized kernels in FeatureExtractor.extract_features_batch
+BATCH_FEATURE_NAMES = ("hr_mean", "sdnn", "rmssd")
+
+
+def resolve_dtype(dtype: Any) -> np.dtype:
+    """Resolve a compute dtype, accepting only SUPPORTED_DTYPES.
+
+    Args:
+        dtype: dtype name or numpy dtype
+
+    Returns:
+        Resolved numpy dtype
+
+    Raises:
+        BadInputError: If the dtype is not supported
+    """
+    try:
+        resolved = np.dtype(dtype)
+    except TypeError:
+        raise BadInputError(f"unsupported dtype {dtype!r}")
+    if resolved.name not in SUPPORTED_DTYPES:
+        raise BadInputError(f"unsupported dtype {dtype!r} (expected one of {SUPPORTED_DTYPES})")
+    return resolved
+
+
+def _validate_offsets(offsets: np.ndarray, size: int, name: str) -> np.ndarray:
+    """Validate CSR window offsets against the flat array they index."""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets.ndim != 1 or offsets.size == 0:
+        raise BadInputError(f"{name} must be a non-empty 1-D array")
+    if offsets[0] != 0 or offsets[-1] != size:
+        raise BadInputError(f"{name} must start at 0 and end at {size}")
+    if np.any(np.diff(offsets) < 0):
+        raise BadInputError(f"{name} must be non-decreasing")
+    return offsets
+
+
+def _segment_sum(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Sum values within each [offsets[i], offsets[i + 1]) segment.
+
+    Empty segments sum to zero (np.add.reduceat alone would return the next
+    element for them).
+    """
+    counts = np.diff(offsets)
+    out = np.zeros(counts.size, dtype=np.result_type(values, np.float64))
+    nonempty = counts > 0
+    if np.any(nonempty):
+        out[nonempty] = np.add.reduceat(values, offsets[:-1][nonempty])
+    return out
+
+
+class FeaturePlan:
+    """Evaluation plan for a fixed set of features.
+
+    A plan lists every intermediate and feature step in dependency order, so
+    each intermediate is computed exactly once per window and features that
+    were not requested are never computed.
+
+    Attributes:
+        feature_names: Features produced by the plan, in request order
+        steps: Ordered (name, inputs, fn) steps to evaluate
+    """
+
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        steps: List[Tuple[str, Tuple[str, ...], Callable[..., Any]]],
+    ):
+        self.feature_names = list(feature_names)
+        self.steps = steps
+
+    def evaluate(
+        self,
+        hr_values: Sequence[float],
+        rr_intervals_ms: Sequence[float],
+        dtype: Optional[str] = None,
+    ) -> Dict[str, float]:
+        """Evaluate the plan for a single window.
+
+        Args:
+            hr_values: Heart rate values in BPM
+            rr_intervals_ms: RR intervals in milliseconds
+            dtype: Optional compute dtype the sources are cast to
+
+        Returns:
+            Dictionary of requested feature values
+        """
+        if dtype is not None:
+            resolved = resolve_dtype(dtype)
+            hr_values = np.asarray(hr_values, dtype=resolved)
+            rr_intervals_ms = np.asarray(rr_intervals_ms, dtype=resolved)
+
+        values: Dict[str, Any] = {
+            "hr_values": hr_values,
+            "rr_intervals_ms": rr_intervals_ms,
+        }
+        for name, inputs, fn in self.steps:
+            values[name] = fn(*[values[dep] for dep in inputs])
+
+        return {name: float(values[name]) for name in self.feature_names}
+
+    def __repr__(self) -> str:
+        step_names = ", ".join(name for name, _, _ in self.steps)
+        return f"FeaturePlan(features={self.feature_names}, steps=[{step_names}])"
+
+
+class FeatureRegistry:
+    """Registry of features and the shared intermediates they depend on.
+
+    Each entry declares its inputs by name. Inputs are either window sources
+    (``hr_values``, ``rr_intervals_ms``) or other registered intermediates
+    such as ``cleaned_rr``, ``diff_rr`` or ``hr_array``.
+
+    Example:
+        registry.register_feature("mean_rr", ["cleaned_rr"], lambda rr: rr.mean())
+        plan = registry.plan(["sdnn", "mean_rr"])
+        features = plan.evaluate(hr_values, rr_intervals_ms, dtype=dtype)
+    """
+
+    SOURCES = ("hr_values", "rr_intervals_ms")
+
+    def __init__(self) -> None:
+        self._nodes: Dict[str, Tuple[Tuple[str, ...], Callable[..., Any]]] = {}
+        self._features: List[str] = []
+        self._plans: Dict[Tuple[str, ...], FeaturePlan] = {}
+
+    @property
+    def feature_names(self) -> List[str]:
+        """Names of all registered features, in registration order."""
+        return list(self._features)
+
+    def register_intermediate(
+        self, name: str, inputs: Sequence[str], fn: Callable[..., Any]
+    ) -> None:
+        """Register a shared intermediate computed from other inputs.
+
+        Args:
+            name: Intermediate name
+            inputs: Names of sources or intermediates passed to fn, in order
+            fn: Function computing the intermediate value
+        """
+        self._register(name, inputs, fn)
+
+    def register_feature(self, name: str, inputs: Sequence[str], fn: Callable[..., float]) -> None:
+        """Register a feature computed from sources or intermediates.
+
+        Args:
+            name: Feature name as seen by models
+            inputs: Names of sources or intermediates passed to fn, in order
+            fn: Function returning the scalar feature value
+        """
+        self._register(name, inputs, fn)
+        if name not in self._features:
+            self._features.append(name)
+
+    def _register(self, name: str, inputs: Sequence[str], fn: Callable[..., Any]) -> None:
+        if name in self.SOURCES:
+            raise FeatureExtractionError(f"'{name}' is a reserved window source")
+        self._nodes[name] = (tuple(inputs), fn)
+        self._plans.clear()
+
+    def plan(self, feature_names: Optional[Sequence[str]] = None) -> FeaturePlan:
+        """Build (or fetch a cached) evaluation plan for the given features.
+
+        Args:
+            feature_names: Features to compute (default: all registered features)
+
+        Returns:
+            FeaturePlan computing each required intermediate once
+
+        Raises:
+            FeatureExtractionError: If a feature or input is unknown or cyclic
+        """
+        key = tuple(feature_names) if feature_names is not None else tuple(self._features)
+        cached = self._plans.get(key)
+        if cached is not None:
+            return cached
+
+        for name in key:
+            if name not in self._features:
+                raise FeatureExtractionError(f"unknown feature '{name}'")
+
+        steps: List[Tuple[str, Tuple[str, ...], Callable[..., Any]]] = []
+        resolved = set(self.SOURCES)
+        visiting: List[str] = []
+
+        def visit(name: str) -> None:
+            if name in resolved:
+                return
+            if name in visiting:
+                cycle = " -> ".join(visiting + [name])
+                raise FeatureExtractionError(f"dependency cycle: {cycle}")
+            if name not in self._nodes:
+                raise FeatureExtractionError(f"unknown feature input '{name}'")
+
+            visiting.append(name)
+            inputs, fn = self._nodes[name]
+            for dep in inputs:
+                visit(dep)
+            visiting.pop()
+
+            steps.append((name, inputs, fn))
+            resolved.add(name)
+
+        for name in key:
+            visit(name)
+
+        plan = FeaturePlan(key, steps)
+        self._plans[key] = plan
+        return plan
+
+
+def _float_array(values: Sequence[float]) -> np.ndarray:
+    """Convert to a float array, keeping float32/float64 inputs as they are."""
+    array = np.asarray(values)
+    if array.dtype.kind != "f":
+        array = array.astype(float)
+    return array
+
+
+def _hr_array(hr_values: Sequence[float]) -> np.ndarray:
+    return _float_array(hr_values)
+
+
+def _cleaned_rr(rr_intervals_ms: Sequence[float]) -> np.ndarray:
+    rr = _float_array(rr_intervals_ms)
+    return np.asarray(FeatureExtractor._clean_rr_intervals(rr.tolist()), dtype=rr.dtype)
+
+
+def _diff_rr(cleaned_rr: np.ndarray) -> np.ndarray:
+    return np.diff(cleaned_rr)
+
+
+def _hr_mean(hr_array: np.ndarray) -> float:
+    if hr_array.size == 0:
+        return 0.0
+    return float(np.mean(hr_array))
+
+
+def _sdnn(cleaned_rr: np.ndarray) -> float:
+    if cleaned_rr.size < 2:
+        return 0.0
+    return float(np.std(cleaned_rr, ddof=1))
+
+
+def _rmssd(diff_rr: np.ndarray) -> float:
+    if diff_rr.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(diff_rr**2)))
+
+
+def _pnn50(diff_rr: np.ndarray) -> float:
+    if diff_rr.size == 0:
+        return 0.0
+    return float(np.count_nonzero(np.abs(diff_rr) > 50.0) / diff_rr.size * 100.0)
+
+
+def _mean_rr(cleaned_rr: np.ndarray) -> float:
+    if cleaned_rr.size == 0:
+        return 0.0
+    return float(np.mean(cleaned_rr))
+
+
+DEFAULT_FEATURE_REGISTRY = FeatureRegistry()
+DEFAULT_FEATURE_REGISTRY.register_intermediate("hr_array", ["hr_values"], _hr_array)
+DEFAULT_FEATURE_REGISTRY.register_intermediate("cleaned_rr", ["rr_intervals_ms"], _cleaned_rr)
+DEFAULT_FEATURE_REGISTRY.register_intermediate("diff_rr", ["cleaned_rr"], _diff_rr)
+DEFAULT_FEATURE_REGISTRY.register_feature("hr_mean", ["hr_array"], _hr_mean)
+DEFAULT_FEATURE_REGISTRY.register_feature("sdnn", ["cleaned_rr"], _sdnn)
+DEFAULT_FEATURE_REGISTRY.register_feature("rmssd", ["diff_rr"], _rmssd)
+DEFAULT_FEATURE_REGISTRY.register_feature("pnn50", ["diff_rr"], _pnn50)
+DEFAULT_FEATURE_REGISTRY.register_feature("mean_rr", ["cleaned_rr"], _mean_rr)
@@ -0,0 +1,437 @@
+"""Closed-form Gaussian class-conditional models (naive Bayes, QDA) on NumPy."""
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .error import BadInputError, ModelIncompatibleError, ModelLoadError
+from .features import FeatureExtractor
+from .registry import register_format
+
+_LOG_2PI = float(np.log(2.0 * np.pi))
+
+
+class GaussianModel:
+    """Classifier with one Gaussian per class and Bayes-rule posteriors.
+
+    Two covariance structures are supported:
+
+    - ``"diagonal"`` (Gaussian naive Bayes): per-class means and variances.
+      The log-likelihood expands to ``-0.5 * x^2 . (1/v) + x . (mu/v) + c``,
+      so a batch costs two matrix products.
+    - ``"full"`` (QDA): per-class means and either covariance matrices or an
+      eigendecomposition (``rotations`` and ``scalings``, as scikit-learn
+      stores it). At load time each class gets a whitening factor W with
+      W W^T equal to the precision matrix (the inverse Cholesky factor, or
+      R / sqrt(S) for eigendecompositions), plus its log-determinant. Factors
+      are zero-padded to a common rank, so a batch costs one batched matrix
+      product for all classes.
+
+    Converted from scikit-learn (GaussianNB, QuadraticDiscriminantAnalysis)
+    with from_sklearn; scikit-learn is only needed for conversion.
+
+    Attributes:
+        model_id: Model identifier
+        version: Model version
+        labels: Class labels, in output order
+        feature_names: Feature names in order
+        covariance: "diagonal" or "full"
+        means: Per-class means (C x F)
+        priors: Class prior probabilities (C)
+        variances: Per-class variances (C x F), for "diagonal"
+        covariances: Per-class covariance matrices (C x F x F), optional for "full"
+        rotations: Per-class eigenvectors (C x F x R, zero-padded), optional for "full"
+        scalings: Per-class eigenvalues (C x R, padded with 1), optional for "full"
+        whitening: Per-class whitening factors (C x F x R), for "full"
+        log_dets: Per-class covariance log-determinants (C)
+        scaler_mean: Optional standardization mean applied before evaluation
+        scaler_scale: Optional standardization scale applied before evaluation
+    """
+
+    FORMAT = "gaussian"
+
+    # Rows evaluated together (bounds the C x rows x F centered copy for "full")
+    _CHUNK_ROWS = 4096
+
+    def __init__(
+        self,
+        model_id: str,
+        version: str,
+        labels: List[str],
+        feature_names: List[str],
+        means: np.ndarray,
+        priors: Sequence[float],
+        variances: Optional[np.ndarray] = None,
+        covariances: Optional[np.ndarray] = None,
+        rotations: Optional[np.ndarray] = None,
+        scalings: Optional[np.ndarray] = None,
+        scaler_mean: Optional[Sequence[float]] = None,
+        scaler_scale: Optional[Sequence[float]] = None,
+    ):
+        self.model_id = model_id
+        self.version = version
+        self.labels = list(labels)
+        self.feature_names = list(feature_names)
+        self.means = np.asarray(means, dtype=np.float64)
+        self.priors = np.asarray(priors, dtype=np.float64)
+        self.variances = None if variances is None else np.asarray(variances, np.float64)
+        self.covariances = None if covariances is None else np.asarray(covariances, np.float64)
+        self.rotations = None if rotations is None else np.asarray(rotations, np.float64)
+        self.scalings = None if scalings is None else np.asarray(scalings, np.float64)
+        self.scaler_mean = None if scaler_mean is None else np.asarray(scaler_mean, np.float64)
+        self.scaler_scale = None if scaler_scale is None else np.asarray(scaler_scale, np.float64)
+
+        n_classes, n_features = len(self.labels), len(self.feature_names)
+        if self.means.shape != (n_classes, n_features):
+            raise ModelIncompatibleError(n_features, self.means.shape[-1])
+        if self.priors.shape != (n_classes,):
+            raise ModelIncompatibleError(n_classes, self.priors.size)
+        with np.errstate(divide="ignore"):
+            log_priors = np.log(self.priors)
+
+        if self.variances is not None:
+            self.covariance = "diagonal"
+            if self.variances.shape != self.means.shape:
+                raise ModelIncompatibleError(n_features, self.variances.shape[-1])
+            if not np.all(self.variances > 0):
+                raise ModelLoadError("variances must be positive")
+            inverse = 1.0 / self.variances
+            self.log_dets = np.log(self.variances).sum(axis=1)
+            self._quadratic = -0.5 * inverse
+            self._linear = self.means * inverse
+            self._constant = log_priors - 0.5 * (
+                self.log_dets
+                + n_features * _LOG_2PI
+                + np.einsum("cf,cf->c", self.means, self._linear)
+            )
+            self.whitening = None
+            return
+
+        self.covariance = "full"
+        if self.covariances is not None:
+            if self.covariances.shape != (n_classes, n_features, n_features):
+                raise ModelIncompatibleError(n_features, self.covariances.shape[-1])
+            try:
+                cholesky = np.linalg.cholesky(self.covariances)
+            except np.linalg.LinAlgError as e:
+                raise ModelLoadError(f"covariance is not positive definite: {e}")
+            # (x - mu)^T Sigma^-1 (x - mu) = |(x - mu)^T L^-T|^2
+            self.whitening = np.linalg.inv(cholesky).transpose(0, 2, 1)
+            self.log_dets = 2.0 * np.log(np.diagonal(cholesky, axis1=1, axis2=2)).sum(axis=1)
+        elif self.rotations is not None and self.scalings is not None:
+            rank = self.scalings.shape[-1]
+            if self.rotations.shape != (n_classes, n_features, rank):
+                raise ModelIncompatibleError(n_features, self.rotations.shape[1])
+            if self.scalings.shape != (n_classes, rank) or not np.all(self.scalings > 0):
+                raise ModelLoadError("scalings must be positive, one row per class")
+            self.whitening = self.rotations / np.sqrt(self.scalings)[:, np.newaxis, :]
+            self.log_dets = np.log(self.scalings).sum(axis=1)
+        else:
+            raise ModelLoadError("need variances, covariances or rotations and scalings")
+        self._constant = log_priors - 0.5 * (self.log_dets + n_features * _LOG_2PI)
+
+    def _prepare(self, features: np.ndarray) -> np.ndarray:
+        features = np.array(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != len(self.feature_names):
+            actual = features.shape[-1] if features.ndim else 0
+            raise ModelIncompatibleError(len(self.feature_names), actual)
+        if self.scaler_mean is not None:
+            features -= self.scaler_mean
+        if self.scaler_scale is not None:
+            features /= self.scaler_scale
+        return features
+
+    def log_likelihood(self, features: np.ndarray) -> np.ndarray:
+        """Joint log-likelihood log p(x, class) of each row under each class.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+
+        Returns:
+            N x C log-likelihoods ordered as labels
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+        """
+        prepared = self._prepare(features)
+        out = np.empty((prepared.shape[0], len(self.labels)))
+        for start in range(0, prepared.shape[0], self._CHUNK_ROWS):
+            rows = slice(start, start + self._CHUNK_ROWS)
+            out[rows] = self._log_likelihood(prepared[rows])
+        return out
+
+    def _log_likelihood(self, features: np.ndarray) -> np.ndarray:
+        if self.covariance == "diagonal":
+            out = np.square(features) @ self._quadratic.T
+            out += features @ self._linear.T
+        else:
+            # C x N x F centered rows times C x F x R factors in one batched product
+            projected = np.matmul(features[np.newaxis] - self.means[:, np.newaxis], self.whitening)
+            out = np.einsum("cnr,cnr->nc", projected, projected)
+            out *= -0.5
+        out += self._constant
+        return out
+
+    def predict_batch(self, features: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predict class posteriors for many raw feature vectors.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+            out: Optional N x C float64 buffer to write probabilities into
+
+        Returns:
+            N x C probabilities ordered as labels (out, if given)
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+            BadInputError: If out has the wrong shape or dtype
+        """
+        log_likelihood = self.log_likelihood(features)
+        if out is None:
+            out = log_likelihood
+        elif out.shape != log_likelihood.shape or out.dtype != np.float64:
+            raise BadInputError(f"out must have shape {log_likelihood.shape} and dtype float64")
+        else:
+            out[...] = log_likelihood
+
+        out -= out.max(axis=1, keepdims=True)
+        np.exp(out, out=out)
+        out /= out.sum(axis=1, keepdims=True)
+        return out
+
+    def predict_vector(self, features: np.ndarray) -> np.ndarray:
+        """Predict class probabilities for one raw feature vector.
+
+        Args:
+            features: Feature values ordered as feature_names
+
+        Returns:
+            Probabilities ordered as labels
+        """
+        return self.predict_batch(np.asarray(features)[np.newaxis, :])[0]
+
+    def predict(self, features: Dict[str, float]) -> Dict[str, float]:
+        """Predict emotion probabilities from features.
+
+        Args:
+            features: Dictionary of feature values
+
+        Returns:
+            Dictionary of emotion probabilities
+
+        Raises:
+            BadInputError: If features are invalid or missing
+        """
+        if not FeatureExtractor.validate_features(features, self.feature_names):
+            raise BadInputError("Invalid features: missing required features or NaN values")
+
+        vector = np.array([features[name] for name in self.feature_names])
+        return dict(zip(self.labels, self.predict_vector(vector).tolist()))
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get model metadata.
+
+        Returns:
+            Dictionary of model metadata
+        """
+        metadata = {
+            "id": self.model_id,
+            "version": self.version,
+            "type": self.FORMAT,
+            "labels": self.labels,
+            "feature_names": self.feature_names,
+            "num_classes": len(self.labels),
+            "num_features": len(self.feature_names),
+            "covariance": self.covariance,
+        }
+        if self.whitening is not None:
+            metadata["rank"] = int(self.whitening.shape[-1])
+        return metadata
+
+    def validate(self) -> bool:
+        """Validate model integrity.
+
+        Returns:
+            True if model is valid
+        """
+        if np.any(self.priors < 0) or not np.isclose(self.priors.sum(), 1.0):
+            return False
+        arrays = [self.means, self.log_dets]
+        if self.whitening is not None:
+            arrays.append(self.whitening)
+        return all(np.all(np.isfinite(array)) for array in arrays)
+
+    def freeze(self) -> "GaussianModel":
+        """Mark arrays read-only so the model can be shared safely.
+
+        Returns:
+            This model
+        """
+        derived = [self.log_dets, self._constant]
+        if self.covariance == "diagonal":
+            derived += [self._quadratic, self._linear]
+        else:
+            derived.append(self.whitening)
+        for array in (*self._arrays().values(), *derived):
+            array.flags.writeable = False
+        return self
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {"means": self.means, "priors": self.priors}
+        for name in ("variances", "covariances", "rotations", "scalings"):
+            if getattr(self, name) is not None:
+                arrays[name] = getattr(self, name)
+        if self.scaler_mean is not None:
+            arrays["scaler_mean"] = self.scaler_mean
+        if self.scaler_scale is not None:
+            arrays["scaler_scale"] = self.scaler_scale
+        return arrays
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Save as a JSON descriptor plus a sibling ``.npz`` array file.
+
+        Only the source parameters are stored; whitening factors and
+        log-determinants are recomputed at load. The descriptor carries
+        ``"format": "gaussian"`` for ModelRegistry.
+
+        Args:
+            path: Path of the JSON descriptor to write
+
+        Returns:
+            Path of the written descriptor
+        """
+        path = Path(path)
+        arrays_path = path.with_suffix(".npz")
+        np.savez_compressed(arrays_path, **self._arrays())
+
+        descriptor = {
+            "model_id": self.model_id,
+            "version": self.version,
+            "format": self.FORMAT,
+            "feature_order": self.feature_names,
+            "classes": self.labels,
+            "covariance": self.covariance,
+            "arrays": arrays_path.name,
+        }
+        with open(path, "w") as f:
+            json.dump(descriptor, f, indent=2)
+        return path
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], path: Union[str, Path]) -> "GaussianModel":
+        """Create a model from a parsed descriptor and its array file.
+
+        Args:
+            data: Parsed JSON descriptor
+            path: Path of the descriptor (the array file is resolved next to it)
+
+        Returns:
+            GaussianModel instance
+
+        Raises:
+            ModelLoadError: If the descriptor or arrays are missing or invalid
+        """
+        arrays_path = Path(path).parent / data.get("arrays", Path(path).with_suffix(".npz").name)
+        try:
+            with np.load(arrays_path) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+            model = cls(
+                model_id=str(data["model_id"]),
+                version=str(data.get("version", "1.0")),
+                labels=data["classes"],
+                feature_names=data["feature_order"],
+                **arrays,
+            )
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            raise ModelLoadError(f"cannot load Gaussian model from {arrays_path}: {e}")
+
+        if data.get("covariance", model.covariance) != model.covariance:
+            raise ModelLoadError(f"arrays do not match covariance '{data['covariance']}'")
+        if not model.validate():
+            raise ModelLoadError(f"model '{model.model_id}' failed validation")
+        return model
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "GaussianModel":
+        """Load a model saved with save().
+
+        Args:
+            path: Path of the JSON descriptor
+
+        Returns:
+            GaussianModel instance
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ModelLoadError(f"cannot read {path}: {e}")
+        return cls.from_dict(data, path)
+
+    @classmethod
+    def from_sklearn(
+        cls,
+        estimator: Any,
+        model_id: str,
+        feature_names: Optional[List[str]] = None,
+        labels: Optional[List[str]] = None,
+        scaler: Any = None,
+        version: str = "1.0",
+    ) -> "GaussianModel":
+        """Copy the parameters of a fitted GaussianNB or QDA classifier.
+
+        scikit-learn itself is not imported. QDA eigendecompositions of
+        different rank are zero-padded to the largest rank.
+
+        Args:
+            estimator: Fitted GaussianNB or QuadraticDiscriminantAnalysis
+            model_id: Model identifier
+            feature_names: Feature names (default: f0..fN)
+            labels: Class labels (default: str(estimator.classes_))
+            scaler: Optional fitted StandardScaler applied before the estimator
+            version: Model version
+
+        Returns:
+            GaussianModel instance
+
+        Raises:
+            ModelIncompatibleError: If the estimator type is not supported
+        """
+        kind = type(estimator).__name__
+        if kind == "GaussianNB":
+            parameters = {
+                "means": estimator.theta_,
+                "variances": estimator.var_,
+                "priors": estimator.class_prior_,
+            }
+        elif kind == "QuadraticDiscriminantAnalysis":
+            n_features = estimator.means_.shape[1]
+            rank = max(scaling.size for scaling in estimator.scalings_)
+            rotations = np.zeros((len(estimator.classes_), n_features, rank))
+            scalings = np.ones((len(estimator.classes_), rank))
+            for k, (rotation, scaling) in enumerate(zip(estimator.rotations_, estimator.scalings_)):
+                rotations[k, :, : scaling.size] = rotation
+                scalings[k, : scaling.size] = scaling
+            parameters = {
+                "means": estimator.means_,
+                "rotations": rotations,
+                "scalings": scalings,
+                "priors": estimator.priors_,
+            }
+        else:
+            raise ModelIncompatibleError(0, 0) from TypeError(f"unsupported estimator {kind}")
+
+        n_features = int(estimator.n_features_in_)
+        return cls(
+            model_id=model_id,
+            version=version,
+            labels=labels or [str(c) for c in estimator.classes_],
+            feature_names=feature_names or [f"f{i}" for i in range(n_features)],
+            scaler_mean=None if scaler is None else scaler.mean_,
+            scaler_scale=None if scaler is None else scaler.scale_,
+            **parameters,
+        )
+
+
+register_format(GaussianModel.FORMAT, lambda data, path, dtype: GaussianModel.from_dict(data, path))
@@ -1,17 +1,19 @@
 """Linear SVM model and model loading utilities."""
-from typing import Any, Dict, List
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
-from .error import BadInputError, ModelIncompatibleError
-from .features import FeatureExtractor
+from .error import BadInputError, ModelIncompatibleError, ModelLoadError
+from .features import FeatureExtractor, resolve_dtype
 
 
 class LinearSvmModel:
     """Linear SVM model with weights embedded in code.
 
-    This is the embedded model format that stores weights directly in code.
-    For loading models from files, use ModelLoader.
+    Models can be embedded in code (see create_default) or loaded from the
+    ``svm_json`` file format via from_json / ModelRegistry.
 
     Attributes:
         model_id: Model identifier
@@ -22,6 +24,9 @@ class LinearSvmModel:
         biases: SVM bias vector (C classes)
         mu: Feature normalization means
         sigma: Feature normalization standard deviations
+        dtype: Floating point dtype of weights and inference ("float64" or "float32")
+        folded_weights: Weights with normalization folded in (W / sigma)
+        folded_biases: Biases with normalization folded in (b - W . mu / sigma)
     """
 
     def __init__(
@@ -34,24 +39,103 @@ class LinearSvmModel:
         biases: List[float],
         mu: Dict[str, float],
         sigma: Dict[str, float],
+        dtype: str = "float64",
     ):
         # Validate dimensions
         if len(weights) != len(labels):
             raise ModelIncompatibleError(len(labels), len(weights))
         if len(biases) != len(labels):
             raise ModelIncompatibleError(len(labels), len(biases))
-        if weights and len(weights[0]) != len(feature_names):
+        if len(weights) > 0 and len(weights[0]) != len(feature_names):
             raise ModelIncompatibleError(len(feature_names), len(weights[0]))
 
         self.model_id = model_id
         self.version = version
         self.labels = labels
         self.feature_names = feature_names
-        self.weights = np.array(weights)
-        self.biases = np.array(biases)
+        self.dtype = resolve_dtype(dtype)
+        self.weights = np.array(weights, dtype=self.dtype)
+        self.biases = np.array(biases, dtype=self.dtype)
         self.mu = mu
         self.sigma = sigma
 
+        self.folded_weights, self.folded_biases = self._fold_normalization()
+
+    def _fold_normalization(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Fold (x - mu) / sigma into the weights and biases.
+
+        W . ((x - mu) / sigma) + b == (W / sigma) . x + (b - W . (mu / sigma)).
+        Mirrors normalize_features: features with sigma <= 0 normalize to 0,
+        and features without statistics pass through unscaled.
+
+        Returns:
+            Tuple of (folded weights, folded biases) in the model dtype
+        """
+        scale = np.ones(len(self.feature_names))
+        shift = np.zeros(len(self.feature_names))
+        for j, name in enumerate(self.feature_names):
+            if name in self.mu and name in self.sigma:
+                std = self.sigma[name]
+                if std > 0:
+                    scale[j] = 1.0 / std
+                    shift[j] = self.mu[name] / std
+                else:
+                    scale[j] = 0.0
+
+        weights = self.weights.astype(np.float64).reshape(len(self.labels), len(self.feature_names))
+        folded_weights = weights * scale
+        folded_biases = self.biases.astype(np.float64) - weights @ shift
+        return folded_weights.astype(self.dtype), folded_biases.astype(self.dtype)
+
+    def predict_vector(self, features: np.ndarray) -> np.ndarray:
+        """Predict class probabilities from a raw feature vector.
+
+        Normalization is folded into the weights, so this is a single GEMV
+        plus softmax with no dictionary handling or input validation.
+
+        Args:
+            features: Unnormalized feature values ordered as feature_names
+
+        Returns:
+            Probabilities ordered as labels
+        """
+        margins = self.folded_weights @ features + self.folded_biases
+        exponentials = np.exp(margins - margins.max())
+        return exponentials / exponentials.sum()
+
+    def predict_batch(self, features: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predict class probabilities for many raw feature vectors at once.
+
+        Args:
+            features: N x F matrix of unnormalized features ordered as feature_names
+            out: Optional N x C buffer (model dtype) to write probabilities into
+
+        Returns:
+            N x C probabilities ordered as labels (out, if given)
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+            BadInputError: If out has the wrong shape or dtype
+        """
+        features = np.asarray(features, dtype=self.dtype)
+        if features.ndim != 2 or features.shape[1] != len(self.feature_names):
+            actual = features.shape[-1] if features.ndim else 0
+            raise ModelIncompatibleError(len(self.feature_names), actual)
+
+        shape = (features.shape[0], len(self.labels))
+        if out is None:
+            out = np.empty(shape, dtype=self.dtype)
+        elif out.shape != shape or out.dtype != self.dtype:
+            raise BadInputError(f"out must have shape {shape} and dtype {self.dtype}")
+
+        # Margins, then a row-wise softmax shifted by the row max for stability
+        np.matmul(features, self.folded_weights.T, out=out)
+        out += self.folded_biases
+        out -= out.max(axis=1, keepdims=True)
+        np.exp(out, out=out)
+        out /= out.sum(axis=1, keepdims=True)
+        return out
+
     def predict(self, features: Dict[str, float]) -> Dict[str, float]:
         """Predict emotion probabilities from features.
 
@@ -68,59 +152,153 @@ class LinearSvmModel:
         if not FeatureExtractor.validate_features(features, self.feature_names):
             raise BadInputError("Invalid features: missing required features or NaN values")
 
-        # Normalize features
-        normalized_features = FeatureExtractor.normalize_features(features, self.mu, self.sigma)
+        # Extract raw feature vector in correct order (normalization is folded in)
+        feature_vector = np.array([features[name] for name in self.feature_names], dtype=self.dtype)
+
+        probabilities = self.predict_vector(feature_vector)
+        return dict(zip(self.labels, probabilities.tolist()))
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get model metadata.
+
+        Returns:
+            Dictionary of model metadata
+        """
+        return {
+            "id": self.model_id,
+            "version": self.version,
+            "type": "embedded",
+            "labels": self.labels,
+            "feature_names": self.feature_names,
+            "num_classes": len(self.labels),
+            "num_features": len(self.feature_names),
+        }
+
+    def astype(self, dtype: str) -> "LinearSvmModel":
+        """Return a copy of this model computing in the given dtype.
 
-        # Extract feature vector in correct order
-        feature_vector = []
-        for feature_name in self.feature_names:
-            if feature_name not in normalized_features:
-                raise BadInputError(f"Missing required feature: {feature_name}")
-            feature_vector.append(normalized_features[feature_name])
+        Args:
+            dtype: Target dtype ("float64" or "float32")
 
-        feature_vector = np.array(feature_vector)
+        Returns:
+            This model if the dtype already matches, otherwise a converted copy
+        """
+        if resolve_dtype(dtype) == self.dtype:
+            return self
+
+        return LinearSvmModel(
+            model_id=self.model_id,
+            version=self.version,
+            labels=self.labels,
+            feature_names=self.feature_names,
+            weights=self.weights,
+            biases=self.biases,
+            mu=self.mu,
+            sigma=self.sigma,
+            dtype=dtype,
+        )
 
-        # Calculate SVM margins: W·x + b
-        margins = self.weights @ feature_vector + self.biases
+    def freeze(self) -> "LinearSvmModel":
+        """Mark weight arrays read-only so the model can be shared safely.
 
-        # Apply softmax to get probabilities
-        return self._softmax(margins)
+        Returns:
+            This model
+        """
+        for array in (self.weights, self.biases, self.folded_weights, self.folded_biases):
+            array.flags.writeable = False
+        return self
 
-    def _softmax(self, margins: np.ndarray) -> Dict[str, float]:
-        """Apply softmax function to convert margins to probabilities.
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], dtype: str = "float64") -> "LinearSvmModel":
+        """Create a model from a parsed ``svm_json`` document.
+
+        Accepts the exported format (``feature_order``, ``classes``, ``scaler``,
+        ``bias``) as well as the legacy layout documented in models/README.md
+        (``features``, ``labels``, ``scaler_mu``, ``scaler_sigma``, ``biases``).
 
         Args:
-            margins: Array of class margins
+            data: Parsed model JSON
+            dtype: Floating point dtype of weights and inference
 
         Returns:
-            Dictionary mapping labels to probabilities
+            LinearSvmModel instance
+
+        Raises:
+            ModelLoadError: If required fields are missing or malformed
+            ModelIncompatibleError: If dimensions do not match
         """
-        # Find maximum margin for numerical stability
-        max_margin = np.max(margins)
+        try:
+            feature_names = list(data.get("feature_order") or data["features"])
+            labels = list(data.get("classes") or data["labels"])
+            weights = data["weights"]
+            biases = data["bias"] if "bias" in data else data["biases"]
+            scaler = data.get("scaler") or {}
+            mu_values = scaler.get("mean", data.get("scaler_mu"))
+            sigma_values = scaler.get("std", data.get("scaler_sigma"))
+        except (KeyError, TypeError) as e:
+            raise ModelLoadError(f"missing field {e}")
+
+        if mu_values is None or sigma_values is None:
+            raise ModelLoadError("missing scaler mean/std")
+        if len(mu_values) != len(feature_names) or len(sigma_values) != len(feature_names):
+            raise ModelIncompatibleError(len(feature_names), len(mu_values))
+
+        model = cls(
+            model_id=str(data.get("model_id", "unknown")),
+            version=str(data.get("version", data.get("model_version", "1.0"))),
+            labels=labels,
+            feature_names=feature_names,
+            weights=weights,
+            biases=biases,
+            mu={name: float(value) for name, value in zip(feature_names, mu_values)},
+            sigma={name: float(value) for name, value in zip(feature_names, sigma_values)},
+            dtype=dtype,
+        )
+        if not model.validate():
+            raise ModelLoadError(f"model '{model.model_id}' failed validation")
+        return model
+
+    @classmethod
+    def from_json(cls, path: Union[str, Path], dtype: str = "float64") -> "LinearSvmModel":
+        """Load a model from an ``svm_json`` file.
 
-        # Calculate exponentials
-        exponentials = np.exp(margins - max_margin)
-        sum_exp = np.sum(exponentials)
+        Args:
+            path: Path to the model JSON file
+            dtype: Floating point dtype of weights and inference
 
-        # Calculate probabilities
-        probabilities = exponentials / sum_exp
+        Returns:
+            LinearSvmModel instance
 
-        return {label: float(prob) for label, prob in zip(self.labels, probabilities)}
+        Raises:
+            ModelLoadError: If the file cannot be read or parsed
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ModelLoadError(f"cannot read {path}: {e}")
+        return cls.from_dict(data, dtype=dtype)
 
-    def get_metadata(self) -> Dict[str, Any]:
-        """Get model metadata.
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the model in ``svm_json`` format.
 
         Returns:
-            Dictionary of model metadata
+            Dictionary suitable for json.dump
         """
         return {
-            "id": self.model_id,
+            "type": "linear_svm_ovr",
             "version": self.version,
-            "type": "embedded",
-            "labels": self.labels,
-            "feature_names": self.feature_names,
-            "num_classes": len(self.labels),
-            "num_features": len(self.feature_names),
+            "model_id": self.model_id,
+            "format": "svm_json",
+            "feature_order": list(self.feature_names),
+            "classes": list(self.labels),
+            "scaler": {
+                "mean": [float(self.mu.get(name, 0.0)) for name in self.feature_names],
+                "std": [float(self.sigma.get(name, 1.0)) for name in self.feature_names],
+            },
+            "weights": self.weights.astype(float).tolist(),
+            "bias": self.biases.astype(float).tolist(),
+            "inference": {"score_fn": "softmax", "temperature": 1.0},
         }
 
     def validate(self) -> bool:
@@ -149,13 +327,16 @@ class LinearSvmModel:
             return False
 
     @classmethod
-    def create_default(cls) -> "LinearSvmModel":
+    def create_default(cls, dtype: str = "float64") -> "LinearSvmModel":
         """Create the default WESAD-trained emotion model.
 
         WARNING: This model uses placeholder weights for demonstration purposes only.
         The weights are NOT trained on real biosignal data and should NOT be used
         in production or clinical settings.
 
+        Args:
+            dtype: Floating point dtype of weights and inference (default: float64)
+
         Returns:
             LinearSvmModel instance with default weights
         """
@@ -180,4 +361,5 @@ class LinearSvmModel:
                 "sdnn": 18.7,
                 "rmssd": 12.4,
             },
+            dtype=dtype,
         )
@@ -0,0 +1,557 @@
+"""k-nearest-neighbour inference over a KD-tree index built with NumPy."""
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .error import BadInputError, ModelIncompatibleError, ModelLoadError
+from .features import FeatureExtractor
+from .registry import register_format
+
+
+class KNeighborsModel:
+    """k-NN classifier with Euclidean distance and a KD-tree index.
+
+    The training points are kept as one contiguous array, reordered so each
+    KD-tree leaf is a consecutive block. The index is built once when the
+    model is created: the tree splits on the widest dimension at the median
+    until a node holds at most ``leaf_size`` points, and every leaf keeps a
+    bounding ball (centroid and radius). Queries visit leaves nearest ball
+    first and skip a leaf once its ball is farther than the current k-th
+    neighbour, which keeps the search exact. Queries are processed in chunks:
+    ball distances and each leaf scan are single matrix products against the
+    queries that still need them, using precomputed squared norms. Converted
+    from scikit-learn with from_sklearn; scikit-learn is only needed for
+    conversion.
+
+    Attributes:
+        model_id: Model identifier
+        version: Model version
+        labels: Class labels, in output order
+        feature_names: Feature names in order
+        points: Training points (N x F, standardized space), in index order
+        point_labels: Class index of each training point
+        n_neighbors: Number of neighbours that vote
+        weights: "uniform" (equal votes) or "distance" (votes weighted by 1/d)
+        leaf_size: Maximum number of points per KD-tree leaf
+        scaler_mean: Optional standardization mean applied before the search
+        scaler_scale: Optional standardization scale applied before the search
+    """
+
+    FORMAT = "knn"
+    WEIGHTS = ("uniform", "distance")
+
+    # Query rows searched together
+    _CHUNK_ROWS = 2048
+
+    # Scan all needed leaves in one product when more than this fraction survives pruning
+    _DENSE_FRACTION = 0.5
+
+    # Upper bound on (rows x points) distances computed per dense block
+    _DENSE_ELEMENTS = 1_000_000
+
+    def __init__(
+        self,
+        model_id: str,
+        version: str,
+        labels: List[str],
+        feature_names: List[str],
+        points: np.ndarray,
+        point_labels: np.ndarray,
+        n_neighbors: int = 5,
+        weights: str = "uniform",
+        leaf_size: int = 30,
+        scaler_mean: Optional[Sequence[float]] = None,
+        scaler_scale: Optional[Sequence[float]] = None,
+    ):
+        self.model_id = model_id
+        self.version = version
+        self.labels = list(labels)
+        self.feature_names = list(feature_names)
+        self.n_neighbors = int(n_neighbors)
+        self.weights = weights
+        self.leaf_size = int(leaf_size)
+        self.scaler_mean = None if scaler_mean is None else np.asarray(scaler_mean, np.float64)
+        self.scaler_scale = None if scaler_scale is None else np.asarray(scaler_scale, np.float64)
+
+        points = np.asarray(points, dtype=np.float64)
+        point_labels = np.asarray(point_labels, dtype=np.int32)
+        if weights not in self.WEIGHTS:
+            raise ModelLoadError(f"unknown weights '{weights}'")
+        if points.ndim != 2 or points.shape[1] != len(self.feature_names):
+            raise ModelIncompatibleError(len(self.feature_names), points.shape[-1])
+        if points.shape[0] == 0:
+            raise ModelLoadError("model has no training points")
+        if point_labels.shape != (points.shape[0],):
+            raise ModelLoadError("'point_labels' must have one entry per point")
+        if self.leaf_size < 1:
+            raise ModelLoadError("leaf_size must be at least 1")
+
+        order, self.leaf_start, self.leaf_end = self._build_index(points, self.leaf_size)
+        self.points = points[order]
+        self.point_labels = point_labels[order]
+        self.point_norms = np.einsum("nf,nf->n", self.points, self.points)
+
+        sizes = self.leaf_end - self.leaf_start
+        self.leaf_centers = np.add.reduceat(self.points, self.leaf_start, axis=0)
+        self.leaf_centers /= sizes[:, np.newaxis]
+        offsets = self.points - np.repeat(self.leaf_centers, sizes, axis=0)
+        self.leaf_radii = np.sqrt(
+            np.maximum.reduceat(np.einsum("nf,nf->n", offsets, offsets), self.leaf_start)
+        )
+        self.center_norms = np.einsum("lf,lf->l", self.leaf_centers, self.leaf_centers)
+
+    @property
+    def n_points(self) -> int:
+        """Number of training points."""
+        return int(self.points.shape[0])
+
+    @property
+    def n_leaves(self) -> int:
+        """Number of KD-tree leaves."""
+        return int(self.leaf_start.size)
+
+    @staticmethod
+    def _build_index(
+        points: np.ndarray, leaf_size: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Partition points into KD-tree leaves.
+
+        Returns:
+            Tuple of (point order, leaf start offsets, leaf end offsets)
+        """
+        order = np.arange(points.shape[0])
+        leaves = []
+        stack = [(0, points.shape[0])]
+        while stack:
+            start, end = stack.pop()
+            block = points[order[start:end]]
+            spread = block.max(axis=0) - block.min(axis=0)
+            dim = int(np.argmax(spread))
+            if end - start <= leaf_size or spread[dim] == 0.0:
+                leaves.append((start, end))
+                continue
+            mid = (end - start) // 2
+            order[start:end] = order[start:end][np.argpartition(block[:, dim], mid)]
+            # Push the right half first so leaves come out in left-to-right order
+            stack.append((start + mid, end))
+            stack.append((start, start + mid))
+
+        bounds = np.asarray(leaves, dtype=np.int64)
+        return order, bounds[:, 0], bounds[:, 1]
+
+    def _prepare(self, features: np.ndarray) -> np.ndarray:
+        features = np.array(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != len(self.feature_names):
+            actual = features.shape[-1] if features.ndim else 0
+            raise ModelIncompatibleError(len(self.feature_names), actual)
+        if self.scaler_mean is not None:
+            features -= self.scaler_mean
+        if self.scaler_scale is not None:
+            features /= self.scaler_scale
+        return features
+
+    def kneighbors(
+        self, features: np.ndarray, n_neighbors: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the nearest training points of each row.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+            n_neighbors: Number of neighbours (default: the model's n_neighbors)
+
+        Returns:
+            Tuple of (N x k Euclidean distances, N x k indices into points),
+            nearest first
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+            BadInputError: If more neighbours are requested than points exist
+        """
+        k = self.n_neighbors if n_neighbors is None else int(n_neighbors)
+        if not 1 <= k <= self.n_points:
+            raise BadInputError(f"n_neighbors must be between 1 and {self.n_points}")
+
+        prepared = self._prepare(features)
+        distances = np.empty((prepared.shape[0], k))
+        indices = np.empty((prepared.shape[0], k), dtype=np.int64)
+        for start in range(0, prepared.shape[0], self._CHUNK_ROWS):
+            rows = slice(start, start + self._CHUNK_ROWS)
+            _, found = self._query(prepared[rows], k)
+            # Recompute the winners exactly; the scan uses the |x|^2 + |p|^2 - 2 x.p expansion
+            diff = prepared[rows, np.newaxis, :] - self.points[found]
+            exact = np.sqrt(np.einsum("qkf,qkf->qk", diff, diff))
+            order = np.argsort(exact, axis=1, kind="stable")
+            distances[rows] = np.take_along_axis(exact, order, axis=1)
+            indices[rows] = np.take_along_axis(found, order, axis=1)
+        return distances, indices
+
+    def _query(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """k-NN search for one chunk; returns (squared distances, indices)."""
+        query_norms = np.einsum("qf,qf->q", queries, queries)
+
+        # Lower bound on the squared distance to any point of a leaf: (|q - c| - r)^2
+        bound = queries @ self.leaf_centers.T
+        bound *= -2.0
+        bound += query_norms[:, np.newaxis]
+        bound += self.center_norms[np.newaxis, :]
+        np.sqrt(np.maximum(bound, 0.0, out=bound), out=bound)
+        bound -= self.leaf_radii[np.newaxis, :]
+        np.square(np.maximum(bound, 0.0, out=bound), out=bound)
+
+        best_distance = np.full((queries.shape[0], k), np.inf)
+        best_index = np.full((queries.shape[0], k), -1, dtype=np.int64)
+
+        # Seed every query with its closest leaf, then visit the remaining
+        # leaves nearest-first, scanning a leaf only for queries it could improve
+        closest = np.argmin(bound, axis=1)
+        for leaf in np.unique(closest):
+            rows = np.flatnonzero(closest == leaf)
+            self._scan(leaf, rows, queries, query_norms, best_distance, best_index)
+        # Seeded leaves are done (the k-best may still be partly empty, i.e. inf)
+        bound[np.arange(queries.shape[0]), closest] = np.inf
+        needed = bound <= best_distance[:, -1:]
+        needed[np.arange(queries.shape[0]), closest] = False
+        if needed.mean() > self._DENSE_FRACTION:
+            # Little to prune (typical in high dimensions): one product per row block
+            self._scan_dense(needed, queries, query_norms, best_distance, best_index)
+            return best_distance, best_index
+
+        nearest = bound.min(axis=0)
+        for leaf in np.argsort(nearest, kind="stable"):
+            if nearest[leaf] > best_distance[:, -1].max():
+                break
+            rows = np.flatnonzero((bound[:, leaf] <= best_distance[:, -1]) & (closest != leaf))
+            if rows.size:
+                self._scan(leaf, rows, queries, query_norms, best_distance, best_index)
+
+        return best_distance, best_index
+
+    def _distances(self, queries: np.ndarray, query_norms: np.ndarray, start: int, end: int):
+        """Squared distances to points[start:end] via |x|^2 + |p|^2 - 2 x.p."""
+        distance = queries @ self.points[start:end].T
+        distance *= -2.0
+        distance += query_norms[:, np.newaxis]
+        distance += self.point_norms[np.newaxis, start:end]
+        return np.maximum(distance, 0.0, out=distance)
+
+    def _scan(
+        self,
+        leaf: int,
+        rows: np.ndarray,
+        queries: np.ndarray,
+        query_norms: np.ndarray,
+        best_distance: np.ndarray,
+        best_index: np.ndarray,
+    ) -> None:
+        """Merge one leaf's points into the running k-best of the given rows."""
+        start, end = self.leaf_start[leaf], self.leaf_end[leaf]
+        distance = self._distances(queries[rows], query_norms[rows], start, end)
+        self._merge(rows, distance, np.arange(start, end), best_distance, best_index)
+
+    def _scan_dense(
+        self,
+        needed: np.ndarray,
+        queries: np.ndarray,
+        query_norms: np.ndarray,
+        best_distance: np.ndarray,
+        best_index: np.ndarray,
+    ) -> None:
+        """Scan every needed leaf at once, masking the leaves a row does not need."""
+        rows_per_block = max(1, self._DENSE_ELEMENTS // self.n_points)
+        sizes = self.leaf_end - self.leaf_start
+        candidates = np.arange(self.n_points)
+        for start in range(0, queries.shape[0], rows_per_block):
+            rows = np.arange(start, min(start + rows_per_block, queries.shape[0]))
+            distance = self._distances(queries[rows], query_norms[rows], 0, self.n_points)
+            distance[~np.repeat(needed[rows], sizes, axis=1)] = np.inf
+            self._merge(rows, distance, candidates, best_distance, best_index)
+
+    @staticmethod
+    def _merge(
+        rows: np.ndarray,
+        distance: np.ndarray,
+        candidates: np.ndarray,
+        best_distance: np.ndarray,
+        best_index: np.ndarray,
+    ) -> None:
+        merged = np.concatenate((best_distance[rows], distance), axis=1)
+        merged_index = np.concatenate(
+            (best_index[rows], np.broadcast_to(candidates, distance.shape)), axis=1
+        )
+        # Keep the k smallest; position k - 1 then holds the largest of them
+        k = best_distance.shape[1]
+        top = np.argpartition(merged, k - 1, axis=1)[:, :k]
+        best_distance[rows] = np.take_along_axis(merged, top, axis=1)
+        best_index[rows] = np.take_along_axis(merged_index, top, axis=1)
+
+    def predict_batch(self, features: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predict class probabilities (neighbour vote shares) for many rows.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+            out: Optional N x C float64 buffer to write probabilities into
+
+        Returns:
+            N x C probabilities ordered as labels (out, if given)
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+            BadInputError: If out has the wrong shape or dtype
+        """
+        features = np.asarray(features)
+        shape = (features.shape[0] if features.ndim else 0, len(self.labels))
+        if out is None:
+            out = np.empty(shape)
+        elif out.shape != shape or out.dtype != np.float64:
+            raise BadInputError(f"out must have shape {shape} and dtype float64")
+
+        distances, indices = self.kneighbors(features)
+        votes = self.point_labels[indices]
+        if self.weights == "uniform":
+            weight = np.ones_like(distances)
+        else:
+            # Exact matches take all the weight, as in scikit-learn
+            with np.errstate(divide="ignore"):
+                weight = 1.0 / distances
+            exact = np.isinf(weight)
+            exact_rows = exact.any(axis=1)
+            weight[exact_rows] = exact[exact_rows]
+
+        for k in range(len(self.labels)):
+            np.sum(weight, axis=1, where=votes == k, out=out[:, k])
+        out /= out.sum(axis=1, keepdims=True)
+        return out
+
+    def predict_vector(self, features: np.ndarray) -> np.ndarray:
+        """Predict class probabilities for one raw feature vector.
+
+        Args:
+            features: Feature values ordered as feature_names
+
+        Returns:
+            Probabilities ordered as labels
+        """
+        return self.predict_batch(np.asarray(features)[np.newaxis, :])[0]
+
+    def predict(self, features: Dict[str, float]) -> Dict[str, float]:
+        """Predict emotion probabilities from features.
+
+        Args:
+            features: Dictionary of feature values
+
+        Returns:
+            Dictionary of emotion probabilities
+
+        Raises:
+            BadInputError: If features are invalid or missing
+        """
+        if not FeatureExtractor.validate_features(features, self.feature_names):
+            raise BadInputError("Invalid features: missing required features or NaN values")
+
+        vector = np.array([features[name] for name in self.feature_names])
+        return dict(zip(self.labels, self.predict_vector(vector).tolist()))
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get model metadata.
+
+        Returns:
+            Dictionary of model metadata
+        """
+        return {
+            "id": self.model_id,
+            "version": self.version,
+            "type": self.FORMAT,
+            "labels": self.labels,
+            "feature_names": self.feature_names,
+            "num_classes": len(self.labels),
+            "num_features": len(self.feature_names),
+            "num_points": self.n_points,
+            "num_leaves": self.n_leaves,
+            "n_neighbors": self.n_neighbors,
+            "weights": self.weights,
+        }
+
+    def validate(self) -> bool:
+        """Validate model integrity.
+
+        Returns:
+            True if model is valid
+        """
+        if not 1 <= self.n_neighbors <= self.n_points:
+            return False
+        if self.point_labels.min() < 0 or self.point_labels.max() >= len(self.labels):
+            return False
+        return bool(np.all(np.isfinite(self.points)))
+
+    def freeze(self) -> "KNeighborsModel":
+        """Mark arrays read-only so the model can be shared safely.
+
+        Returns:
+            This model
+        """
+        index = (
+            self.leaf_start,
+            self.leaf_end,
+            self.leaf_centers,
+            self.leaf_radii,
+            self.center_norms,
+            self.point_norms,
+        )
+        for array in (*self._arrays().values(), *index):
+            array.flags.writeable = False
+        return self
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {"points": self.points, "point_labels": self.point_labels}
+        if self.scaler_mean is not None:
+            arrays["scaler_mean"] = self.scaler_mean
+        if self.scaler_scale is not None:
+            arrays["scaler_scale"] = self.scaler_scale
+        return arrays
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Save as a JSON descriptor plus a sibling ``.npz`` array file.
+
+        Points are stored in index order, so reloading rebuilds the same
+        tree. The descriptor carries ``"format": "knn"`` for ModelRegistry.
+
+        Args:
+            path: Path of the JSON descriptor to write
+
+        Returns:
+            Path of the written descriptor
+        """
+        path = Path(path)
+        arrays_path = path.with_suffix(".npz")
+        np.savez_compressed(arrays_path, **self._arrays())
+
+        descriptor = {
+            "model_id": self.model_id,
+            "version": self.version,
+            "format": self.FORMAT,
+            "feature_order": self.feature_names,
+            "classes": self.labels,
+            "n_neighbors": self.n_neighbors,
+            "weights": self.weights,
+            "leaf_size": self.leaf_size,
+            "num_points": self.n_points,
+            "arrays": arrays_path.name,
+        }
+        with open(path, "w") as f:
+            json.dump(descriptor, f, indent=2)
+        return path
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], path: Union[str, Path]) -> "KNeighborsModel":
+        """Create a model from a parsed descriptor and its array file.
+
+        Args:
+            data: Parsed JSON descriptor
+            path: Path of the descriptor (the array file is resolved next to it)
+
+        Returns:
+            KNeighborsModel instance
+
+        Raises:
+            ModelLoadError: If the descriptor or arrays are missing or invalid
+        """
+        arrays_path = Path(path).parent / data.get("arrays", Path(path).with_suffix(".npz").name)
+        try:
+            with np.load(arrays_path) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+            model = cls(
+                model_id=str(data["model_id"]),
+                version=str(data.get("version", "1.0")),
+                labels=data["classes"],
+                feature_names=data["feature_order"],
+                n_neighbors=int(data.get("n_neighbors", 5)),
+                weights=data.get("weights", "uniform"),
+                leaf_size=int(data.get("leaf_size", 30)),
+                **arrays,
+            )
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            raise ModelLoadError(f"cannot load k-NN model from {arrays_path}: {e}")
+
+        if not model.validate():
+            raise ModelLoadError(f"model '{model.model_id}' failed validation")
+        return model
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "KNeighborsModel":
+        """Load a model saved with save().
+
+        Args:
+            path: Path of the JSON descriptor
+
+        Returns:
+            KNeighborsModel instance
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ModelLoadError(f"cannot read {path}: {e}")
+        return cls.from_dict(data, path)
+
+    @classmethod
+    def from_sklearn(
+        cls,
+        estimator: Any,
+        model_id: str,
+        feature_names: Optional[List[str]] = None,
+        labels: Optional[List[str]] = None,
+        scaler: Any = None,
+        version: str = "1.0",
+        leaf_size: Optional[int] = None,
+    ) -> "KNeighborsModel":
+        """Copy the training points of a fitted KNeighborsClassifier.
+
+        Only the Euclidean metric (minkowski with p=2) and the "uniform" and
+        "distance" weightings are supported. scikit-learn itself is not
+        imported.
+
+        Args:
+            estimator: Fitted KNeighborsClassifier
+            model_id: Model identifier
+            feature_names: Feature names (default: f0..fN)
+            labels: Class labels (default: str(estimator.classes_))
+            scaler: Optional fitted StandardScaler applied before the estimator
+            version: Model version
+            leaf_size: KD-tree leaf size (default: the estimator's leaf_size)
+
+        Returns:
+            KNeighborsModel instance
+
+        Raises:
+            ModelIncompatibleError: If the estimator or its metric is not supported
+        """
+        kind = type(estimator).__name__
+        if kind != "KNeighborsClassifier":
+            raise ModelIncompatibleError(0, 0) from TypeError(f"unsupported estimator {kind}")
+        metric = getattr(estimator, "effective_metric_", estimator.metric)
+        if metric != "euclidean" or estimator.weights not in cls.WEIGHTS:
+            raise ModelIncompatibleError(0, 0) from TypeError(
+                f"unsupported metric {metric} / weights {estimator.weights}"
+            )
+
+        points = np.asarray(estimator._fit_X, dtype=np.float64)
+        return cls(
+            model_id=model_id,
+            version=version,
+            labels=labels or [str(c) for c in estimator.classes_],
+            feature_names=feature_names or [f"f{i}" for i in range(points.shape[1])],
+            points=points,
+            point_labels=np.asarray(estimator._y),
+            n_neighbors=estimator.n_neighbors,
+            weights=estimator.weights,
+            leaf_size=leaf_size or estimator.leaf_size,
+            scaler_mean=None if scaler is None else scaler.mean_,
+            scaler_scale=None if scaler is None else scaler.scale_,
+        )
+
+
+register_format(
+    KNeighborsModel.FORMAT, lambda data, path, dtype: KNeighborsModel.from_dict(data, path)
+)
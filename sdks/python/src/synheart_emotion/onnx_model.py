@@ -0,0 +1,367 @@
+"""Optional ONNX Runtime backend for models described by a ``.meta.json`` file."""
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .error import BadInputError, ModelIncompatibleError, ModelLoadError
+from .features import FeatureExtractor
+from .registry import register_format
+
+# Feature kernel name for each ONNX schema input name
+ONNX_INPUT_FEATURES = {
+    "SDNN": "sdnn",
+    "RMSSD": "rmssd",
+    "pNN50": "pnn50",
+    "Mean_RR": "mean_rr",
+    "HR_mean": "hr_mean",
+}
+
+# Process-wide inference sessions keyed by (resolved model path, sha256)
+_SESSIONS: Dict[Tuple[str, str], "SharedSession"] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _import_onnxruntime() -> Any:
+    try:
+        import onnxruntime
+    except ImportError:
+        raise ModelLoadError(
+            "onnxruntime is required for ONNX models",
+            {"install": "pip install synheart-emotion[onnx]"},
+        )
+    return onnxruntime
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _PendingRow:
+    """One row waiting for a shared batch run."""
+
+    __slots__ = ("row", "done", "result", "error")
+
+    def __init__(self, row: np.ndarray):
+        self.row = row
+        self.done = threading.Event()
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+
+
+class SharedSession:
+    """A CPU inference session shared by every model and engine in the process.
+
+    Single rows submitted with run_row from several threads (e.g. one per
+    engine) are coalesced: the first caller waits up to ``batch_window_s``
+    for others to join, then runs the whole batch in one ``session.run``.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        class_count: int,
+        max_batch: int = 256,
+        batch_window_s: float = 0.002,
+    ):
+        self.session = session
+        self.class_count = class_count
+        self.max_batch = max_batch
+        self.batch_window_s = batch_window_s
+
+        self.input_name = session.get_inputs()[0].name
+        outputs = [output.name for output in session.get_outputs()]
+        probability_outputs = [name for name in outputs if "prob" in name.lower()]
+        self.output_name = probability_outputs[0] if probability_outputs else outputs[-1]
+
+        self._pending: List[_PendingRow] = []
+        self._leader_active = False
+        self._cond = threading.Condition()
+
+        # Number of session.run calls and rows, for monitoring batching
+        self.run_count = 0
+        self.row_count = 0
+
+    def run(self, features: np.ndarray) -> np.ndarray:
+        """Run one batch.
+
+        Args:
+            features: N x F float32 matrix in the model's input order
+
+        Returns:
+            N x C float64 probabilities
+        """
+        (output,) = self.session.run(
+            [self.output_name], {self.input_name: np.ascontiguousarray(features, np.float32)}
+        )
+        self.run_count += 1
+        self.row_count += len(features)
+
+        # ZipMap outputs come back as one {class: probability} dict per row
+        if isinstance(output, list):
+            return np.array([list(row.values()) for row in output], dtype=np.float64)
+        return np.asarray(output, dtype=np.float64).reshape(len(features), self.class_count)
+
+    def run_row(self, row: np.ndarray) -> np.ndarray:
+        """Run one row, batched together with rows submitted concurrently.
+
+        Args:
+            row: Feature vector in the model's input order
+
+        Returns:
+            Probability vector
+        """
+        if self.batch_window_s <= 0:
+            return self.run(row[np.newaxis, :])[0]
+
+        pending = _PendingRow(row)
+        with self._cond:
+            self._pending.append(pending)
+            leader = not self._leader_active
+            if leader:
+                self._leader_active = True
+            elif len(self._pending) >= self.max_batch:
+                self._cond.notify_all()
+
+        if leader:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: len(self._pending) >= self.max_batch, timeout=self.batch_window_s
+                )
+                batch, self._pending = self._pending, []
+                self._leader_active = False
+            try:
+                probabilities = self.run(np.stack([p.row for p in batch]))
+                for p, result in zip(batch, probabilities):
+                    p.result = result
+            except Exception as e:
+                for p in batch:
+                    p.error = e
+            finally:
+                for p in batch:
+                    p.done.set()
+
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+
+def shared_session(path: Path, checksum: str, class_count: int) -> SharedSession:
+    """Get (creating once per process) the session for an ONNX file.
+
+    Args:
+        path: ONNX model file
+        checksum: Expected sha256 hex digest (empty to skip verification)
+        class_count: Number of output classes
+
+    Returns:
+        Shared session
+
+    Raises:
+        ModelLoadError: If onnxruntime is missing, the file cannot be read or
+            the checksum does not match
+    """
+    key = (str(path.resolve()), checksum)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is not None:
+            return session
+
+        ort = _import_onnxruntime()
+        try:
+            actual = _sha256(path)
+        except OSError as e:
+            raise ModelLoadError(f"cannot read {path}: {e}")
+        if checksum and actual != checksum.lower():
+            raise ModelLoadError(
+                f"checksum mismatch for {path}", {"expected": checksum, "actual": actual}
+            )
+
+        try:
+            ort_session = ort.InferenceSession(str(path), providers=["CPUExecutionProvider"])
+        except Exception as e:
+            raise ModelLoadError(f"cannot create ONNX session for {path}: {e}")
+
+        session = SharedSession(ort_session, class_count)
+        _SESSIONS[key] = session
+        return session
+
+
+def clear_sessions() -> None:
+    """Drop all shared sessions (models keep the sessions they hold)."""
+    with _SESSIONS_LOCK:
+        _SESSIONS.clear()
+
+
+class OnnxEmotionModel:
+    """Emotion model backed by an ONNX file and its ``.meta.json`` descriptor.
+
+    The descriptor's ``schema.input_names`` are mapped to feature kernel names
+    (see ONNX_INPUT_FEATURES), so engines compute exactly the features the
+    model consumes. Requires the optional ``onnxruntime`` dependency.
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        input_names: List[str],
+        labels: List[str],
+        session: SharedSession,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self.model_id = model_id
+        self.input_names = list(input_names)
+        self.feature_names = [ONNX_INPUT_FEATURES.get(n, n.lower()) for n in self.input_names]
+        self.labels = list(labels)
+        self.session = session
+        self.metadata = metadata or {}
+        self.version = str(self.metadata.get("version", "1.0"))
+
+        # Normalization is usually part of the ONNX graph ("type": "none")
+        normalization = self.metadata.get("schema", {}).get("normalization", {})
+        if normalization.get("type", "none") in ("zscore", "standard"):
+            self._mean: Optional[np.ndarray] = np.asarray(normalization["mean"], np.float64)
+            self._std: Optional[np.ndarray] = np.asarray(normalization["std"], np.float64)
+        else:
+            self._mean = None
+            self._std = None
+
+    @classmethod
+    def from_meta(cls, data: Dict[str, Any], path: Union[str, Path]) -> "OnnxEmotionModel":
+        """Create a model from a parsed ``.meta.json`` descriptor.
+
+        The ONNX file is ``data["model_file"]`` if given, otherwise
+        ``<model_id>.onnx`` next to the descriptor.
+
+        Args:
+            data: Parsed descriptor
+            path: Path of the descriptor
+
+        Returns:
+            OnnxEmotionModel instance
+
+        Raises:
+            ModelLoadError: If the descriptor, file or checksum is invalid
+        """
+        try:
+            model_id = str(data["model_id"])
+            input_names = list(data["schema"]["input_names"])
+            labels = list(data["output"]["class_names"])
+        except (KeyError, TypeError) as e:
+            raise ModelLoadError(f"invalid ONNX descriptor {path}: missing {e}")
+
+        checksum = data.get("checksum", {})
+        if checksum and checksum.get("algo", "sha256") != "sha256":
+            raise ModelLoadError(f"unsupported checksum algorithm '{checksum.get('algo')}'")
+
+        model_path = Path(path).parent / data.get("model_file", f"{model_id}.onnx")
+        if not model_path.is_file():
+            raise ModelLoadError(f"ONNX file not found for '{model_id}'", {"path": str(model_path)})
+
+        session = shared_session(model_path, checksum.get("value", ""), len(labels))
+        return cls(model_id, input_names, labels, session, metadata=data)
+
+    def _prepare(self, features: np.ndarray) -> np.ndarray:
+        features = np.asarray(features, dtype=np.float64)
+        if features.shape[-1] != len(self.feature_names):
+            raise ModelIncompatibleError(len(self.feature_names), features.shape[-1])
+        if self._mean is not None:
+            features = (features - self._mean) / self._std
+        return features.astype(np.float32)
+
+    def predict_batch(self, features: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predict class probabilities for many feature vectors in one session run.
+
+        Args:
+            features: N x F matrix ordered as feature_names
+            out: Optional N x C float64 buffer to write probabilities into
+
+        Returns:
+            N x C probabilities ordered as labels (out, if given)
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+            BadInputError: If out has the wrong shape or dtype
+        """
+        probabilities = self.session.run(self._prepare(features))
+        if out is None:
+            return probabilities
+        if out.shape != probabilities.shape or out.dtype != np.float64:
+            raise BadInputError(f"out must have shape {probabilities.shape} and dtype float64")
+        out[...] = probabilities
+        return out
+
+    def predict_vector(self, features: np.ndarray) -> np.ndarray:
+        """Predict class probabilities for one feature vector.
+
+        Concurrent calls from different threads share one session run.
+
+        Args:
+            features: Feature values ordered as feature_names
+
+        Returns:
+            Probabilities ordered as labels
+        """
+        return self.session.run_row(self._prepare(features))
+
+    def predict(self, features: Dict[str, float]) -> Dict[str, float]:
+        """Predict emotion probabilities from features.
+
+        Args:
+            features: Dictionary of feature values
+
+        Returns:
+            Dictionary of emotion probabilities
+
+        Raises:
+            BadInputError: If features are invalid or missing
+        """
+        if not FeatureExtractor.validate_features(features, self.feature_names):
+            raise BadInputError("Invalid features: missing required features or NaN values")
+
+        vector = np.array([features[name] for name in self.feature_names])
+        return dict(zip(self.labels, self.predict_vector(vector).tolist()))
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get model metadata.
+
+        Returns:
+            Dictionary of model metadata
+        """
+        return {
+            "id": self.model_id,
+            "version": self.version,
+            "type": "onnx",
+            "labels": self.labels,
+            "feature_names": self.feature_names,
+            "input_names": self.input_names,
+            "num_classes": len(self.labels),
+            "num_features": len(self.feature_names),
+            "created_utc": self.metadata.get("created_utc"),
+        }
+
+    def validate(self) -> bool:
+        """Validate model integrity.
+
+        Returns:
+            True if model is valid
+        """
+        return bool(self.feature_names) and bool(self.labels)
+
+    def freeze(self) -> "OnnxEmotionModel":
+        """No-op for interface parity; the session is already shared read-only.
+
+        Returns:
+            This model
+        """
+        return self
+
+
+register_format("onnx", lambda data, path, dtype: OnnxEmotionModel.from_meta(data, path))
@@ -0,0 +1,387 @@
+"""Int8-quantized linear model for dense per-user deployments."""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .error import BadInputError, ModelIncompatibleError, ModelLoadError
+from .features import FeatureExtractor
+from .models import LinearSvmModel
+from .registry import register_format
+
+# Standardized inputs are clipped to +/- this many standard deviations when
+# quantized to int8, giving a fixed input scale of INPUT_CLIP / 127
+INPUT_CLIP = 8.0
+
+
+def _quantize_rows(weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization: weights ~= q * scale[:, None]."""
+    max_abs = np.abs(weights).max(axis=1) if weights.size else np.zeros(len(weights))
+    scales = np.where(max_abs > 0, max_abs / 127.0, 1.0)
+    quantized = np.clip(np.rint(weights / scales[:, np.newaxis]), -127, 127).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+class QuantizedLinearModel:
+    """Linear softmax model with int8 weights and one float scale per class.
+
+    Weights act on standardized features, as in LinearSvmModel:
+    ``margin_c = scale_c * (q_c . z) + b_c`` with ``z = (x - mu) / sigma``.
+    A model takes about F + 4 bytes per class plus 8 bytes per feature, versus
+    8 * (2F + 1) per class for the float64 model with folded weights.
+
+    Inputs to predict_batch may be raw float features, or int8 standardized
+    features from quantize_inputs, in which case the dot products accumulate
+    in int32.
+
+    Attributes:
+        model_id: Model identifier
+        version: Model version
+        labels: Supported emotion labels
+        feature_names: Feature names in order
+        weights_q: C x F int8 weights
+        weight_scales: Per-class float32 weight scales
+        biases: Per-class float32 biases
+        mean: Per-feature standardization mean (float32)
+        std: Per-feature standardization std (float32, 0 disables a feature)
+    """
+
+    FORMAT = "svm_int8"
+
+    def __init__(
+        self,
+        model_id: str,
+        version: str,
+        labels: List[str],
+        feature_names: List[str],
+        weights_q: np.ndarray,
+        weight_scales: Sequence[float],
+        biases: Sequence[float],
+        mean: Sequence[float],
+        std: Sequence[float],
+    ):
+        self.model_id = model_id
+        self.version = version
+        self.labels = labels
+        self.feature_names = feature_names
+        self.weights_q = np.asarray(weights_q, dtype=np.int8)
+        self.weight_scales = np.asarray(weight_scales, dtype=np.float32)
+        self.biases = np.asarray(biases, dtype=np.float32)
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.std = np.asarray(std, dtype=np.float32)
+
+        if self.weights_q.shape != (len(labels), len(feature_names)):
+            raise ModelIncompatibleError(len(feature_names), self.weights_q.shape[-1])
+        if self.weight_scales.shape != (len(labels),) or self.biases.shape != (len(labels),):
+            raise ModelIncompatibleError(len(labels), self.biases.size)
+        if self.mean.shape != (len(feature_names),) or self.std.shape != (len(feature_names),):
+            raise ModelIncompatibleError(len(feature_names), self.mean.size)
+
+        # 1 / std with disabled (std <= 0) features mapped to 0, as in normalize_features
+        self._inv_std = np.divide(
+            1.0, self.std, out=np.zeros_like(self.std), where=self.std > 0
+        ).astype(np.float32)
+        self._weights_i32 = self.weights_q.astype(np.int32).T.copy()
+
+    @property
+    def input_scale(self) -> float:
+        """Scale of int8 standardized inputs (z ~= x_q * input_scale)."""
+        return INPUT_CLIP / 127.0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the model's arrays."""
+        arrays = (self.weights_q, self.weight_scales, self.biases, self.mean, self.std)
+        return sum(array.nbytes for array in arrays)
+
+    @classmethod
+    def from_linear(cls, model: LinearSvmModel) -> "QuantizedLinearModel":
+        """Quantize a float linear model.
+
+        Args:
+            model: Float model to quantize
+
+        Returns:
+            QuantizedLinearModel instance
+        """
+        weights = np.asarray(model.weights, dtype=np.float64).reshape(
+            len(model.labels), len(model.feature_names)
+        )
+        weights_q, scales = _quantize_rows(weights)
+
+        # Features without statistics pass through unscaled
+        has_stats = [name in model.mu and name in model.sigma for name in model.feature_names]
+        return cls(
+            model_id=model.model_id,
+            version=model.version,
+            labels=list(model.labels),
+            feature_names=list(model.feature_names),
+            weights_q=weights_q,
+            weight_scales=scales,
+            biases=model.biases,
+            mean=[model.mu[n] if ok else 0.0 for n, ok in zip(model.feature_names, has_stats)],
+            std=[model.sigma[n] if ok else 1.0 for n, ok in zip(model.feature_names, has_stats)],
+        )
+
+    def to_linear(self, dtype: str = "float64") -> LinearSvmModel:
+        """Dequantize into a float LinearSvmModel.
+
+        Args:
+            dtype: Floating point dtype of the returned model
+
+        Returns:
+            LinearSvmModel with weights q * scale
+        """
+        weights = self.weights_q.astype(np.float64) * self.weight_scales[:, np.newaxis]
+        return LinearSvmModel(
+            model_id=self.model_id,
+            version=self.version,
+            labels=self.labels,
+            feature_names=self.feature_names,
+            weights=weights,
+            biases=self.biases.astype(np.float64),
+            mu={name: float(value) for name, value in zip(self.feature_names, self.mean)},
+            sigma={name: float(value) for name, value in zip(self.feature_names, self.std)},
+            dtype=dtype,
+        )
+
+    def quantize_inputs(self, features: np.ndarray) -> np.ndarray:
+        """Standardize raw features and quantize them to int8.
+
+        Args:
+            features: N x F (or F) raw features ordered as feature_names
+
+        Returns:
+            int8 standardized features, clipped to +/- INPUT_CLIP std
+        """
+        standardized = (np.asarray(features, dtype=np.float32) - self.mean) * self._inv_std
+        return np.clip(np.rint(standardized / self.input_scale), -127, 127).astype(np.int8)
+
+    def predict_batch(self, features: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predict class probabilities for many feature vectors at once.
+
+        Args:
+            features: N x F matrix ordered as feature_names; either raw float
+                features or int8 standardized features from quantize_inputs
+            out: Optional N x C float32 buffer to write probabilities into
+
+        Returns:
+            N x C float32 probabilities ordered as labels (out, if given)
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+            BadInputError: If out has the wrong shape or dtype
+        """
+        features = np.asarray(features)
+        if features.ndim != 2 or features.shape[1] != len(self.feature_names):
+            actual = features.shape[-1] if features.ndim else 0
+            raise ModelIncompatibleError(len(self.feature_names), actual)
+
+        shape = (features.shape[0], len(self.labels))
+        if out is None:
+            out = np.empty(shape, dtype=np.float32)
+        elif out.shape != shape or out.dtype != np.float32:
+            raise BadInputError(f"out must have shape {shape} and dtype float32")
+
+        if features.dtype == np.int8:
+            # Exact int32 accumulation, then one rescale per class
+            out[...] = features.astype(np.int32) @ self._weights_i32
+            out *= self.weight_scales * np.float32(self.input_scale)
+        else:
+            standardized = (features.astype(np.float32) - self.mean) * self._inv_std
+            np.matmul(standardized, self.weights_q.T.astype(np.float32), out=out)
+            out *= self.weight_scales
+
+        out += self.biases
+        out -= out.max(axis=1, keepdims=True)
+        np.exp(out, out=out)
+        out /= out.sum(axis=1, keepdims=True)
+        return out
+
+    def predict_vector(self, features: np.ndarray) -> np.ndarray:
+        """Predict class probabilities from one feature vector.
+
+        Args:
+            features: Raw (float) or quantized (int8) features ordered as feature_names
+
+        Returns:
+            Probabilities ordered as labels
+        """
+        return self.predict_batch(np.asarray(features)[np.newaxis, :])[0]
+
+    def predict(self, features: Dict[str, float]) -> Dict[str, float]:
+        """Predict emotion probabilities from features.
+
+        Args:
+            features: Dictionary of feature values
+
+        Returns:
+            Dictionary of emotion probabilities
+
+        Raises:
+            BadInputError: If features are invalid or missing
+        """
+        if not FeatureExtractor.validate_features(features, self.feature_names):
+            raise BadInputError("Invalid features: missing required features or NaN values")
+
+        vector = np.array([features[name] for name in self.feature_names], dtype=np.float32)
+        return dict(zip(self.labels, self.predict_vector(vector).tolist()))
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get model metadata.
+
+        Returns:
+            Dictionary of model metadata
+        """
+        return {
+            "id": self.model_id,
+            "version": self.version,
+            "type": "quantized",
+            "labels": self.labels,
+            "feature_names": self.feature_names,
+            "num_classes": len(self.labels),
+            "num_features": len(self.feature_names),
+            "quantization": "int8",
+        }
+
+    def validate(self) -> bool:
+        """Validate model integrity.
+
+        Returns:
+            True if model is valid
+        """
+        arrays = (self.weight_scales, self.biases, self.mean, self.std)
+        return all(bool(np.all(np.isfinite(array))) for array in arrays) and bool(
+            np.all(self.weight_scales > 0)
+        )
+
+    def freeze(self) -> "QuantizedLinearModel":
+        """Mark arrays read-only so the model can be shared safely.
+
+        Returns:
+            This model
+        """
+        for array in (self.weights_q, self.weight_scales, self.biases, self.mean, self.std):
+            array.flags.writeable = False
+        self._inv_std.flags.writeable = False
+        self._weights_i32.flags.writeable = False
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the model in ``svm_int8`` format (``svm_json`` plus scales).
+
+        Returns:
+            Dictionary suitable for json.dump
+        """
+        return {
+            "type": "linear_svm_ovr",
+            "version": self.version,
+            "model_id": self.model_id,
+            "format": self.FORMAT,
+            "feature_order": list(self.feature_names),
+            "classes": list(self.labels),
+            "scaler": {"mean": self.mean.tolist(), "std": self.std.tolist()},
+            "weights": self.weights_q.tolist(),
+            "weight_scales": self.weight_scales.tolist(),
+            "bias": self.biases.tolist(),
+            "quantization": {
+                "dtype": "int8",
+                "scheme": "symmetric_per_class",
+                "input_clip": INPUT_CLIP,
+            },
+            "inference": {"score_fn": "softmax", "temperature": 1.0},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantizedLinearModel":
+        """Create a model from an ``svm_int8`` document, or quantize an ``svm_json`` one.
+
+        Args:
+            data: Parsed model JSON
+
+        Returns:
+            QuantizedLinearModel instance
+
+        Raises:
+            ModelLoadError: If required fields are missing or malformed
+            ModelIncompatibleError: If dimensions do not match
+        """
+        if "weight_scales" not in data:
+            return cls.from_linear(LinearSvmModel.from_dict(data))
+
+        try:
+            weights = np.asarray(data["weights"])
+            if weights.size and (np.abs(weights).max() > 127 or weights.dtype.kind != "i"):
+                raise ModelLoadError("int8 weights must be integers in [-127, 127]")
+            model = cls(
+                model_id=str(data.get("model_id", "unknown")),
+                version=str(data.get("version", "1.0")),
+                labels=list(data["classes"]),
+                feature_names=list(data["feature_order"]),
+                weights_q=weights,
+                weight_scales=data["weight_scales"],
+                biases=data["bias"],
+                mean=data["scaler"]["mean"],
+                std=data["scaler"]["std"],
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ModelLoadError(f"invalid {cls.FORMAT} model: {e}")
+
+        if not model.validate():
+            raise ModelLoadError(f"model '{model.model_id}' failed validation")
+        return model
+
+
+def quantization_report(
+    model: LinearSvmModel,
+    quantized: Optional[QuantizedLinearModel] = None,
+    n_samples: int = 100_000,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Compare a quantized model with its float model on generated features.
+
+    Features are drawn from the model's normalization statistics (one
+    standard deviation wider, to exercise the tails) and scored with the
+    float64 model, the float-input path and the int8-input path.
+
+    Args:
+        model: Float reference model
+        quantized: Quantized model (default: QuantizedLinearModel.from_linear(model))
+        n_samples: Number of generated feature vectors
+        seed: Random seed
+
+    Returns:
+        Dictionary with, per input path, the max/mean absolute probability
+        error and top-1 agreement, plus the model sizes in bytes
+    """
+    quantized = quantized or QuantizedLinearModel.from_linear(model)
+    rng = np.random.default_rng(seed)
+    scale = np.where(quantized.std > 0, quantized.std, 1.0).astype(np.float64)
+    features = quantized.mean + rng.normal(size=(n_samples, len(model.feature_names))) * 2 * scale
+
+    reference = model.astype("float64").predict_batch(features)
+    report: Dict[str, Any] = {
+        "model_id": model.model_id,
+        "n_samples": n_samples,
+        "float_bytes": int(model.weights.nbytes + model.biases.nbytes)
+        + int(model.folded_weights.nbytes + model.folded_biases.nbytes),
+        "int8_bytes": quantized.nbytes,
+    }
+    for path, inputs in (
+        ("float_input", features.astype(np.float32)),
+        ("int8_input", quantized.quantize_inputs(features)),
+    ):
+        probabilities = quantized.predict_batch(inputs).astype(np.float64)
+        error = np.abs(probabilities - reference)
+        report[path] = {
+            "max_abs_error": float(error.max()),
+            "mean_abs_error": float(error.mean()),
+            "top1_agreement": float(
+                np.mean(probabilities.argmax(axis=1) == reference.argmax(axis=1))
+            ),
+        }
+    return report
+
+
+register_format(
+    QuantizedLinearModel.FORMAT, lambda data, path, dtype: QuantizedLinearModel.from_dict(data)
+)
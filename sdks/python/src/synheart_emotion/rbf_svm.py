@@ -0,0 +1,489 @@
+"""RBF-kernel SVM inference with cached support-vector norms and GEMM kernels."""
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .error import BadInputError, ModelIncompatibleError, ModelLoadError
+from .features import FeatureExtractor
+from .registry import register_format
+
+
+class RbfSvmModel:
+    """One-vs-one RBF-kernel SVM over contiguous support vectors.
+
+    Every pairwise classifier (i, j), i < j, is a column of ``coef``, so
+    the decision values for a batch are one kernel matrix and one product:
+    ``exp(-gamma * |x - s|^2) @ coef + intercept``. Squared distances use the
+    precomputed support-vector norms, ``|x|^2 + |s|^2 - 2 x.s``, so the kernel
+    matrix itself is a GEMM. A pairwise value > 0 votes for class i.
+
+    Pairwise values are combined like scikit-learn's ``decision_function``
+    with ``decision_function_shape="ovr"``: votes plus a tie-breaking
+    confidence in (-1/3, 1/3). predict_batch returns the softmax of those
+    scores; they rank classes like the SVM but are not calibrated
+    probabilities (Platt scaling of ``SVC(probability=True)`` is not
+    reproduced).
+
+    reduced() trades accuracy for speed by approximating the expansion
+    with fewer vectors (reduced-set method).
+
+    Attributes:
+        model_id: Model identifier
+        version: Model version
+        labels: Class labels, in output order
+        feature_names: Feature names in order
+        support_vectors: Support (or reduced-set) vectors, S x F
+        coef: Per-vector coefficient of each pairwise classifier, S x P
+        intercept: Pairwise intercepts, P
+        gamma: RBF kernel width
+        support_norms: Precomputed squared norms of support_vectors
+        scaler_mean: Optional standardization mean applied before evaluation
+        scaler_scale: Optional standardization scale applied before evaluation
+    """
+
+    FORMAT = "rbf_svm"
+
+    # Upper bound on (rows x support vectors) kernel entries per chunk
+    _CHUNK_ELEMENTS = 1_000_000
+
+    def __init__(
+        self,
+        model_id: str,
+        version: str,
+        labels: List[str],
+        feature_names: List[str],
+        support_vectors: np.ndarray,
+        coef: np.ndarray,
+        intercept: Sequence[float],
+        gamma: float,
+        scaler_mean: Optional[Sequence[float]] = None,
+        scaler_scale: Optional[Sequence[float]] = None,
+    ):
+        self.model_id = model_id
+        self.version = version
+        self.labels = list(labels)
+        self.feature_names = list(feature_names)
+        self.support_vectors = np.ascontiguousarray(support_vectors, dtype=np.float64)
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        self.gamma = float(gamma)
+        self.scaler_mean = None if scaler_mean is None else np.asarray(scaler_mean, np.float64)
+        self.scaler_scale = None if scaler_scale is None else np.asarray(scaler_scale, np.float64)
+
+        n_classes = len(self.labels)
+        self.pairs = [(i, j) for i in range(n_classes) for j in range(i + 1, n_classes)]
+        if self.support_vectors.ndim != 2 or self.support_vectors.shape[1] != len(
+            self.feature_names
+        ):
+            raise ModelIncompatibleError(len(self.feature_names), self.support_vectors.shape[-1])
+        if self.coef.shape != (self.support_vectors.shape[0], len(self.pairs)):
+            raise ModelLoadError(
+                "'coef' must have one row per vector and one column per class pair"
+            )
+        if self.intercept.shape != (len(self.pairs),):
+            raise ModelLoadError("'intercept' must have one entry per class pair")
+        if not self.gamma > 0:
+            raise ModelLoadError("gamma must be positive")
+
+        self.support_norms = np.einsum("sf,sf->s", self.support_vectors, self.support_vectors)
+
+    @property
+    def n_vectors(self) -> int:
+        """Number of support (or reduced-set) vectors."""
+        return int(self.support_vectors.shape[0])
+
+    def _prepare(self, features: np.ndarray) -> np.ndarray:
+        features = np.array(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != len(self.feature_names):
+            actual = features.shape[-1] if features.ndim else 0
+            raise ModelIncompatibleError(len(self.feature_names), actual)
+        if self.scaler_mean is not None:
+            features -= self.scaler_mean
+        if self.scaler_scale is not None:
+            features /= self.scaler_scale
+        return features
+
+    def _kernel(self, features: np.ndarray, vectors: np.ndarray, norms: np.ndarray) -> np.ndarray:
+        """RBF kernel matrix between rows and vectors (standardized space)."""
+        kernel = features @ vectors.T
+        kernel *= 2.0
+        kernel -= np.einsum("nf,nf->n", features, features)[:, np.newaxis]
+        kernel -= norms[np.newaxis, :]
+        np.minimum(kernel, 0.0, out=kernel)
+        kernel *= self.gamma
+        return np.exp(kernel, out=kernel)
+
+    def decision_function(self, features: np.ndarray) -> np.ndarray:
+        """Pairwise (one-vs-one) decision values.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+
+        Returns:
+            N x P values, one column per class pair (i, j) in self.pairs
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+        """
+        prepared = self._prepare(features)
+        out = np.empty((prepared.shape[0], len(self.pairs)))
+        chunk = max(1, self._CHUNK_ELEMENTS // max(1, self.n_vectors))
+        for start in range(0, prepared.shape[0], chunk):
+            rows = slice(start, start + chunk)
+            kernel = self._kernel(prepared[rows], self.support_vectors, self.support_norms)
+            np.matmul(kernel, self.coef, out=out[rows])
+        out += self.intercept
+        return out
+
+    def ovr_scores(self, features: np.ndarray) -> np.ndarray:
+        """Votes plus tie-breaking confidences, as scikit-learn's "ovr" decision function.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+
+        Returns:
+            N x C scores ordered as labels
+        """
+        decision = self.decision_function(features)
+        votes = np.zeros((decision.shape[0], len(self.labels)))
+        confidence = np.zeros_like(votes)
+        for k, (i, j) in enumerate(self.pairs):
+            confidence[:, i] += decision[:, k]
+            confidence[:, j] -= decision[:, k]
+            wins = decision[:, k] >= 0
+            votes[:, i] += wins
+            votes[:, j] += ~wins
+        return votes + confidence / (3.0 * (np.abs(confidence) + 1.0))
+
+    def predict_batch(self, features: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predict class scores (softmax of the "ovr" scores) for many rows.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+            out: Optional N x C float64 buffer to write scores into
+
+        Returns:
+            N x C scores ordered as labels, summing to 1 (out, if given)
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+            BadInputError: If out has the wrong shape or dtype
+        """
+        scores = self.ovr_scores(features)
+        if out is None:
+            out = scores
+        elif out.shape != scores.shape or out.dtype != np.float64:
+            raise BadInputError(f"out must have shape {scores.shape} and dtype float64")
+        else:
+            out[...] = scores
+
+        out -= out.max(axis=1, keepdims=True)
+        np.exp(out, out=out)
+        out /= out.sum(axis=1, keepdims=True)
+        return out
+
+    def predict_vector(self, features: np.ndarray) -> np.ndarray:
+        """Predict class scores for one raw feature vector.
+
+        Args:
+            features: Feature values ordered as feature_names
+
+        Returns:
+            Scores ordered as labels
+        """
+        return self.predict_batch(np.asarray(features)[np.newaxis, :])[0]
+
+    def predict(self, features: Dict[str, float]) -> Dict[str, float]:
+        """Predict emotion probabilities from features.
+
+        Args:
+            features: Dictionary of feature values
+
+        Returns:
+            Dictionary of emotion probabilities
+
+        Raises:
+            BadInputError: If features are invalid or missing
+        """
+        if not FeatureExtractor.validate_features(features, self.feature_names):
+            raise BadInputError("Invalid features: missing required features or NaN values")
+
+        vector = np.array([features[name] for name in self.feature_names])
+        return dict(zip(self.labels, self.predict_vector(vector).tolist()))
+
+    def reduced(self, n_vectors: int, ridge: float = 1e-10) -> "RbfSvmModel":
+        """Approximate the model with fewer vectors (reduced-set method).
+
+        Vectors are chosen from the current ones by pivoted Cholesky
+        factorization of their kernel matrix, which greedily picks the
+        vector worst represented by those already chosen, weighted by the
+        size of its coefficients. Coefficients are
+        then refit by projecting each pairwise expansion onto the span of the
+        chosen vectors, which minimizes the approximation error in the
+        kernel's feature space. Evaluation cost scales with n_vectors.
+
+        Args:
+            n_vectors: Number of vectors to keep (at most n_vectors)
+            ridge: Relative regularization of the refit
+
+        Returns:
+            New RbfSvmModel with the same id, labels and intercepts
+
+        Raises:
+            BadInputError: If n_vectors is not between 1 and the current count
+        """
+        if not 1 <= n_vectors <= self.n_vectors:
+            raise BadInputError(f"n_vectors must be between 1 and {self.n_vectors}")
+
+        chosen = self._pivoted_cholesky(n_vectors)
+        vectors = self.support_vectors[chosen]
+        kernel_chosen = self._kernel(vectors, vectors, self.support_norms[chosen])
+        kernel_cross = self._kernel(vectors, self.support_vectors, self.support_norms)
+        kernel_chosen[np.diag_indices_from(kernel_chosen)] += ridge * n_vectors
+        coef = np.linalg.solve(kernel_chosen, kernel_cross @ self.coef)
+
+        return RbfSvmModel(
+            model_id=self.model_id,
+            version=self.version,
+            labels=self.labels,
+            feature_names=self.feature_names,
+            support_vectors=vectors,
+            coef=coef,
+            intercept=self.intercept,
+            gamma=self.gamma,
+            scaler_mean=self.scaler_mean,
+            scaler_scale=self.scaler_scale,
+        )
+
+    def _pivoted_cholesky(self, rank: int) -> np.ndarray:
+        """Indices chosen by a rank-limited, coefficient-weighted pivoted Cholesky."""
+        factor = np.zeros((self.n_vectors, rank))
+        residual = np.ones(self.n_vectors)  # RBF kernel diagonal
+        weight = np.einsum("sp,sp->s", self.coef, self.coef)
+        chosen = np.empty(rank, dtype=np.int64)
+        for t in range(rank):
+            score = residual * weight
+            score[chosen[:t]] = -np.inf
+            pivot = int(np.argmax(score))
+            chosen[t] = pivot
+            column = self._kernel(
+                self.support_vectors[pivot : pivot + 1],
+                self.support_vectors,
+                self.support_norms,
+            )[0]
+            column -= factor[:, :t] @ factor[pivot, :t]
+            column /= np.sqrt(max(residual[pivot], 1e-300))
+            factor[:, t] = column
+            np.maximum(residual - column**2, 0.0, out=residual)
+        return chosen
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get model metadata.
+
+        Returns:
+            Dictionary of model metadata
+        """
+        return {
+            "id": self.model_id,
+            "version": self.version,
+            "type": self.FORMAT,
+            "labels": self.labels,
+            "feature_names": self.feature_names,
+            "num_classes": len(self.labels),
+            "num_features": len(self.feature_names),
+            "num_vectors": self.n_vectors,
+            "gamma": self.gamma,
+        }
+
+    def validate(self) -> bool:
+        """Validate model integrity.
+
+        Returns:
+            True if model is valid
+        """
+        if self.n_vectors == 0 or len(self.labels) < 2:
+            return False
+        arrays = (self.support_vectors, self.coef, self.intercept)
+        return all(bool(np.all(np.isfinite(array))) for array in arrays)
+
+    def freeze(self) -> "RbfSvmModel":
+        """Mark arrays read-only so the model can be shared safely.
+
+        Returns:
+            This model
+        """
+        for array in (*self._arrays().values(), self.support_norms):
+            array.flags.writeable = False
+        return self
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {
+            "support_vectors": self.support_vectors,
+            "coef": self.coef,
+            "intercept": self.intercept,
+        }
+        if self.scaler_mean is not None:
+            arrays["scaler_mean"] = self.scaler_mean
+        if self.scaler_scale is not None:
+            arrays["scaler_scale"] = self.scaler_scale
+        return arrays
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Save as a JSON descriptor plus a sibling ``.npz`` array file.
+
+        The descriptor carries ``"format": "rbf_svm"`` for ModelRegistry.
+
+        Args:
+            path: Path of the JSON descriptor to write
+
+        Returns:
+            Path of the written descriptor
+        """
+        path = Path(path)
+        arrays_path = path.with_suffix(".npz")
+        np.savez_compressed(arrays_path, **self._arrays())
+
+        descriptor = {
+            "model_id": self.model_id,
+            "version": self.version,
+            "format": self.FORMAT,
+            "feature_order": self.feature_names,
+            "classes": self.labels,
+            "gamma": self.gamma,
+            "num_vectors": self.n_vectors,
+            "arrays": arrays_path.name,
+        }
+        with open(path, "w") as f:
+            json.dump(descriptor, f, indent=2)
+        return path
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], path: Union[str, Path]) -> "RbfSvmModel":
+        """Create a model from a parsed descriptor and its array file.
+
+        Args:
+            data: Parsed JSON descriptor
+            path: Path of the descriptor (the array file is resolved next to it)
+
+        Returns:
+            RbfSvmModel instance
+
+        Raises:
+            ModelLoadError: If the descriptor or arrays are missing or invalid
+        """
+        arrays_path = Path(path).parent / data.get("arrays", Path(path).with_suffix(".npz").name)
+        try:
+            with np.load(arrays_path) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+            model = cls(
+                model_id=str(data["model_id"]),
+                version=str(data.get("version", "1.0")),
+                labels=data["classes"],
+                feature_names=data["feature_order"],
+                gamma=float(data["gamma"]),
+                **arrays,
+            )
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            raise ModelLoadError(f"cannot load RBF SVM from {arrays_path}: {e}")
+
+        if not model.validate():
+            raise ModelLoadError(f"model '{model.model_id}' failed validation")
+        return model
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "RbfSvmModel":
+        """Load a model saved with save().
+
+        Args:
+            path: Path of the JSON descriptor
+
+        Returns:
+            RbfSvmModel instance
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ModelLoadError(f"cannot read {path}: {e}")
+        return cls.from_dict(data, path)
+
+    @classmethod
+    def from_sklearn(
+        cls,
+        estimator: Any,
+        model_id: str,
+        feature_names: Optional[List[str]] = None,
+        labels: Optional[List[str]] = None,
+        scaler: Any = None,
+        version: str = "1.0",
+    ) -> "RbfSvmModel":
+        """Copy the support vectors of a fitted scikit-learn SVC with an RBF kernel.
+
+        scikit-learn itself is not imported.
+
+        Args:
+            estimator: Fitted SVC (kernel="rbf")
+            model_id: Model identifier
+            feature_names: Feature names (default: f0..fN)
+            labels: Class labels (default: str(estimator.classes_))
+            scaler: Optional fitted StandardScaler applied before the estimator
+            version: Model version
+
+        Returns:
+            RbfSvmModel instance
+
+        Raises:
+            ModelIncompatibleError: If the estimator or kernel is not supported
+        """
+        kind = type(estimator).__name__
+        if kind not in ("SVC", "NuSVC") or estimator.kernel != "rbf":
+            raise ModelIncompatibleError(0, 0) from TypeError(
+                f"unsupported estimator {kind} (kernel {getattr(estimator, 'kernel', None)})"
+            )
+
+        coef, intercept = _pairwise_coefficients(
+            np.asarray(estimator.dual_coef_, dtype=np.float64),
+            np.asarray(estimator.intercept_, dtype=np.float64),
+            np.asarray(estimator.n_support_),
+        )
+        support_vectors = np.asarray(estimator.support_vectors_, dtype=np.float64)
+        return cls(
+            model_id=model_id,
+            version=version,
+            labels=labels or [str(c) for c in estimator.classes_],
+            feature_names=feature_names or [f"f{i}" for i in range(support_vectors.shape[1])],
+            support_vectors=support_vectors,
+            coef=coef,
+            intercept=intercept,
+            gamma=float(estimator._gamma),
+            scaler_mean=None if scaler is None else scaler.mean_,
+            scaler_scale=None if scaler is None else scaler.scale_,
+        )
+
+
+def _pairwise_coefficients(
+    dual_coef: np.ndarray, intercept: np.ndarray, n_support: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Spread libsvm's (C - 1) x S dual coefficients into one column per class pair.
+
+    For pair (i, j), support vectors of class i use row j - 1 and those of
+    class j use row i. scikit-learn flips the sign of binary models, so it
+    is flipped back to keep "> 0 votes for class i".
+    """
+    n_classes = n_support.size
+    offsets = np.concatenate(([0], np.cumsum(n_support)))
+    pairs = [(i, j) for i in range(n_classes) for j in range(i + 1, n_classes)]
+    coef = np.zeros((dual_coef.shape[1], len(pairs)))
+    for k, (i, j) in enumerate(pairs):
+        class_i = slice(offsets[i], offsets[i + 1])
+        class_j = slice(offsets[j], offsets[j + 1])
+        coef[class_i, k] = dual_coef[j - 1, class_i]
+        coef[class_j, k] = dual_coef[i, class_j]
+    if n_classes == 2:
+        return -coef, -intercept
+    return coef, intercept
+
+
+register_format(RbfSvmModel.FORMAT, lambda data, path, dtype: RbfSvmModel.from_dict(data, path))
@@ -0,0 +1,215 @@
+"""Model discovery, loading and process-wide sharing."""
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .error import ModelLoadError
+from .models import LinearSvmModel
+
+# Directory holding model files shipped with the package (see scripts/copy-models.py)
+PACKAGED_MODELS_DIR = Path(__file__).parent / "data"
+
+# Id of the embedded model returned by LinearSvmModel.create_default
+_EMBEDDED_DEFAULT_ID = "wesad_emotion_v1_0"
+
+# Model ids that resolve to another id
+MODEL_ALIASES = {
+    "svm_linear_wrist_sdnn_v1_0": "wesad_emotion_v1_0",
+}
+
+# Loader per model file format: (parsed JSON, file path, dtype) -> model
+ModelLoader = Callable[[Dict[str, Any], Path, str], Any]
+
+_FORMAT_LOADERS: Dict[str, ModelLoader] = {
+    "svm_json": lambda data, path, dtype: LinearSvmModel.from_dict(data, dtype=dtype),
+}
+
+# Process-wide cache of parsed models keyed by (model_id, content hash, dtype)
+_MODEL_CACHE: Dict[Tuple[str, str, str], Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def register_format(name: str, loader: ModelLoader) -> None:
+    """Register a loader for a model file format.
+
+    Args:
+        name: Value of the model file's "format" field
+        loader: Callable (parsed JSON, file path, dtype) -> model
+    """
+    _FORMAT_LOADERS[name] = loader
+
+
+def clear_model_cache() -> None:
+    """Drop all cached models (engines keep the instances they hold)."""
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE.clear()
+
+
+class ModelRegistry:
+    """Registry of available emotion models.
+
+    Models are discovered from user-supplied directories or files, the
+    package's ``data/`` directory and the embedded default model, in that
+    order of precedence. Loaded models are parsed and validated once and
+    cached process-wide by id, content hash and dtype, so every engine that
+    asks for the same model shares one frozen instance.
+    """
+
+    def __init__(
+        self,
+        search_paths: Optional[List[Union[str, Path]]] = None,
+        include_packaged: bool = True,
+    ):
+        """Initialize model registry.
+
+        Args:
+            search_paths: Directories or JSON files to search for models
+            include_packaged: Whether to include models shipped with the package
+        """
+        self._search_paths = [Path(p) for p in (search_paths or [])]
+        self._include_packaged = include_packaged
+        self._index: Optional[Dict[str, Path]] = None
+        self._lock = threading.Lock()
+
+    def add_path(self, path: Union[str, Path]) -> None:
+        """Add a directory or JSON file to search, taking precedence over earlier ones.
+
+        Args:
+            path: Directory containing model JSON files, or a single model file
+        """
+        with self._lock:
+            self._search_paths.insert(0, Path(path))
+            self._index = None
+
+    def refresh(self) -> None:
+        """Rescan search paths on next access."""
+        with self._lock:
+            self._index = None
+
+    def available(self) -> List[str]:
+        """List ids of all discoverable models.
+
+        Returns:
+            Sorted list of model ids (including aliases and embedded models)
+        """
+        ids = set(self._discover()) | set(MODEL_ALIASES) | {_EMBEDDED_DEFAULT_ID}
+        return sorted(ids)
+
+    def path_for(self, model_id: str) -> Optional[Path]:
+        """Get the file a model id resolves to.
+
+        Args:
+            model_id: Model identifier or alias
+
+        Returns:
+            Path of the model file, or None for embedded models
+        """
+        return self._discover().get(MODEL_ALIASES.get(model_id, model_id))
+
+    def load(self, model_id: str, dtype: str = "float64") -> Any:
+        """Load a model by id, reusing the process-wide cached instance.
+
+        Args:
+            model_id: Model identifier or alias
+            dtype: Floating point dtype of the model
+
+        Returns:
+            Shared, frozen model instance
+
+        Raises:
+            ModelLoadError: If the model is unknown or invalid
+        """
+        resolved_id = MODEL_ALIASES.get(model_id, model_id)
+        path = self._discover().get(resolved_id)
+
+        if path is None:
+            if resolved_id != _EMBEDDED_DEFAULT_ID:
+                raise ModelLoadError(f"unknown model '{model_id}'", {"available": self.available()})
+            return _cached(
+                (resolved_id, "embedded", dtype),
+                lambda: LinearSvmModel.create_default(dtype=dtype).freeze(),
+            )
+
+        try:
+            content = path.read_bytes()
+        except OSError as e:
+            raise ModelLoadError(f"cannot read {path}: {e}")
+        content_hash = hashlib.sha256(content).hexdigest()
+
+        def build() -> Any:
+            data = _parse(content, path)
+            model_format = data.get("format", "svm_json")
+            loader = _FORMAT_LOADERS.get(model_format)
+            if loader is None:
+                raise ModelLoadError(f"unsupported model format '{model_format}' in {path}")
+            model = loader(data, path, dtype)
+            if hasattr(model, "freeze"):
+                model.freeze()
+            return model
+
+        return _cached((resolved_id, content_hash, dtype), build)
+
+    def _discover(self) -> Dict[str, Path]:
+        """Build (once) the model id -> file index."""
+        with self._lock:
+            if self._index is not None:
+                return self._index
+
+            roots = list(self._search_paths)
+            if self._include_packaged:
+                roots.append(PACKAGED_MODELS_DIR)
+
+            index: Dict[str, Path] = {}
+            # Later roots have lower precedence, so scan them first
+            for root in reversed(roots):
+                files = sorted(root.glob("*.json")) if root.is_dir() else [root]
+                for path in files:
+                    if not path.is_file():
+                        continue
+                    try:
+                        data = _parse(path.read_bytes(), path)
+                    except (OSError, ModelLoadError):
+                        continue
+                    model_id = data.get("model_id")
+                    if isinstance(model_id, str):
+                        index[model_id] = path
+
+            self._index = index
+            return index
+
+
+def _parse(content: bytes, path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(content)
+    except ValueError as e:
+        raise ModelLoadError(f"invalid JSON in {path}: {e}")
+    if not isinstance(data, dict):
+        raise ModelLoadError(f"expected a JSON object in {path}")
+    return data
+
+
+def _cached(key: Tuple[str, str, str], build: Callable[[], Any]) -> Any:
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            model = build()
+            _MODEL_CACHE[key] = model
+        return model
+
+
+_default_registry: Optional[ModelRegistry] = None
+
+
+def default_registry() -> ModelRegistry:
+    """Get the process-wide registry used by EmotionEngine.from_pretrained.
+
+    Returns:
+        Shared ModelRegistry instance (add user paths with add_path)
+    """
+    global _default_registry
+    with _MODEL_CACHE_LOCK:
+        if _default_registry is None:
+            _default_registry = ModelRegistry()
+        return _default_registry
@@ -1,7 +1,7 @@
 """Result of emotion inference containing probabilities and metadata."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 @dataclass
@@ -56,6 +56,21 @@ class EmotionResult:
             model=model,
         )
 
+    @property
+    def model_id(self) -> str:
+        """Id of the model that produced this result."""
+        return self.model.get("id", "")
+
+    @property
+    def model_version(self) -> str:
+        """Version of the model that produced this result."""
+        return self.model.get("version", "")
+
+    @property
+    def stage(self) -> Optional[int]:
+        """Index of the cascade stage that answered (None for single models)."""
+        return self.model.get("stage")
+
     def __str__(self) -> str:
         confidence_percent = self.confidence * 100
         feature_names = ", ".join(self.features.keys())
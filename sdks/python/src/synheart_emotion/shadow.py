@@ -0,0 +1,140 @@
+"""Shadow evaluation of candidate models on the primary engine's features."""
+import queue
+import random
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .error import BadInputError, ModelIncompatibleError
+from .features import DEFAULT_FEATURE_REGISTRY
+from .result import EmotionResult
+
+# Receives (shadow result, primary result) for every evaluated shadow model
+ShadowSink = Callable[[EmotionResult, EmotionResult], None]
+
+
+class ShadowEvaluator:
+    """Runs shadow models on a background thread and reports to a sink.
+
+    Pass one to EmotionEngine (``shadow=``): the engine then extracts the
+    union of primary and shadow features once per window, emits the primary
+    result as usual and hands the features to this evaluator. Shadow
+    predictions never block the primary path; when the queue is full the
+    window is dropped for shadow purposes and counted. One evaluator (and
+    thread) can be shared by many engines.
+    """
+
+    def __init__(
+        self,
+        models: List[Any],
+        sink: ShadowSink,
+        sample_rate: float = 1.0,
+        max_queue: int = 1024,
+        seed: Optional[int] = None,
+    ):
+        """Initialize shadow evaluator.
+
+        Args:
+            models: Shadow models (any model with predict, get_metadata and feature_names)
+            sink: Callable receiving (shadow result, primary result)
+            sample_rate: Fraction of windows to evaluate (0.0-1.0)
+            max_queue: Maximum windows waiting for evaluation
+            seed: Optional seed for the sampling decision
+
+        Raises:
+            ModelIncompatibleError: If a model needs unregistered features
+            BadInputError: If sample_rate is outside 0.0-1.0
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise BadInputError("sample_rate must be between 0.0 and 1.0")
+
+        registered = DEFAULT_FEATURE_REGISTRY.feature_names
+        for model in models:
+            supported = [name for name in model.feature_names if name in registered]
+            if len(supported) != len(model.feature_names):
+                raise ModelIncompatibleError(len(supported), len(model.feature_names))
+
+        self.models = list(models)
+        self.sink = sink
+        self.sample_rate = sample_rate
+        self.feature_names = list(
+            dict.fromkeys(name for model in self.models for name in model.feature_names)
+        )
+
+        self._random = random.Random(seed)
+        self._queue: "queue.Queue[Tuple[datetime, Dict[str, float], EmotionResult]]" = queue.Queue(
+            maxsize=max_queue
+        )
+        self._stats_lock = threading.Lock()
+        self._stats = {"submitted": 0, "sampled_out": 0, "dropped": 0, "evaluated": 0, "errors": 0}
+        self._thread = threading.Thread(target=self._run, name="synheart-shadow", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self, timestamp: datetime, features: Dict[str, float], primary: EmotionResult
+    ) -> bool:
+        """Queue one window for shadow evaluation without blocking.
+
+        Args:
+            timestamp: Timestamp of the primary emission
+            features: Features extracted for the window (shared, not copied)
+            primary: Result emitted by the primary model
+
+        Returns:
+            True if the window was queued
+        """
+        with self._stats_lock:
+            self._stats["submitted"] += 1
+            if self.sample_rate < 1.0 and self._random.random() >= self.sample_rate:
+                self._stats["sampled_out"] += 1
+                return False
+
+        try:
+            self._queue.put_nowait((timestamp, features, primary))
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["dropped"] += 1
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Block until every queued window has been evaluated."""
+        self._queue.join()
+
+    def stats(self) -> Dict[str, int]:
+        """Get evaluation counters.
+
+        Returns:
+            Dictionary of submitted, sampled_out, dropped, evaluated and errors counts
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _run(self) -> None:
+        while True:
+            timestamp, features, primary = self._queue.get()
+            try:
+                for model in self.models:
+                    self._evaluate(model, timestamp, features, primary)
+            finally:
+                self._queue.task_done()
+
+    def _evaluate(
+        self, model: Any, timestamp: datetime, features: Dict[str, float], primary: EmotionResult
+    ) -> None:
+        try:
+            model_features = {name: features[name] for name in model.feature_names}
+            result = EmotionResult.from_inference(
+                timestamp=timestamp,
+                probabilities=model.predict(model_features),
+                features=model_features,
+                model=model.get_metadata(),
+            )
+            self.sink(result, primary)
+        except Exception:
+            with self._stats_lock:
+                self._stats["errors"] += 1
+            return
+
+        with self._stats_lock:
+            self._stats["evaluated"] += 1
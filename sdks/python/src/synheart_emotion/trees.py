@@ -0,0 +1,610 @@
+"""Dependency-light tree-ensemble inference on flat NumPy arrays."""
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .error import BadInputError, ModelIncompatibleError, ModelLoadError
+from .features import FeatureExtractor
+from .registry import register_format
+
+
+class TreeEnsembleModel:
+    """Tree ensemble flattened into per-node arrays.
+
+    All trees share one set of node arrays; ``roots`` holds each tree's root
+    index. Leaves point to themselves, so stepping every (row, tree) pair one
+    level at a time is idempotent once a leaf is reached. Converted from
+    scikit-learn (DecisionTree, ExtraTrees, RandomForest, GradientBoosting,
+    AdaBoost) or XGBoost models with from_sklearn / from_xgboost; those
+    libraries are only needed for conversion, not inference.
+
+    Attributes:
+        model_id: Model identifier
+        version: Model version
+        labels: Class labels, in output order
+        feature_names: Feature names in order
+        feature: Split feature per node (0 for leaves)
+        threshold: Split threshold per node
+        left: Left child per node (self for leaves)
+        right: Right child per node (self for leaves)
+        value: Per-node output vector (nodes x classes; used at leaves)
+        roots: Root node of each tree
+        aggregation: "mean_proba" (average leaf distributions) or
+            "sum_softmax" (softmax of base_score plus summed leaf values)
+        base_score: Initial raw score per class for "sum_softmax"
+        missing_left: Per-node direction for NaN inputs (True = left)
+        decision: "le" (x <= threshold goes left, scikit-learn) or "lt" (XGBoost)
+        scaler_mean: Optional standardization mean applied before traversal
+        scaler_scale: Optional standardization scale applied before traversal
+        input_dtype: dtype inputs are rounded to before comparing, matching the
+            float32 casting done by scikit-learn and XGBoost
+    """
+
+    FORMAT = "tree_ensemble"
+    AGGREGATIONS = ("mean_proba", "sum_softmax")
+
+    # Upper bound on (rows x trees x classes) gathered per traversal chunk
+    _CHUNK_ELEMENTS = 4_000_000
+
+    def __init__(
+        self,
+        model_id: str,
+        version: str,
+        labels: List[str],
+        feature_names: List[str],
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        aggregation: str = "mean_proba",
+        base_score: Optional[Sequence[float]] = None,
+        missing_left: Optional[np.ndarray] = None,
+        decision: str = "le",
+        scaler_mean: Optional[Sequence[float]] = None,
+        scaler_scale: Optional[Sequence[float]] = None,
+        input_dtype: str = "float32",
+    ):
+        self.model_id = model_id
+        self.version = version
+        self.labels = list(labels)
+        self.feature_names = list(feature_names)
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.value = np.asarray(value, dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.aggregation = aggregation
+        self.base_score = (
+            np.zeros(len(self.labels))
+            if base_score is None
+            else np.asarray(base_score, dtype=np.float64)
+        )
+        self.missing_left = None if missing_left is None else np.asarray(missing_left, dtype=bool)
+        self.decision = decision
+        self.scaler_mean = None if scaler_mean is None else np.asarray(scaler_mean, np.float64)
+        self.scaler_scale = None if scaler_scale is None else np.asarray(scaler_scale, np.float64)
+        self.input_dtype = np.dtype(input_dtype)
+
+        n_nodes = self.feature.size
+        if aggregation not in self.AGGREGATIONS:
+            raise ModelLoadError(f"unknown aggregation '{aggregation}'")
+        if decision not in ("le", "lt"):
+            raise ModelLoadError(f"unknown decision rule '{decision}'")
+        for name in ("threshold", "left", "right"):
+            if getattr(self, name).shape != (n_nodes,):
+                raise ModelLoadError(f"'{name}' must have one entry per node")
+        if self.value.shape != (n_nodes, len(self.labels)):
+            raise ModelIncompatibleError(len(self.labels), self.value.shape[-1])
+        if self.base_score.shape != (len(self.labels),):
+            raise ModelIncompatibleError(len(self.labels), self.base_score.size)
+
+        self.max_depth = self._compute_max_depth()
+
+    @property
+    def n_trees(self) -> int:
+        """Number of trees in the ensemble."""
+        return int(self.roots.size)
+
+    def _compute_max_depth(self) -> int:
+        """Depth of the deepest leaf, i.e. the number of traversal steps needed."""
+        nodes = np.unique(self.roots)
+        depth = 0
+        while nodes.size:
+            internal = nodes[self.left[nodes] != nodes]
+            if internal.size == 0:
+                break
+            nodes = np.unique(np.concatenate((self.left[internal], self.right[internal])))
+            depth += 1
+            if depth > self.feature.size:
+                raise ModelLoadError("tree arrays contain a cycle")
+        return depth
+
+    def _prepare(self, features: np.ndarray) -> np.ndarray:
+        """Standardize and round inputs the way the source library does."""
+        features = np.array(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != len(self.feature_names):
+            actual = features.shape[-1] if features.ndim else 0
+            raise ModelIncompatibleError(len(self.feature_names), actual)
+        if self.scaler_mean is not None:
+            features -= self.scaler_mean
+        if self.scaler_scale is not None:
+            features /= self.scaler_scale
+        return features.astype(self.input_dtype).astype(np.float64)
+
+    def apply(self, features: np.ndarray) -> np.ndarray:
+        """Find the leaf each row reaches in each tree.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+
+        Returns:
+            N x T matrix of leaf node indices
+        """
+        return self._traverse(self._prepare(features))
+
+    def _traverse(self, features: np.ndarray) -> np.ndarray:
+        """Step every (row, tree) pair down one level per iteration."""
+        nodes = np.repeat(self.roots[np.newaxis, :], features.shape[0], axis=0)
+        rows = np.arange(features.shape[0])[:, np.newaxis]
+        missing = np.isnan(features).any() and self.missing_left is not None
+
+        for _ in range(self.max_depth):
+            x = features[rows, self.feature[nodes]]
+            threshold = self.threshold[nodes]
+            go_left = x <= threshold if self.decision == "le" else x < threshold
+            if missing:
+                go_left = np.where(np.isnan(x), self.missing_left[nodes], go_left)
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        return nodes
+
+    def predict_batch(self, features: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predict class probabilities for many raw feature vectors.
+
+        Args:
+            features: N x F matrix of raw features ordered as feature_names
+            out: Optional N x C float64 buffer to write probabilities into
+
+        Returns:
+            N x C probabilities ordered as labels (out, if given)
+
+        Raises:
+            ModelIncompatibleError: If the feature dimension does not match
+            BadInputError: If out has the wrong shape or dtype
+        """
+        prepared = self._prepare(features)
+        shape = (prepared.shape[0], len(self.labels))
+        if out is None:
+            out = np.empty(shape)
+        elif out.shape != shape or out.dtype != np.float64:
+            raise BadInputError(f"out must have shape {shape} and dtype float64")
+
+        chunk = max(1, self._CHUNK_ELEMENTS // max(1, self.n_trees * len(self.labels)))
+        for start in range(0, prepared.shape[0], chunk):
+            leaves = self._traverse(prepared[start : start + chunk])
+            out[start : start + chunk] = self.value[leaves].sum(axis=1)
+
+        if self.aggregation == "mean_proba":
+            out /= self.n_trees
+        else:
+            out += self.base_score
+            out -= out.max(axis=1, keepdims=True)
+            np.exp(out, out=out)
+            out /= out.sum(axis=1, keepdims=True)
+        return out
+
+    def predict_vector(self, features: np.ndarray) -> np.ndarray:
+        """Predict class probabilities for one raw feature vector.
+
+        Args:
+            features: Feature values ordered as feature_names
+
+        Returns:
+            Probabilities ordered as labels
+        """
+        return self.predict_batch(np.asarray(features)[np.newaxis, :])[0]
+
+    def predict(self, features: Dict[str, float]) -> Dict[str, float]:
+        """Predict emotion probabilities from features.
+
+        Args:
+            features: Dictionary of feature values
+
+        Returns:
+            Dictionary of emotion probabilities
+
+        Raises:
+            BadInputError: If features are invalid or missing
+        """
+        if not FeatureExtractor.validate_features(features, self.feature_names):
+            raise BadInputError("Invalid features: missing required features or NaN values")
+
+        vector = np.array([features[name] for name in self.feature_names])
+        return dict(zip(self.labels, self.predict_vector(vector).tolist()))
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get model metadata.
+
+        Returns:
+            Dictionary of model metadata
+        """
+        return {
+            "id": self.model_id,
+            "version": self.version,
+            "type": self.FORMAT,
+            "labels": self.labels,
+            "feature_names": self.feature_names,
+            "num_classes": len(self.labels),
+            "num_features": len(self.feature_names),
+            "num_trees": self.n_trees,
+            "num_nodes": int(self.feature.size),
+        }
+
+    def validate(self) -> bool:
+        """Validate model integrity.
+
+        Returns:
+            True if model is valid
+        """
+        n_nodes = self.feature.size
+        if n_nodes == 0 or self.n_trees == 0:
+            return False
+        for children in (self.left, self.right, self.roots):
+            if children.min() < 0 or children.max() >= n_nodes:
+                return False
+        if self.feature.min() < 0 or self.feature.max() >= len(self.feature_names):
+            return False
+        return bool(np.all(np.isfinite(self.value)) and np.all(np.isfinite(self.base_score)))
+
+    def freeze(self) -> "TreeEnsembleModel":
+        """Mark arrays read-only so the model can be shared safely.
+
+        Returns:
+            This model
+        """
+        for array in self._arrays().values():
+            array.flags.writeable = False
+        return self
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {
+            "feature": self.feature,
+            "threshold": self.threshold,
+            "left": self.left,
+            "right": self.right,
+            "value": self.value,
+            "roots": self.roots,
+            "base_score": self.base_score,
+        }
+        if self.missing_left is not None:
+            arrays["missing_left"] = self.missing_left
+        if self.scaler_mean is not None:
+            arrays["scaler_mean"] = self.scaler_mean
+        if self.scaler_scale is not None:
+            arrays["scaler_scale"] = self.scaler_scale
+        return arrays
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Save as a JSON descriptor plus a sibling ``.npz`` array file.
+
+        The descriptor carries ``"format": "tree_ensemble"`` so ModelRegistry
+        can discover it alongside ``svm_json`` models.
+
+        Args:
+            path: Path of the JSON descriptor to write
+
+        Returns:
+            Path of the written descriptor
+        """
+        path = Path(path)
+        arrays_path = path.with_suffix(".npz")
+        np.savez_compressed(arrays_path, **self._arrays())
+
+        descriptor = {
+            "model_id": self.model_id,
+            "version": self.version,
+            "format": self.FORMAT,
+            "feature_order": self.feature_names,
+            "classes": self.labels,
+            "aggregation": self.aggregation,
+            "decision": self.decision,
+            "input_dtype": self.input_dtype.name,
+            "num_trees": self.n_trees,
+            "arrays": arrays_path.name,
+        }
+        with open(path, "w") as f:
+            json.dump(descriptor, f, indent=2)
+        return path
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], path: Union[str, Path]) -> "TreeEnsembleModel":
+        """Create a model from a parsed descriptor and its array file.
+
+        Args:
+            data: Parsed JSON descriptor
+            path: Path of the descriptor (the array file is resolved next to it)
+
+        Returns:
+            TreeEnsembleModel instance
+
+        Raises:
+            ModelLoadError: If the descriptor or arrays are missing or invalid
+        """
+        arrays_path = Path(path).parent / data.get("arrays", Path(path).with_suffix(".npz").name)
+        try:
+            with np.load(arrays_path) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+            model = cls(
+                model_id=str(data["model_id"]),
+                version=str(data.get("version", "1.0")),
+                labels=data["classes"],
+                feature_names=data["feature_order"],
+                aggregation=data.get("aggregation", "mean_proba"),
+                decision=data.get("decision", "le"),
+                input_dtype=data.get("input_dtype", "float32"),
+                **arrays,
+            )
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            raise ModelLoadError(f"cannot load tree ensemble from {arrays_path}: {e}")
+
+        if not model.validate():
+            raise ModelLoadError(f"model '{model.model_id}' failed validation")
+        return model
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TreeEnsembleModel":
+        """Load a model saved with save().
+
+        Args:
+            path: Path of the JSON descriptor
+
+        Returns:
+            TreeEnsembleModel instance
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ModelLoadError(f"cannot read {path}: {e}")
+        return cls.from_dict(data, path)
+
+    @classmethod
+    def from_sklearn(
+        cls,
+        estimator: Any,
+        model_id: str,
+        feature_names: Optional[List[str]] = None,
+        labels: Optional[List[str]] = None,
+        scaler: Any = None,
+        version: str = "1.0",
+    ) -> "TreeEnsembleModel":
+        """Flatten a fitted scikit-learn tree classifier.
+
+        Supports DecisionTreeClassifier, ExtraTreeClassifier,
+        RandomForestClassifier, ExtraTreesClassifier,
+        GradientBoostingClassifier and (SAMME) AdaBoostClassifier with tree
+        base estimators. scikit-learn itself is not imported.
+
+        Args:
+            estimator: Fitted classifier
+            model_id: Model identifier
+            feature_names: Feature names (default: f0..fN)
+            labels: Class labels (default: str(estimator.classes_))
+            scaler: Optional fitted StandardScaler applied before the estimator
+            version: Model version
+
+        Returns:
+            TreeEnsembleModel instance
+
+        Raises:
+            ModelIncompatibleError: If the estimator type is not supported
+        """
+        kind = type(estimator).__name__
+        n_classes = len(estimator.classes_)
+        builder = _TreeBuilder(n_classes)
+        aggregation = "mean_proba"
+        base_score = None
+
+        if kind in ("DecisionTreeClassifier", "ExtraTreeClassifier"):
+            builder.add_sklearn_tree(estimator.tree_, _normalized_leaf_values(estimator.tree_))
+        elif kind in ("RandomForestClassifier", "ExtraTreesClassifier"):
+            for tree in estimator.estimators_:
+                builder.add_sklearn_tree(tree.tree_, _normalized_leaf_values(tree.tree_))
+        elif kind == "GradientBoostingClassifier":
+            aggregation = "sum_softmax"
+            probe = np.zeros((1, estimator.n_features_in_))
+            base_score = estimator._raw_predict_init(probe)[0]
+            if base_score.size != n_classes:
+                raise ModelIncompatibleError(n_classes, base_score.size)
+            for stage in estimator.estimators_:
+                for k, tree in enumerate(stage):
+                    leaf = tree.tree_.value[:, 0, 0] * estimator.learning_rate
+                    values = np.zeros((leaf.size, n_classes))
+                    values[:, k] = leaf
+                    builder.add_sklearn_tree(tree.tree_, values)
+        elif kind == "AdaBoostClassifier":
+            # SAMME: each tree votes w for its class and -w / (K - 1) for the rest;
+            # predict_proba is softmax(decision / (K - 1)) with decision / sum(w)
+            aggregation = "sum_softmax"
+            weights = np.asarray(estimator.estimator_weights_, dtype=np.float64)
+            scale = 1.0 / (weights.sum() * max(1, n_classes - 1))
+            for tree, weight in zip(estimator.estimators_, weights):
+                votes = np.argmax(tree.tree_.value[:, 0, :], axis=1)
+                values = np.full((votes.size, n_classes), -weight / max(1, n_classes - 1))
+                values[np.arange(votes.size), votes] = weight
+                builder.add_sklearn_tree(tree.tree_, values * scale)
+        else:
+            raise ModelIncompatibleError(0, 0) from TypeError(f"unsupported estimator {kind}")
+
+        n_features = int(estimator.n_features_in_)
+        return cls(
+            model_id=model_id,
+            version=version,
+            labels=labels or [str(c) for c in estimator.classes_],
+            feature_names=feature_names or [f"f{i}" for i in range(n_features)],
+            aggregation=aggregation,
+            base_score=base_score,
+            decision="le",
+            scaler_mean=None if scaler is None else scaler.mean_,
+            scaler_scale=None if scaler is None else scaler.scale_,
+            **builder.arrays(),
+        )
+
+    @classmethod
+    def from_xgboost(
+        cls,
+        model: Any,
+        model_id: str,
+        feature_names: Optional[List[str]] = None,
+        labels: Optional[List[str]] = None,
+        scaler: Any = None,
+        version: str = "1.0",
+    ) -> "TreeEnsembleModel":
+        """Flatten a fitted XGBoost multi:softprob classifier or booster.
+
+        Args:
+            model: XGBClassifier or Booster
+            model_id: Model identifier
+            feature_names: Feature names (default: f0..fN)
+            labels: Class labels (default: class indices)
+            scaler: Optional fitted StandardScaler applied before the model
+            version: Model version
+
+        Returns:
+            TreeEnsembleModel instance
+
+        Raises:
+            ModelIncompatibleError: If the objective is not a multiclass softmax
+        """
+        booster = model.get_booster() if hasattr(model, "get_booster") else model
+        config = json.loads(booster.save_config())
+        learner = config["learner"]
+        objective = learner["objective"]["name"]
+        if objective not in ("multi:softprob", "multi:softmax"):
+            raise ModelIncompatibleError(0, 0) from TypeError(f"unsupported objective {objective}")
+
+        params = learner["learner_model_param"]
+        n_classes = int(params["num_class"])
+        n_features = int(params["num_feature"])
+        base_score = np.atleast_1d(np.asarray(json.loads(params["base_score"]), dtype=np.float64))
+        base_score = np.broadcast_to(base_score, (n_classes,)).copy()
+
+        names = booster.feature_names
+        builder = _TreeBuilder(n_classes)
+        for i, dump in enumerate(booster.get_dump(dump_format="json")):
+            builder.add_xgboost_tree(json.loads(dump), i % n_classes, names)
+
+        return cls(
+            model_id=model_id,
+            version=version,
+            labels=labels or [str(k) for k in range(n_classes)],
+            feature_names=feature_names or names or [f"f{i}" for i in range(n_features)],
+            aggregation="sum_softmax",
+            base_score=base_score,
+            decision="lt",
+            scaler_mean=None if scaler is None else scaler.mean_,
+            scaler_scale=None if scaler is None else scaler.scale_,
+            **builder.arrays(),
+        )
+
+
+def _normalized_leaf_values(tree: Any) -> np.ndarray:
+    """Per-node class distribution of a scikit-learn classification tree."""
+    values = np.asarray(tree.value[:, 0, :], dtype=np.float64)
+    totals = values.sum(axis=1, keepdims=True)
+    return np.divide(values, totals, out=np.zeros_like(values), where=totals > 0)
+
+
+class _TreeBuilder:
+    """Accumulates trees into shared flat node arrays."""
+
+    def __init__(self, n_classes: int):
+        self.n_classes = n_classes
+        self._feature: List[np.ndarray] = []
+        self._threshold: List[np.ndarray] = []
+        self._left: List[np.ndarray] = []
+        self._right: List[np.ndarray] = []
+        self._missing_left: List[np.ndarray] = []
+        self._value: List[np.ndarray] = []
+        self._roots: List[int] = []
+        self._offset = 0
+
+    def _add(self, feature, threshold, left, right, missing_left, value) -> None:
+        n_nodes = len(feature)
+        local = np.arange(n_nodes)
+        leaf = np.asarray(left) < 0
+
+        self._roots.append(self._offset)
+        self._feature.append(np.where(leaf, 0, feature))
+        self._threshold.append(np.where(leaf, 0.0, threshold))
+        self._left.append(np.where(leaf, local, left) + self._offset)
+        self._right.append(np.where(leaf, local, right) + self._offset)
+        self._missing_left.append(np.asarray(missing_left, dtype=bool))
+        self._value.append(value)
+        self._offset += n_nodes
+
+    def add_sklearn_tree(self, tree: Any, value: np.ndarray) -> None:
+        missing_left = getattr(tree, "missing_go_to_left", np.zeros(tree.node_count, dtype=bool))
+        self._add(
+            tree.feature,
+            tree.threshold,
+            tree.children_left,
+            tree.children_right,
+            missing_left,
+            value,
+        )
+
+    def add_xgboost_tree(self, root: Dict[str, Any], k: int, names: Optional[List[str]]) -> None:
+        nodes: Dict[int, Dict[str, Any]] = {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            nodes[node["nodeid"]] = node
+            stack.extend(node.get("children", []))
+
+        # Renumber node ids densely; the root keeps index 0
+        order = sorted(nodes)
+        index = {node_id: i for i, node_id in enumerate(order)}
+        n_nodes = len(order)
+        feature = np.zeros(n_nodes, dtype=np.int64)
+        threshold = np.zeros(n_nodes)
+        left = np.full(n_nodes, -1)
+        right = np.full(n_nodes, -1)
+        missing_left = np.zeros(n_nodes, dtype=bool)
+        value = np.zeros((n_nodes, self.n_classes))
+
+        for node_id in order:
+            node = nodes[node_id]
+            i = index[node_id]
+            if "leaf" in node:
+                value[i, k] = float(np.float32(node["leaf"]))
+                continue
+            split = node["split"]
+            feature[i] = names.index(split) if names else int(str(split).lstrip("f"))
+            threshold[i] = float(np.float32(node["split_condition"]))
+            left[i] = index[node["yes"]]
+            right[i] = index[node["no"]]
+            missing_left[i] = node["missing"] == node["yes"]
+
+        self._add(feature, threshold, left, right, missing_left, value)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "feature": np.concatenate(self._feature),
+            "threshold": np.concatenate(self._threshold),
+            "left": np.concatenate(self._left),
+            "right": np.concatenate(self._right),
+            "missing_left": np.concatenate(self._missing_left),
+            "value": np.concatenate(self._value),
+            "roots": np.asarray(self._roots),
+        }
+
+
+register_format(
+    TreeEnsembleModel.FORMAT, lambda data, path, dtype: TreeEnsembleModel.from_dict(data, path)
+)
@@ -0,0 +1,60 @@
+"""Tests for the feature cache."""
+from synheart_emotion import FeatureCache, FeatureExtractor
+
+HR_VALUES = [70.0, 72.0, 68.0]
+RR_INTERVALS = [800.0, 820.0, 810.0, 830.0, 815.0]
+
+
+def test_cache_hit_and_miss():
+    """Test hit/miss counting and result equality."""
+    cache = FeatureCache()
+
+    first = cache.extract_features(HR_VALUES, RR_INTERVALS)
+    second = cache.extract_features(HR_VALUES, RR_INTERVALS)
+
+    assert first == second == FeatureExtractor.extract_features(HR_VALUES, RR_INTERVALS)
+    assert cache.misses == 1
+    assert cache.hits == 1
+
+
+def test_cache_returns_copies():
+    """Test that mutating a returned dict does not corrupt the cache."""
+    cache = FeatureCache()
+
+    cache.extract_features(HR_VALUES, RR_INTERVALS)["hr_mean"] = -1.0
+
+    assert cache.extract_features(HR_VALUES, RR_INTERVALS)["hr_mean"] == 70.0
+
+
+def test_cache_key_depends_on_content():
+    """Test that different windows and feature sets get different keys."""
+    key = FeatureCache.make_key(HR_VALUES, RR_INTERVALS)
+
+    assert key == FeatureCache.make_key(list(HR_VALUES), tuple(RR_INTERVALS))
+    assert key != FeatureCache.make_key(HR_VALUES, RR_INTERVALS[:-1])
+    assert key != FeatureCache.make_key(HR_VALUES, RR_INTERVALS, feature_names=["sdnn"])
+    assert key != FeatureCache.make_key(HR_VALUES, RR_INTERVALS, dtype="float32")
+
+
+def test_cache_lru_eviction():
+    """Test that the byte budget evicts least recently used entries."""
+    cache = FeatureCache(max_bytes=1)
+
+    cache.extract_features(HR_VALUES, RR_INTERVALS)
+    cache.extract_features(HR_VALUES, RR_INTERVALS[1:])
+
+    assert len(cache) == 0
+    assert cache.evictions == 2
+    assert cache.stats()["bytes"] == 0
+
+
+def test_cache_disk_tier(tmp_path):
+    """Test that the disk tier serves entries to a fresh cache."""
+    FeatureCache(disk_dir=tmp_path).extract_features(HR_VALUES, RR_INTERVALS)
+
+    cache = FeatureCache(disk_dir=tmp_path)
+    features = cache.extract_features(HR_VALUES, RR_INTERVALS)
+
+    assert features == FeatureExtractor.extract_features(HR_VALUES, RR_INTERVALS)
+    assert cache.disk_hits == 1
+    assert cache.misses == 0
@@ -0,0 +1,139 @@
+"""Tests for the confidence-gated model cascade."""
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from synheart_emotion import (
+    CascadeModel,
+    EmotionConfig,
+    EmotionEngine,
+    LinearSvmModel,
+    ModelRegistry,
+)
+from synheart_emotion.error import BadInputError, ModelIncompatibleError, ModelLoadError
+
+
+def _fast_model(slope=1.0):
+    """P(Calm) = sigmoid(2 * slope * hr_mean): confident only far from hr_mean = 0."""
+    return LinearSvmModel(
+        model_id="fast",
+        version="1.0",
+        labels=["Calm", "Stress"],
+        feature_names=["hr_mean", "sdnn"],
+        weights=[[slope, 0.0], [-slope, 0.0]],
+        biases=[0.0, 0.0],
+        mu={},
+        sigma={},
+    )
+
+
+def _slow_model():
+    """Constant P(Stress) = 0.75, with labels and features in another order."""
+    return LinearSvmModel(
+        model_id="slow",
+        version="1.0",
+        labels=["Stress", "Calm"],
+        feature_names=["rmssd", "hr_mean"],
+        weights=[[0.0, 0.0], [0.0, 0.0]],
+        biases=[np.log(3.0), 0.0],
+        mu={},
+        sigma={},
+    )
+
+
+def test_gating_and_stats():
+    """Test that only unsure rows escalate and that counters follow."""
+    cascade = CascadeModel("cascade", [_fast_model(), _slow_model()], min_confidence=0.9)
+    assert cascade.feature_names == ["hr_mean", "sdnn", "rmssd"]
+
+    X = np.array([[3.0, 0.0, 0.0], [0.1, 0.0, 0.0], [-3.0, 0.0, 0.0]])
+    probabilities, stages = cascade.predict_stages(X)
+
+    np.testing.assert_array_equal(stages, [0, 1, 0])
+    np.testing.assert_allclose(probabilities[1], [0.25, 0.75])
+    assert probabilities[0, 0] > 0.9 and probabilities[2, 1] > 0.9
+
+    stats = cascade.stats()
+    assert stats["predictions"] == 3
+    assert stats["answered"] == [2, 1]
+    assert stats["escalation_rate"] == pytest.approx(1 / 3)
+    assert stats["avg_latency_saved_ms"] >= 0.0
+
+    cascade.reset_stats()
+    assert cascade.stats()["predictions"] == 0
+
+
+def test_margin_gate():
+    """Test that a small top-2 margin escalates even when confidence passes."""
+    cascade = CascadeModel("cascade", [_fast_model(), _slow_model()], 0.5, min_margin=0.5)
+
+    probabilities, metadata = cascade.predict_with_metadata(
+        {"hr_mean": 0.2, "sdnn": 0.0, "rmssd": 0.0}
+    )
+    assert metadata["stage"] == 1
+    assert metadata["stage_id"] == "slow"
+    assert probabilities == pytest.approx({"Calm": 0.25, "Stress": 0.75})
+    assert cascade.predict({"hr_mean": 2.0, "sdnn": 0.0, "rmssd": 0.0})["Calm"] > 0.9
+
+
+def test_validation_errors():
+    """Test stage, threshold and input validation."""
+    with pytest.raises(ModelLoadError):
+        CascadeModel("cascade", [_fast_model()])
+    with pytest.raises(ModelLoadError):
+        CascadeModel("cascade", [_fast_model(), _slow_model()], min_confidence=1.5)
+
+    other_labels = _slow_model()
+    other_labels.labels = ["Stress", "Amused"]
+    with pytest.raises(ModelIncompatibleError):
+        CascadeModel("cascade", [_fast_model(), other_labels])
+
+    cascade = CascadeModel("cascade", [_fast_model(), _slow_model()])
+    with pytest.raises(ModelIncompatibleError):
+        cascade.predict_batch(np.zeros((2, 2)))
+    with pytest.raises(BadInputError):
+        cascade.predict_batch(np.zeros((2, 3)), out=np.zeros((2, 3)))
+    with pytest.raises(BadInputError):
+        cascade.predict({"hr_mean": 1.0})
+
+
+def test_engine_records_answering_stage():
+    """Test that engine results carry the stage that answered."""
+    cascade = CascadeModel("cascade", [_fast_model(slope=0.0), _slow_model()])
+    engine = EmotionEngine(EmotionConfig(), cascade)
+
+    rr = [800.0, 870.0, 790.0, 860.0, 805.0, 850.0, 810.0, 880.0, 800.0, 845.0]
+    for hr in (70.0, 72.0, 71.0):
+        engine.push(hr=hr, rr_intervals_ms=rr * 3, timestamp=datetime.now())
+    results = engine.consume_ready()
+
+    assert len(results) == 1
+    assert results[0].stage == 1
+    assert results[0].model["stage_id"] == "slow"
+    assert results[0].emotion == "Stress"
+
+
+def test_save_load_and_registry(tmp_path):
+    """Test that a saved cascade resolves its stages by id next to the descriptor."""
+    for stage in (_fast_model(), _slow_model()):
+        with open(tmp_path / f"{stage.model_id}.json", "w") as f:
+            json.dump(stage.to_dict(), f)
+    CascadeModel("cascade", [_fast_model(), _slow_model()], 0.7, 0.1).save(
+        tmp_path / "cascade.json"
+    )
+
+    loaded = CascadeModel.load(tmp_path / "cascade.json")
+    assert [stage.model_id for stage in loaded.stages] == ["fast", "slow"]
+    assert (loaded.min_confidence, loaded.min_margin) == (0.7, 0.1)
+
+    registry = ModelRegistry(search_paths=[tmp_path], include_packaged=False)
+    shared = registry.load("cascade", dtype="float32")
+    assert isinstance(shared, CascadeModel)
+    assert shared.stages[0].weights.dtype == np.float32
+    assert not shared.stages[0].weights.flags.writeable
+
+    (tmp_path / "slow.json").unlink()
+    with pytest.raises(ModelLoadError):
+        CascadeModel.load(tmp_path / "cascade.json")
@@ -1,9 +1,11 @@
 """Tests for emotion engine."""
 from datetime import datetime
 
+import numpy as np
 import pytest
 
-from synheart_emotion import EmotionConfig, EmotionEngine, EmotionError
+from synheart_emotion import EmotionConfig, EmotionEngine, EmotionError, LinearSvmModel
+from synheart_emotion.error import ModelIncompatibleError, ModelLoadError
 
 
 def test_engine_creation():
@@ -132,3 +134,67 @@ def test_engine_empty_rr():
 
     # Should log warning
     assert any("Empty RR" in msg for level, msg in log_messages)
+
+
+def _push_window(engine):
+    rr = [800.0, 870.0, 790.0, 860.0, 805.0, 850.0, 810.0, 880.0, 800.0, 845.0]
+    for hr in (70.0, 72.0, 71.0):
+        engine.push(hr=hr, rr_intervals_ms=rr * 3, timestamp=datetime.now())
+
+
+def _custom_model(model_id, feature_names=("hr_mean", "sdnn", "rmssd")):
+    count = len(feature_names)
+    return LinearSvmModel(
+        model_id=model_id,
+        version="2.0",
+        labels=["Amused", "Calm", "Stressed"],
+        feature_names=list(feature_names),
+        weights=[[0.1] * count, [0.0] * count, [-0.1] * count],
+        biases=[0.0, 0.5, 0.0],
+        mu={name: 0.0 for name in feature_names},
+        sigma={name: 1.0 for name in feature_names},
+    )
+
+
+def test_engine_swap_model_keeps_window():
+    """Test that swapping the model keeps buffered data and tags results."""
+    engine = EmotionEngine.from_pretrained(EmotionConfig())
+    _push_window(engine)
+    old_model = engine.model
+
+    previous = engine.swap_model(_custom_model("custom_v2"))
+
+    assert previous is old_model
+    assert engine.get_buffer_stats()["count"] == 3
+    results = engine.consume_ready()
+    assert len(results) == 1
+    assert results[0].model_id == "custom_v2"
+    assert results[0].model_version == "2.0"
+
+
+def test_engine_swap_model_rejects_bad_model():
+    """Test that incompatible or failing models leave engines unchanged."""
+    engines = [EmotionEngine.from_pretrained(EmotionConfig()) for _ in range(3)]
+    models = [engine.model for engine in engines]
+
+    with pytest.raises(ModelIncompatibleError):
+        EmotionEngine.swap_models(engines, _custom_model("bad", ["hr_mean", "unknown"]))
+
+    broken = _custom_model("broken")
+    broken.biases[0] = float("nan")
+    with pytest.raises(ModelLoadError):
+        EmotionEngine.swap_models(engines, broken)
+
+    assert [engine.model for engine in engines] == models
+
+
+def test_engine_swap_models_many_engines():
+    """Test swapping one model into several engines at once."""
+    engines = [EmotionEngine.from_pretrained(EmotionConfig()) for _ in range(2)]
+    engines.append(EmotionEngine.from_pretrained(EmotionConfig(dtype="float32")))
+
+    EmotionEngine.swap_models(engines, _custom_model("custom_v2"))
+
+    assert all(engine.model.model_id == "custom_v2" for engine in engines)
+    assert engines[0].model is engines[1].model
+    assert engines[2].model.weights.dtype == np.float32
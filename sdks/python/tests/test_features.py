@@ -1,7 +1,9 @@
 """Tests for feature extraction."""
+import numpy as np
 import pytest
 
-from synheart_emotion.features import FeatureExtractor
+from synheart_emotion.error import BadInputError, FeatureExtractionError
+from synheart_emotion.features import DEFAULT_FEATURE_REGISTRY, FeatureExtractor, FeatureRegistry
 
 
 def test_extract_hr_mean():
@@ -90,3 +92,135 @@ def test_normalize_features():
     # Should be normalized (approximately)
     assert normalized["hr_mean"] < 0  # Below mean
     assert abs(normalized["sdnn"]) < 0.1  # Near mean
+
+
+def test_extract_features_subset():
+    """Test extracting only the requested features."""
+    rr_intervals = [800.0, 820.0, 810.0, 830.0, 815.0]
+
+    features = FeatureExtractor.extract_features([70.0], rr_intervals, feature_names=["rmssd"])
+
+    assert list(features.keys()) == ["rmssd"]
+    assert features["rmssd"] == FeatureExtractor.extract_rmssd(rr_intervals)
+
+
+def test_registry_plan_computes_intermediates_once():
+    """Test that shared intermediates are evaluated once per window."""
+    calls = []
+
+    def cleaned(rr):
+        calls.append("cleaned_rr")
+        return np.asarray(rr, dtype=float)
+
+    registry = FeatureRegistry()
+    registry.register_intermediate("cleaned_rr", ["rr_intervals_ms"], cleaned)
+    registry.register_intermediate("diff_rr", ["cleaned_rr"], np.diff)
+    registry.register_feature("mean_rr", ["cleaned_rr"], lambda rr: rr.mean())
+    registry.register_feature("max_diff", ["diff_rr", "cleaned_rr"], lambda d, rr: d.max())
+    registry.register_feature("unused", ["hr_values"], lambda hr: 1 / 0)
+
+    plan = registry.plan(["mean_rr", "max_diff"])
+    features = plan.evaluate([], [800.0, 820.0, 810.0])
+
+    assert calls == ["cleaned_rr"]
+    assert features == {"mean_rr": 810.0, "max_diff": 20.0}
+
+
+def test_registry_matches_extractor():
+    """Test that the default registry matches the standalone extractors."""
+    hr_values = [70.0, 72.0, 68.0]
+    rr_intervals = [800.0, 820.0, 1200.0, 810.0, 830.0, 815.0]
+
+    features = DEFAULT_FEATURE_REGISTRY.plan().evaluate(hr_values, rr_intervals)
+
+    assert features["hr_mean"] == FeatureExtractor.extract_hr_mean(hr_values)
+    assert features["sdnn"] == pytest.approx(FeatureExtractor.extract_sdnn(rr_intervals))
+    assert features["rmssd"] == pytest.approx(FeatureExtractor.extract_rmssd(rr_intervals))
+
+
+def test_registry_unknown_feature():
+    """Test planning an unknown feature."""
+    with pytest.raises(FeatureExtractionError):
+        DEFAULT_FEATURE_REGISTRY.plan(["not_a_feature"])
+
+
+def test_registry_cycle():
+    """Test that dependency cycles are rejected."""
+    registry = FeatureRegistry()
+    registry.register_intermediate("a", ["b"], lambda b: b)
+    registry.register_intermediate("b", ["a"], lambda a: a)
+    registry.register_feature("f", ["a"], lambda a: a)
+
+    with pytest.raises(FeatureExtractionError):
+        registry.plan(["f"])
+
+
+def test_extract_features_batch_matches_single_window():
+    """Test ragged batch extraction against per-window extraction."""
+    rng = np.random.default_rng(7)
+    windows = [list(rng.normal(820.0, 60.0, size=n)) for n in (0, 1, 5, 40, 3, 25)]
+    windows[3][10] = 2500.0  # Out of range
+    windows[3][20] += 400.0  # Jump artifact
+    hr_windows = [list(rng.normal(72.0, 4.0, size=n)) for n in (3, 0, 2, 6, 1, 4)]
+
+    rr_offsets = np.cumsum([0] + [len(w) for w in windows])
+    hr_offsets = np.cumsum([0] + [len(w) for w in hr_windows])
+
+    matrix = FeatureExtractor.extract_features_batch(
+        np.concatenate([np.asarray(w) for w in windows]),
+        rr_offsets,
+        hr_values=np.concatenate([np.asarray(w) for w in hr_windows]),
+        hr_offsets=hr_offsets,
+    )
+
+    assert matrix.shape == (len(windows), 3)
+    for row, rr, hr in zip(matrix, windows, hr_windows):
+        expected = FeatureExtractor.extract_features(hr, rr)
+        assert row == pytest.approx([expected["hr_mean"], expected["sdnn"], expected["rmssd"]])
+
+
+def test_extract_features_batch_bad_offsets():
+    """Test that malformed offsets are rejected."""
+    with pytest.raises(BadInputError):
+        FeatureExtractor.extract_features_batch(np.array([800.0, 810.0]), np.array([0, 1]))
+
+
+def test_clean_rr_mask_matches_clean_rr_intervals():
+    """Test that the cleaning mask selects exactly the cleaned intervals."""
+    rr_intervals = [100.0, 800.0, 820.0, 3000.0, 810.0, 1200.0, 830.0]
+
+    mask = FeatureExtractor.clean_rr_mask(rr_intervals)
+
+    assert list(np.asarray(rr_intervals)[mask]) == FeatureExtractor._clean_rr_intervals(
+        rr_intervals
+    )
+
+
+def test_sliding_window_features_match_per_window():
+    """Test prefix-sum sliding features against per-window extraction."""
+    rng = np.random.default_rng(3)
+    rr = 800.0 + np.cumsum(rng.normal(0.0, 15.0, size=600))
+    rr[100] = 2500.0  # Artifact removed by cleaning
+
+    result = FeatureExtractor.sliding_window_features(rr, window_seconds=30.0, step_seconds=2.0)
+
+    times = np.cumsum(rr)
+    mask = FeatureExtractor.clean_rr_mask(rr)
+    assert len(result["start_ms"]) == int((times[-1] - 30000.0) // 2000.0) + 1
+    for i, start in enumerate(result["start_ms"]):
+        in_window = (times >= start) & (times < start + 30000.0)
+        window = list(rr[in_window & mask])
+        assert result["count"][i] == len(window)
+        assert result["mean_rr"][i] == pytest.approx(np.mean(window))
+        assert result["sdnn"][i] == pytest.approx(FeatureExtractor.extract_sdnn(window))
+        assert result["rmssd"][i] == pytest.approx(FeatureExtractor.extract_rmssd(window))
+
+
+def test_registry_pnn50_and_mean_rr():
+    """Test the pNN50 and mean RR features used by the ONNX model inputs."""
+    rr_intervals = [800.0, 860.0, 840.0, 900.0, 905.0]
+
+    features = DEFAULT_FEATURE_REGISTRY.plan(["pnn50", "mean_rr"]).evaluate([70.0], rr_intervals)
+
+    assert features["pnn50"] == pytest.approx(50.0)
+    assert features["mean_rr"] == pytest.approx(np.mean(rr_intervals))
@@ -0,0 +1,121 @@
+"""Tests for closed-form Gaussian models (naive Bayes, QDA)."""
+import numpy as np
+import pytest
+
+from synheart_emotion import GaussianModel, ModelRegistry
+from synheart_emotion.error import BadInputError, ModelIncompatibleError, ModelLoadError
+
+
+def _classification_data(seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(400, 4))
+    y = (X[:, 0] + 0.5 * X[:, 1] > 0).astype(int) + (X[:, 2] > 0.8).astype(int)
+    X[y == 2] *= 1.5
+    return X, y
+
+
+def _gaussian_log_density(x, mean, covariance):
+    diff = x - mean
+    _, log_det = np.linalg.slogdet(covariance)
+    mahalanobis = diff @ np.linalg.solve(covariance, diff)
+    return -0.5 * (mahalanobis + log_det + mean.size * np.log(2 * np.pi))
+
+
+def _two_class_model(**kwargs):
+    return GaussianModel(
+        model_id="gauss",
+        version="1.0",
+        labels=["Calm", "Stress"],
+        feature_names=["hr_mean", "sdnn"],
+        means=[[0.0, 0.0], [2.0, 1.0]],
+        priors=[0.75, 0.25],
+        **kwargs,
+    )
+
+
+def test_diagonal_and_full_log_likelihoods():
+    """Test both covariance structures against the Gaussian density formula."""
+    covariances = np.array([[[1.0, 0.3], [0.3, 2.0]], [[0.5, -0.1], [-0.1, 0.8]]])
+    full = _two_class_model(covariances=covariances)
+    diagonal = _two_class_model(variances=[[1.0, 2.0], [0.5, 0.8]])
+    x = np.array([0.7, -0.4])
+
+    expected = [
+        np.log(prior) + _gaussian_log_density(x, mean, covariance)
+        for prior, mean, covariance in zip(full.priors, full.means, covariances)
+    ]
+    np.testing.assert_allclose(full.log_likelihood(x[np.newaxis])[0], expected)
+
+    expected = [
+        np.log(prior) + _gaussian_log_density(x, mean, np.diag(variances))
+        for prior, mean, variances in zip(diagonal.priors, diagonal.means, diagonal.variances)
+    ]
+    np.testing.assert_allclose(diagonal.log_likelihood(x[np.newaxis])[0], expected)
+
+    probs = diagonal.predict({"hr_mean": 0.7, "sdnn": -0.4})
+    assert list(probs) == ["Calm", "Stress"]
+    assert probs["Calm"] == pytest.approx(1.0 - probs["Stress"])
+
+
+def test_eigendecomposition_matches_covariance():
+    """Test that rotations/scalings and covariance matrices give the same model."""
+    covariances = np.array([[[1.0, 0.3], [0.3, 2.0]], [[0.5, -0.1], [-0.1, 0.8]]])
+    scalings, rotations = np.linalg.eigh(covariances)
+    from_eigen = _two_class_model(rotations=rotations, scalings=scalings)
+    from_covariance = _two_class_model(covariances=covariances)
+
+    X = np.random.default_rng(0).normal(size=(50, 2))
+    np.testing.assert_allclose(from_eigen.log_likelihood(X), from_covariance.log_likelihood(X))
+    np.testing.assert_allclose(from_eigen.log_dets, from_covariance.log_dets)
+
+
+def test_validation_errors():
+    """Test parameter, dimension and output-buffer validation."""
+    model = _two_class_model(variances=[[1.0, 2.0], [0.5, 0.8]])
+
+    with pytest.raises(ModelIncompatibleError):
+        model.predict_batch(np.zeros((2, 3)))
+    with pytest.raises(BadInputError):
+        model.predict_batch(np.zeros((2, 2)), out=np.zeros((2, 3)))
+    with pytest.raises(ModelLoadError):
+        _two_class_model(variances=[[1.0, 0.0], [0.5, 0.8]])
+    with pytest.raises(ModelLoadError):
+        _two_class_model(covariances=[[[1.0, 2.0], [2.0, 1.0]], [[1.0, 0.0], [0.0, 1.0]]])
+    with pytest.raises(ModelLoadError):
+        _two_class_model()
+
+
+def test_save_load_and_registry(tmp_path):
+    """Test JSON + npz round trip and discovery through ModelRegistry."""
+    covariances = np.array([[[1.0, 0.3], [0.3, 2.0]], [[0.5, -0.1], [-0.1, 0.8]]])
+    model = _two_class_model(covariances=covariances, scaler_mean=[1.0, 2.0], scaler_scale=[2, 4])
+    model.save(tmp_path / "gauss.json")
+
+    loaded = GaussianModel.load(tmp_path / "gauss.json")
+    X = np.array([[1.5, 3.0], [5.0, 10.0]])
+    np.testing.assert_array_equal(loaded.predict_batch(X), model.predict_batch(X))
+
+    registry = ModelRegistry(search_paths=[tmp_path], include_packaged=False)
+    shared = registry.load("gauss")
+    assert isinstance(shared, GaussianModel)
+    assert shared.covariance == "full"
+    assert not shared.whitening.flags.writeable
+
+
+@pytest.mark.parametrize("estimator_name", ["GaussianNB", "QuadraticDiscriminantAnalysis"])
+def test_sklearn_parity(estimator_name):
+    """Test probability parity with scikit-learn GaussianNB and QDA."""
+    naive_bayes = pytest.importorskip("sklearn.naive_bayes")
+    discriminant = pytest.importorskip("sklearn.discriminant_analysis")
+    preprocessing = pytest.importorskip("sklearn.preprocessing")
+
+    X, y = _classification_data()
+    scaler = preprocessing.StandardScaler().fit(X)
+    estimator_cls = getattr(naive_bayes, estimator_name, None) or getattr(
+        discriminant, estimator_name
+    )
+    estimator = estimator_cls().fit(scaler.transform(X), y)
+
+    model = GaussianModel.from_sklearn(estimator, "parity", scaler=scaler)
+    expected = estimator.predict_proba(scaler.transform(X))
+    np.testing.assert_allclose(model.predict_batch(X), expected, atol=1e-10)
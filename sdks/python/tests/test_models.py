@@ -0,0 +1,131 @@
+"""Tests for linear SVM model."""
+import numpy as np
+import pytest
+
+from synheart_emotion import EmotionConfig, EmotionEngine, FeatureExtractor, LinearSvmModel
+from synheart_emotion.error import ModelIncompatibleError
+
+
+def _synthetic_windows(count, seed=0):
+    """Generate synthetic HR/RR windows spanning calm to stressed physiology."""
+    rng = np.random.default_rng(seed)
+    windows = []
+    for _ in range(count):
+        mean_rr = rng.uniform(550.0, 1100.0)
+        rr = mean_rr + np.cumsum(rng.normal(0.0, rng.uniform(5.0, 40.0), size=70))
+        hr = 60000.0 / mean_rr + rng.normal(0.0, 2.0, size=12)
+        windows.append((hr, rr))
+    return windows
+
+
+def test_model_dtype():
+    """Test that model weights follow the requested dtype."""
+    model = LinearSvmModel.create_default(dtype="float32")
+
+    assert model.weights.dtype == np.float32
+    assert model.biases.dtype == np.float32
+    assert model.astype("float32") is model
+    assert model.astype("float64").weights.dtype == np.float64
+
+
+def test_engine_float32_model():
+    """Test that the engine converts the model to the configured dtype."""
+    engine = EmotionEngine.from_pretrained(EmotionConfig(dtype="float32"))
+
+    assert engine.model.weights.dtype == np.float32
+
+
+def test_float32_accuracy_drift():
+    """Test float32 drift against float64 on synthetic windows.
+
+    Documented bounds for float32 mode: features within 1e-5 relative error,
+    probabilities within 1e-5 absolute error, and identical top-1 labels.
+    """
+    model64 = LinearSvmModel.create_default()
+    model32 = LinearSvmModel.create_default(dtype="float32")
+
+    for hr, rr in _synthetic_windows(200):
+        features64 = FeatureExtractor.extract_features(hr, rr, dtype="float64")
+        features32 = FeatureExtractor.extract_features(hr, rr, dtype="float32")
+        for name, value in features64.items():
+            assert features32[name] == pytest.approx(value, rel=1e-5, abs=1e-6)
+
+        probas64 = model64.predict(features64)
+        probas32 = model32.predict(features32)
+        for label, proba in probas64.items():
+            assert probas32[label] == pytest.approx(proba, abs=1e-5)
+        assert max(probas32, key=probas32.get) == max(probas64, key=probas64.get)
+
+
+def _reference_predict(model, features):
+    """Unfolded reference: normalize, then W.x + b and softmax."""
+    normalized = FeatureExtractor.normalize_features(features, model.mu, model.sigma)
+    x = np.array([normalized[name] for name in model.feature_names])
+    margins = model.weights @ x + model.biases
+    exponentials = np.exp(margins - margins.max())
+    return exponentials / exponentials.sum()
+
+
+def test_predict_vector_matches_normalized_path():
+    """Test that folded normalization matches explicit normalization."""
+    model = LinearSvmModel.create_default()
+    features = {"hr_mean": 81.0, "sdnn": 30.5, "rmssd": 44.0}
+
+    probabilities = model.predict_vector(np.array([81.0, 30.5, 44.0]))
+
+    assert probabilities == pytest.approx(_reference_predict(model, features))
+    assert list(model.predict(features).values()) == pytest.approx(probabilities)
+
+
+def test_predict_vector_zero_sigma_and_missing_stats():
+    """Test folding when a feature has zero sigma or no statistics."""
+    model = LinearSvmModel(
+        model_id="fold_test",
+        version="1.0",
+        labels=["A", "B"],
+        feature_names=["x", "y", "z"],
+        weights=[[0.5, -1.0, 2.0], [-0.3, 0.7, 0.1]],
+        biases=[0.1, -0.2],
+        mu={"x": 10.0, "y": 5.0},
+        sigma={"x": 2.0, "y": 0.0},
+    )
+    features = {"x": 13.0, "y": 9.0, "z": 0.25}
+
+    probabilities = model.predict_vector(np.array([13.0, 9.0, 0.25]))
+
+    assert probabilities == pytest.approx(_reference_predict(model, features))
+
+
+def test_predict_batch_matches_predict_vector():
+    """Test batch prediction against single-vector prediction."""
+    model = LinearSvmModel.create_default()
+    rng = np.random.default_rng(1)
+    features = np.column_stack(
+        [rng.normal(72.0, 12.0, 50), rng.normal(45.0, 18.0, 50), rng.normal(32.0, 12.0, 50)]
+    )
+
+    probabilities = model.predict_batch(features)
+
+    assert probabilities.shape == (50, 3)
+    assert probabilities.sum(axis=1) == pytest.approx(np.ones(50))
+    for row, x in zip(probabilities, features):
+        assert row == pytest.approx(model.predict_vector(x))
+
+
+def test_predict_batch_out_buffer_and_stability():
+    """Test writing into a caller buffer and extreme margins."""
+    model = LinearSvmModel.create_default()
+    features = np.array([[1e6, 1e6, 1e6], [-1e6, -1e6, -1e6]])
+    out = np.empty((2, 3))
+
+    result = model.predict_batch(features, out=out)
+
+    assert result is out
+    assert np.all(np.isfinite(out))
+    assert out.sum(axis=1) == pytest.approx([1.0, 1.0])
+
+
+def test_predict_batch_wrong_dimension():
+    """Test batch prediction with the wrong feature count."""
+    with pytest.raises(ModelIncompatibleError):
+        LinearSvmModel.create_default().predict_batch(np.zeros((4, 2)))
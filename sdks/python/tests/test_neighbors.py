@@ -0,0 +1,132 @@
+"""Tests for native k-NN inference."""
+import numpy as np
+import pytest
+
+from synheart_emotion import KNeighborsModel, ModelRegistry
+from synheart_emotion.error import BadInputError, ModelIncompatibleError, ModelLoadError
+
+
+def _grid_model(**kwargs):
+    """Nine points on a 3 x 3 grid; the left column is Calm, the rest Stress."""
+    xs, ys = np.meshgrid([0.0, 1.0, 2.0], [0.0, 1.0, 2.0])
+    points = np.column_stack((xs.ravel(), ys.ravel()))
+    return KNeighborsModel(
+        model_id="grid",
+        version="1.0",
+        labels=["Calm", "Stress"],
+        feature_names=["hr_mean", "sdnn"],
+        points=points,
+        point_labels=(points[:, 0] > 0).astype(int),
+        **kwargs,
+    )
+
+
+def _brute_force(points, queries, k):
+    distances = np.linalg.norm(queries[:, np.newaxis, :] - points[np.newaxis], axis=2)
+    return np.sort(distances, axis=1)[:, :k]
+
+
+def test_hand_built_neighbors():
+    """Test neighbour search and vote shares on a small grid."""
+    model = _grid_model(n_neighbors=3, leaf_size=2)
+
+    assert model.n_leaves > 1
+    assert model.validate()
+
+    distances, indices = model.kneighbors(np.array([[-0.5, 1.0]]))
+    np.testing.assert_allclose(distances[0], [0.5, np.hypot(0.5, 1.0), np.hypot(0.5, 1.0)])
+    np.testing.assert_allclose(model.points[indices[0, 0]], [0.0, 1.0])
+
+    probs = model.predict_batch(np.array([[-0.5, 1.0], [0.4, 1.0], [2.0, 2.0]]))
+    np.testing.assert_allclose(probs, [[1.0, 0.0], [2 / 3, 1 / 3], [0.0, 1.0]])
+    assert model.predict({"hr_mean": -0.5, "sdnn": 1.0}) == {"Calm": 1.0, "Stress": 0.0}
+
+
+def test_search_is_exact_in_low_and_high_dimensions():
+    """Test that pruned and dense searches both return the true nearest neighbours."""
+    rng = np.random.default_rng(0)
+    for n_features in (2, 40):
+        points = rng.normal(size=(500, n_features))
+        model = KNeighborsModel(
+            model_id="random",
+            version="1.0",
+            labels=["a", "b"],
+            feature_names=[f"f{i}" for i in range(n_features)],
+            points=points,
+            point_labels=rng.integers(0, 2, 500),
+            n_neighbors=7,
+            leaf_size=8,
+        )
+        queries = rng.normal(size=(300, n_features))
+        distances, _ = model.kneighbors(queries)
+        np.testing.assert_allclose(distances, _brute_force(points, queries, 7), atol=1e-12)
+
+
+def test_distance_weights_and_exact_matches():
+    """Test 1/d weighting, with exact matches taking all the weight."""
+    model = _grid_model(n_neighbors=2, weights="distance", leaf_size=3)
+
+    probs = model.predict_batch(np.array([[0.0, 0.0], [0.25, 0.0]]))
+    np.testing.assert_allclose(probs, [[1.0, 0.0], [0.75, 0.25]])
+
+
+def test_validation_errors():
+    """Test dimension, neighbour-count and output-buffer validation."""
+    model = _grid_model()
+
+    with pytest.raises(ModelIncompatibleError):
+        model.predict_batch(np.zeros((2, 3)))
+    with pytest.raises(BadInputError):
+        model.predict_batch(np.zeros((2, 2)), out=np.zeros((2, 3)))
+    with pytest.raises(BadInputError):
+        model.kneighbors(np.zeros((1, 2)), n_neighbors=10)
+    with pytest.raises(ModelLoadError):
+        _grid_model(weights="gaussian")
+
+
+def test_save_load_and_registry(tmp_path):
+    """Test JSON + npz round trip and discovery through ModelRegistry."""
+    model = _grid_model(leaf_size=2, scaler_mean=[1.0, 2.0], scaler_scale=[2.0, 4.0])
+    model.save(tmp_path / "grid.json")
+
+    loaded = KNeighborsModel.load(tmp_path / "grid.json")
+    X = np.array([[1.5, 3.0], [5.0, 10.0]])
+    np.testing.assert_array_equal(loaded.predict_batch(X), model.predict_batch(X))
+    np.testing.assert_array_equal(loaded.points, model.points)
+
+    registry = ModelRegistry(search_paths=[tmp_path], include_packaged=False)
+    shared = registry.load("grid")
+    assert isinstance(shared, KNeighborsModel)
+    assert not shared.points.flags.writeable
+
+    (tmp_path / "grid.npz").unlink()
+    with pytest.raises(ModelLoadError):
+        KNeighborsModel.load(tmp_path / "grid.json")
+
+
+@pytest.mark.parametrize("weights", ["uniform", "distance"])
+def test_sklearn_parity(weights):
+    """Test neighbour and probability parity with scikit-learn."""
+    neighbors = pytest.importorskip("sklearn.neighbors")
+    preprocessing = pytest.importorskip("sklearn.preprocessing")
+
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(400, 12))
+    y = (X[:, 0] + X[:, 1] > 0).astype(int) + (X[:, 2] > 1.0).astype(int)
+    scaler = preprocessing.StandardScaler().fit(X)
+    estimator = neighbors.KNeighborsClassifier(n_neighbors=5, weights=weights)
+    estimator.fit(scaler.transform(X), y)
+
+    model = KNeighborsModel.from_sklearn(estimator, "parity", scaler=scaler, leaf_size=16)
+    queries = rng.normal(size=(200, 12))
+    expected_distances, _ = estimator.kneighbors(scaler.transform(queries))
+    distances, _ = model.kneighbors(queries)
+
+    np.testing.assert_allclose(distances, expected_distances, atol=1e-9)
+    expected = estimator.predict_proba(scaler.transform(queries))
+    np.testing.assert_allclose(model.predict_batch(queries), expected, atol=1e-9)
+
+    with pytest.raises(ModelIncompatibleError):
+        KNeighborsModel.from_sklearn(
+            neighbors.KNeighborsClassifier(metric="manhattan").fit(X, y), "bad"
+        )
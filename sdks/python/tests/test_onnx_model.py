@@ -0,0 +1,130 @@
+"""Tests for the optional ONNX Runtime backend."""
+import hashlib
+import json
+import threading
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from synheart_emotion import EmotionConfig, EmotionEngine, ModelRegistry
+from synheart_emotion.error import ModelLoadError
+from synheart_emotion.registry import clear_model_cache
+
+ort = pytest.importorskip("onnxruntime")
+skl2onnx = pytest.importorskip("skl2onnx")
+ensemble = pytest.importorskip("sklearn.ensemble")
+pipeline = pytest.importorskip("sklearn.pipeline")
+preprocessing = pytest.importorskip("sklearn.preprocessing")
+
+from synheart_emotion.onnx_model import OnnxEmotionModel, clear_sessions  # noqa: E402
+
+INPUT_NAMES = ["SDNN", "RMSSD", "pNN50", "Mean_RR", "HR_mean"]
+
+
+@pytest.fixture
+def onnx_dir(tmp_path):
+    """Write an ExtraTrees ONNX pipeline and its meta.json to tmp_path."""
+    from skl2onnx.common.data_types import FloatTensorType
+
+    rng = np.random.default_rng(0)
+    X = rng.normal([50.0, 40.0, 20.0, 850.0, 72.0], [15.0, 12.0, 10.0, 120.0, 8.0], (300, 5))
+    y = (X[:, 4] > 72.0).astype(int) + (X[:, 0] > 55.0).astype(int)
+    estimator = pipeline.make_pipeline(
+        preprocessing.StandardScaler(),
+        ensemble.ExtraTreesClassifier(n_estimators=10, random_state=0),
+    ).fit(X.astype(np.float32), y)
+
+    onnx_model = skl2onnx.convert_sklearn(
+        estimator,
+        initial_types=[("float_input", FloatTensorType([None, 5]))],
+        options={id(estimator): {"zipmap": False}},
+    )
+    model_bytes = onnx_model.SerializeToString()
+    (tmp_path / "extratrees_test_v1.onnx").write_bytes(model_bytes)
+
+    meta = {
+        "model_id": "extratrees_test_v1",
+        "format": "onnx",
+        "schema": {"input_names": INPUT_NAMES, "normalization": {"type": "none"}},
+        "output": {"type": "probability", "class_names": ["Calm", "Stressed", "Amused"]},
+        "checksum": {"algo": "sha256", "value": hashlib.sha256(model_bytes).hexdigest()},
+    }
+    (tmp_path / "extratrees_test_v1.meta.json").write_text(json.dumps(meta))
+
+    yield tmp_path, estimator, X
+    clear_model_cache()
+    clear_sessions()
+
+
+def test_onnx_model_parity(onnx_dir):
+    """Test registry loading, input name mapping and parity with scikit-learn."""
+    path, estimator, X = onnx_dir
+    model = ModelRegistry([path], include_packaged=False).load("extratrees_test_v1")
+
+    assert isinstance(model, OnnxEmotionModel)
+    assert model.feature_names == ["sdnn", "rmssd", "pnn50", "mean_rr", "hr_mean"]
+
+    expected = estimator.predict_proba(X.astype(np.float32))
+    np.testing.assert_allclose(model.predict_batch(X), expected, atol=1e-5)
+
+    features = dict(zip(model.feature_names, X[0]))
+    result = model.predict(features)
+    assert list(result) == ["Calm", "Stressed", "Amused"]
+    np.testing.assert_allclose(list(result.values()), expected[0], atol=1e-5)
+
+
+def test_onnx_checksum_mismatch(onnx_dir):
+    """Test that a modified ONNX file is rejected."""
+    path, _, _ = onnx_dir
+    meta = json.loads((path / "extratrees_test_v1.meta.json").read_text())
+    meta["checksum"]["value"] = "0" * 64
+
+    with pytest.raises(ModelLoadError):
+        OnnxEmotionModel.from_meta(meta, path / "extratrees_test_v1.meta.json")
+
+
+def test_onnx_session_shared_and_batched(onnx_dir):
+    """Test that models share one session and concurrent rows share runs."""
+    path, _, X = onnx_dir
+    meta_path = path / "extratrees_test_v1.meta.json"
+    meta = json.loads(meta_path.read_text())
+    first = OnnxEmotionModel.from_meta(meta, meta_path)
+    second = OnnxEmotionModel.from_meta(meta, meta_path)
+    assert first.session is second.session
+
+    session = first.session
+    session.batch_window_s = 0.05
+    runs_before = session.run_count
+    results = [None] * 16
+    barrier = threading.Barrier(len(results))
+
+    def worker(i):
+        barrier.wait()
+        model = first if i % 2 else second
+        results[i] = model.predict_vector(X[i])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(results))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    np.testing.assert_allclose(np.stack(results), first.predict_batch(X[:16]), atol=1e-6)
+    assert session.run_count - runs_before < len(results)
+
+
+def test_engine_with_onnx_model(onnx_dir):
+    """Test that an engine computes the five ONNX input features."""
+    path, _, _ = onnx_dir
+    model = ModelRegistry([path], include_packaged=False).load("extratrees_test_v1")
+    engine = EmotionEngine.from_pretrained(EmotionConfig(), model=model)
+
+    rr = [800.0, 870.0, 790.0, 860.0, 805.0, 850.0, 810.0, 880.0, 800.0, 845.0]
+    for hr in (70.0, 72.0, 71.0):
+        engine.push(hr=hr, rr_intervals_ms=rr * 3, timestamp=datetime.now())
+
+    results = engine.consume_ready()
+    assert len(results) == 1
+    assert set(results[0].features) == {"sdnn", "rmssd", "pnn50", "mean_rr", "hr_mean"}
+    assert 0.0 < results[0].features["pnn50"] <= 100.0
@@ -0,0 +1,77 @@
+"""Tests for the int8-quantized linear model."""
+import json
+
+import numpy as np
+import pytest
+
+from synheart_emotion import LinearSvmModel, ModelRegistry, QuantizedLinearModel
+from synheart_emotion.error import BadInputError, ModelIncompatibleError, ModelLoadError
+from synheart_emotion.quantized import quantization_report
+
+
+def test_quantize_default_model():
+    """Test per-class int8 quantization of the default model."""
+    model = LinearSvmModel.create_default()
+    quantized = QuantizedLinearModel.from_linear(model)
+
+    assert quantized.weights_q.dtype == np.int8
+    assert np.abs(quantized.weights_q).max(axis=1).tolist() == [127, 127, 127]
+    dequantized = quantized.to_linear()
+    np.testing.assert_allclose(
+        dequantized.weights, model.weights, atol=quantized.weight_scales.max()
+    )
+    assert quantized.nbytes < model.weights.nbytes
+
+
+def test_quantized_predict_paths():
+    """Test float and int8 inputs against the float model."""
+    model = LinearSvmModel.create_default()
+    quantized = QuantizedLinearModel.from_linear(model)
+    features = np.array([[72.5, 45.3, 32.1], [95.0, 20.0, 15.0], [60.0, 80.0, 55.0]])
+
+    expected = model.predict_batch(features)
+    np.testing.assert_allclose(quantized.predict_batch(features), expected, atol=1e-2)
+    np.testing.assert_allclose(
+        quantized.predict_batch(quantized.quantize_inputs(features)), expected, atol=2e-2
+    )
+
+    result = quantized.predict({"hr_mean": 95.0, "sdnn": 20.0, "rmssd": 15.0})
+    assert list(result) == model.labels
+    assert max(result, key=result.get) == model.labels[int(expected[1].argmax())]
+
+    with pytest.raises(ModelIncompatibleError):
+        quantized.predict_batch(np.zeros((2, 2)))
+    with pytest.raises(BadInputError):
+        quantized.predict_batch(features, out=np.empty((3, 3)))
+
+
+def test_quantized_json_round_trip(tmp_path):
+    """Test svm_int8 export, reload and registry discovery."""
+    quantized = QuantizedLinearModel.from_linear(LinearSvmModel.create_default())
+    data = quantized.to_dict()
+    (tmp_path / "int8.json").write_text(json.dumps(data))
+
+    loaded = QuantizedLinearModel.from_dict(json.loads((tmp_path / "int8.json").read_text()))
+    np.testing.assert_array_equal(loaded.weights_q, quantized.weights_q)
+    np.testing.assert_array_equal(loaded.weight_scales, quantized.weight_scales)
+
+    registry = ModelRegistry(search_paths=[tmp_path], include_packaged=False)
+    assert isinstance(registry.load("wesad_emotion_v1_0"), QuantizedLinearModel)
+
+    # A float svm_json document is quantized on load
+    from_float = QuantizedLinearModel.from_dict(LinearSvmModel.create_default().to_dict())
+    np.testing.assert_array_equal(from_float.weights_q, quantized.weights_q)
+
+    data["weights"][0][0] = 300
+    with pytest.raises(ModelLoadError):
+        QuantizedLinearModel.from_dict(data)
+
+
+def test_quantization_report():
+    """Test the accuracy-parity report on generated data."""
+    report = quantization_report(LinearSvmModel.create_default(), n_samples=20_000)
+
+    assert report["int8_bytes"] < report["float_bytes"]
+    assert report["float_input"]["top1_agreement"] > 0.99
+    assert report["int8_input"]["top1_agreement"] > 0.98
+    assert report["float_input"]["mean_abs_error"] < 1e-2
@@ -0,0 +1,123 @@
+"""Tests for native RBF-kernel SVM inference."""
+import numpy as np
+import pytest
+
+from synheart_emotion import ModelRegistry, RbfSvmModel
+from synheart_emotion.error import BadInputError, ModelIncompatibleError, ModelLoadError
+
+
+def _classification_data(seed=0, n_classes=3):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(300, 6))
+    y = (X[:, 0] + 0.5 * X[:, 1] > 0).astype(int)
+    if n_classes == 3:
+        y += (X[:, 2] > 0.8).astype(int)
+    return X, y
+
+
+def _two_vector_model(**kwargs):
+    return RbfSvmModel(
+        model_id="rbf",
+        version="1.0",
+        labels=["Calm", "Stress"],
+        feature_names=["hr_mean", "sdnn"],
+        support_vectors=[[0.0, 0.0], [2.0, 0.0]],
+        coef=[[1.0], [-1.0]],
+        intercept=[0.0],
+        gamma=0.5,
+        **kwargs,
+    )
+
+
+def test_hand_built_decision():
+    """Test the kernel expansion and scores on a two-vector model."""
+    model = _two_vector_model()
+    x = np.array([[0.5, 1.0]])
+
+    expected = np.exp(-0.5 * 1.25) - np.exp(-0.5 * 3.25)
+    np.testing.assert_allclose(model.decision_function(x), [[expected]])
+
+    probs = model.predict({"hr_mean": 0.5, "sdnn": 1.0})
+    assert list(probs) == ["Calm", "Stress"]
+    assert probs["Calm"] > probs["Stress"]
+    assert probs["Calm"] == pytest.approx(1.0 - probs["Stress"])
+    assert model.predict_vector([1.9, 0.0]).argmax() == 1
+
+
+def test_validation_errors():
+    """Test parameter, dimension and output-buffer validation."""
+    model = _two_vector_model()
+
+    with pytest.raises(ModelIncompatibleError):
+        model.predict_batch(np.zeros((2, 3)))
+    with pytest.raises(BadInputError):
+        model.predict_batch(np.zeros((2, 2)), out=np.zeros((2, 3)))
+    with pytest.raises(BadInputError):
+        model.reduced(3)
+    with pytest.raises(ModelLoadError):
+        RbfSvmModel("rbf", "1.0", ["a", "b"], ["x", "y"], [[0.0, 0.0]], [[1.0, 2.0]], [0.0], 0.5)
+    with pytest.raises(ModelLoadError):
+        RbfSvmModel("rbf", "1.0", ["a", "b"], ["x", "y"], [[0.0, 0.0]], [[1.0]], [0.0], 0.0)
+
+
+def test_save_load_and_registry(tmp_path):
+    """Test JSON + npz round trip and discovery through ModelRegistry."""
+    model = _two_vector_model(scaler_mean=[1.0, 2.0], scaler_scale=[2.0, 4.0])
+    model.save(tmp_path / "rbf.json")
+
+    loaded = RbfSvmModel.load(tmp_path / "rbf.json")
+    X = np.array([[1.5, 3.0], [5.0, 10.0]])
+    np.testing.assert_array_equal(loaded.predict_batch(X), model.predict_batch(X))
+
+    registry = ModelRegistry(search_paths=[tmp_path], include_packaged=False)
+    shared = registry.load("rbf")
+    assert isinstance(shared, RbfSvmModel)
+    assert not shared.support_vectors.flags.writeable
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_sklearn_parity(n_classes):
+    """Test decision-function and prediction parity with scikit-learn SVC."""
+    svm = pytest.importorskip("sklearn.svm")
+    preprocessing = pytest.importorskip("sklearn.preprocessing")
+
+    X, y = _classification_data(n_classes=n_classes)
+    scaler = preprocessing.StandardScaler().fit(X)
+    estimator = svm.SVC(kernel="rbf", decision_function_shape="ovo")
+    estimator.fit(scaler.transform(X), y)
+
+    model = RbfSvmModel.from_sklearn(estimator, "parity", scaler=scaler)
+    expected = estimator.decision_function(scaler.transform(X))
+    if n_classes == 2:
+        # scikit-learn reports binary decisions as "> 0 means class 1"
+        np.testing.assert_allclose(-model.decision_function(X)[:, 0], expected, atol=1e-10)
+    else:
+        np.testing.assert_allclose(model.decision_function(X), expected, atol=1e-10)
+        estimator.decision_function_shape = "ovr"
+        expected = estimator.decision_function(scaler.transform(X))
+        np.testing.assert_allclose(model.ovr_scores(X), expected, atol=1e-10)
+
+    predicted = model.predict_batch(X).argmax(axis=1)
+    np.testing.assert_array_equal(predicted, estimator.predict(scaler.transform(X)))
+
+    with pytest.raises(ModelIncompatibleError):
+        RbfSvmModel.from_sklearn(svm.SVC(kernel="poly").fit(X, y), "bad")
+
+
+def test_reduced_set_error_shrinks_with_size():
+    """Test that the reduced-set approximation improves as vectors are added."""
+    svm = pytest.importorskip("sklearn.svm")
+
+    X, y = _classification_data(seed=1)
+    model = RbfSvmModel.from_sklearn(svm.SVC(kernel="rbf").fit(X, y), "full")
+    exact = model.decision_function(X)
+
+    errors = []
+    for fraction in (0.1, 0.25, 0.5):
+        reduced = model.reduced(max(1, int(model.n_vectors * fraction)))
+        assert reduced.n_vectors < model.n_vectors
+        errors.append(np.abs(reduced.decision_function(X) - exact).max())
+    assert errors[0] > errors[1] > errors[2]
+
+    complete = model.reduced(model.n_vectors)
+    np.testing.assert_allclose(complete.decision_function(X), exact, atol=1e-4)
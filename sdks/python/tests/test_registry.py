@@ -0,0 +1,89 @@
+"""Tests for model registry."""
+import json
+from pathlib import Path
+
+import pytest
+
+from synheart_emotion import EmotionConfig, EmotionEngine, LinearSvmModel, ModelRegistry, registry
+from synheart_emotion.error import ModelLoadError
+
+REPO_MODELS_DIR = Path(__file__).resolve().parents[3] / "models"
+
+
+def _write_model(directory, model_id, **overrides):
+    data = LinearSvmModel.create_default().to_dict()
+    data["model_id"] = model_id
+    data.update(overrides)
+    path = directory / f"{model_id}.json"
+    path.write_text(json.dumps(data))
+    return path
+
+
+def test_registry_loads_user_model(tmp_path):
+    """Test discovering and loading a user-supplied model file."""
+    _write_model(tmp_path, "custom_v1", bias=[0.0, 0.0, 0.0])
+    registry = ModelRegistry(search_paths=[tmp_path], include_packaged=False)
+
+    model = registry.load("custom_v1")
+
+    assert "custom_v1" in registry.available()
+    assert model.model_id == "custom_v1"
+    assert list(model.biases) == [0.0, 0.0, 0.0]
+    assert not model.weights.flags.writeable
+
+
+def test_registry_shares_instances(tmp_path):
+    """Test that models are cached process-wide by id and content."""
+    _write_model(tmp_path, "shared_v1")
+
+    first = ModelRegistry(search_paths=[tmp_path]).load("shared_v1")
+    second = ModelRegistry(search_paths=[tmp_path]).load("shared_v1")
+
+    assert first is second
+    assert ModelRegistry(search_paths=[tmp_path]).load("shared_v1", dtype="float32") is not first
+
+
+def test_registry_reloads_changed_content(tmp_path):
+    """Test that a changed file yields a new model instance."""
+    _write_model(tmp_path, "changing_v1")
+    first = ModelRegistry(search_paths=[tmp_path]).load("changing_v1")
+
+    _write_model(tmp_path, "changing_v1", bias=[1.0, 2.0, 3.0])
+    second = ModelRegistry(search_paths=[tmp_path]).load("changing_v1")
+
+    assert first is not second
+    assert list(second.biases) == [1.0, 2.0, 3.0]
+
+
+def test_registry_unknown_model():
+    """Test loading an unknown model id."""
+    with pytest.raises(ModelLoadError):
+        ModelRegistry(include_packaged=False).load("does_not_exist")
+
+
+def test_registry_default_alias():
+    """Test that the default config model id resolves to the embedded model."""
+    model = ModelRegistry(include_packaged=False).load(EmotionConfig().model_id)
+
+    assert model.model_id == "wesad_emotion_v1_0"
+
+
+def test_from_pretrained_honours_model_id(tmp_path, monkeypatch):
+    """Test that from_pretrained loads config.model_id through the registry."""
+    _write_model(tmp_path, "engine_model_v1")
+    monkeypatch.setattr(registry, "_default_registry", ModelRegistry(search_paths=[tmp_path]))
+
+    engine = EmotionEngine.from_pretrained(EmotionConfig(model_id="engine_model_v1"))
+
+    assert engine.model.model_id == "engine_model_v1"
+
+
+@pytest.mark.skipif(not REPO_MODELS_DIR.is_dir(), reason="repository models/ not available")
+def test_registry_loads_repo_svm_json():
+    """Test loading the svm_json model shipped in the repository."""
+    registry = ModelRegistry(search_paths=[REPO_MODELS_DIR], include_packaged=False)
+
+    model = registry.load("wesad_emotion_v1_0")
+
+    assert model.labels == ["Amused", "Calm", "Stressed"]
+    assert model.feature_names == ["hr_mean", "sdnn", "rmssd"]
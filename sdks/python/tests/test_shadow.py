@@ -0,0 +1,83 @@
+"""Tests for shadow model evaluation."""
+from datetime import datetime
+
+import pytest
+
+from synheart_emotion import EmotionConfig, EmotionEngine, LinearSvmModel, ShadowEvaluator
+from synheart_emotion.error import BadInputError, ModelIncompatibleError
+
+
+def _push_window(engine):
+    rr = [800.0, 870.0, 790.0, 860.0, 805.0, 850.0, 810.0, 880.0, 800.0, 845.0]
+    for hr in (70.0, 72.0, 71.0):
+        engine.push(hr=hr, rr_intervals_ms=rr * 3, timestamp=datetime.now())
+
+
+def _shadow_model(model_id, feature_names):
+    count = len(feature_names)
+    return LinearSvmModel(
+        model_id=model_id,
+        version="0.1",
+        labels=["Amused", "Calm", "Stressed"],
+        feature_names=list(feature_names),
+        weights=[[0.1] * count, [0.0] * count, [-0.1] * count],
+        biases=[0.0, 0.2, 0.0],
+        mu={name: 0.0 for name in feature_names},
+        sigma={name: 1.0 for name in feature_names},
+    )
+
+
+def test_shadow_models_share_features():
+    """Test that shadow models see the same window and do not change the primary result."""
+    received = []
+    shadow = ShadowEvaluator(
+        [
+            _shadow_model("shadow_a", ["hr_mean", "sdnn", "rmssd"]),
+            _shadow_model("shadow_b", ["rmssd", "pnn50", "mean_rr"]),
+        ],
+        sink=lambda result, primary: received.append((result, primary)),
+    )
+    engine = EmotionEngine.from_pretrained(EmotionConfig(), shadow=shadow)
+    _push_window(engine)
+
+    results = engine.consume_ready()
+    shadow.flush()
+
+    assert len(results) == 1
+    assert set(results[0].features) == {"hr_mean", "sdnn", "rmssd"}
+    assert [result.model_id for result, _ in received] == ["shadow_a", "shadow_b"]
+    assert all(primary is results[0] for _, primary in received)
+    assert received[0][0].features == results[0].features
+    assert received[1][0].features["rmssd"] == results[0].features["rmssd"]
+    assert set(received[1][0].features) == {"rmssd", "pnn50", "mean_rr"}
+    assert shadow.stats()["evaluated"] == 2
+
+
+def test_shadow_sampling_and_errors():
+    """Test sampling and that sink errors are counted, not raised."""
+
+    def failing_sink(result, primary):
+        raise RuntimeError("sink down")
+
+    shadow = ShadowEvaluator(
+        [_shadow_model("shadow_a", ["hr_mean"])], sink=failing_sink, sample_rate=0.5, seed=1
+    )
+    engine = EmotionEngine.from_pretrained(EmotionConfig(step_seconds=0.0), shadow=shadow)
+    _push_window(engine)
+
+    for _ in range(40):
+        assert len(engine.consume_ready()) == 1
+    shadow.flush()
+
+    stats = shadow.stats()
+    assert stats["submitted"] == 40
+    assert 0 < stats["sampled_out"] < 40
+    assert stats["errors"] == 40 - stats["sampled_out"]
+
+
+def test_shadow_rejects_unknown_features():
+    """Test that shadow models must use registered features."""
+    with pytest.raises(ModelIncompatibleError):
+        ShadowEvaluator([_shadow_model("bad", ["hr_mean", "unknown"])], sink=print)
+    with pytest.raises(BadInputError):
+        ShadowEvaluator([], sink=print, sample_rate=1.5)
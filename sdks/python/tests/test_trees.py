@@ -0,0 +1,129 @@
+"""Tests for native tree-ensemble inference."""
+import numpy as np
+import pytest
+
+from synheart_emotion import ModelRegistry, TreeEnsembleModel
+from synheart_emotion.error import BadInputError, ModelIncompatibleError, ModelLoadError
+
+
+def _stump_ensemble(**kwargs):
+    """Two stumps on features 0 and 1; leaves hold class distributions."""
+    return TreeEnsembleModel(
+        model_id="stumps",
+        version="1.0",
+        labels=["Calm", "Stress"],
+        feature_names=["hr_mean", "sdnn"],
+        feature=[0, 0, 0, 1, 0, 0],
+        threshold=[70.0, 0.0, 0.0, 40.0, 0.0, 0.0],
+        left=[1, 1, 2, 4, 4, 5],
+        right=[2, 1, 2, 5, 4, 5],
+        value=[[0, 0], [1, 0], [0, 1], [0, 0], [0, 1], [1, 0]],
+        roots=[0, 3],
+        **kwargs,
+    )
+
+
+def _classification_data(seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(300, 4))
+    y = (X[:, 0] + 0.5 * X[:, 1] > 0).astype(int) + (X[:, 2] > 0.8).astype(int)
+    return X, y
+
+
+def test_hand_built_ensemble():
+    """Test traversal and mean_proba aggregation on a hand-built ensemble."""
+    model = _stump_ensemble()
+
+    assert model.n_trees == 2
+    assert model.max_depth == 1
+    assert model.validate()
+
+    probs = model.predict_batch(np.array([[60.0, 30.0], [80.0, 50.0], [70.0, 40.0]]))
+    np.testing.assert_allclose(probs, [[0.5, 0.5], [0.5, 0.5], [0.5, 0.5]])
+    probs = model.predict_batch(np.array([[60.0, 50.0], [80.0, 30.0]]))
+    np.testing.assert_allclose(probs, [[1.0, 0.0], [0.0, 1.0]])
+
+    result = model.predict({"hr_mean": 60.0, "sdnn": 50.0})
+    assert result == {"Calm": 1.0, "Stress": 0.0}
+
+
+def test_missing_values_follow_default_direction():
+    """Test that NaN features follow each node's missing direction."""
+    model = _stump_ensemble(missing_left=[False, False, False, True, False, False])
+
+    probs = model.predict_batch(np.array([[np.nan, np.nan]]))
+    np.testing.assert_allclose(probs, [[0.0, 1.0]])
+
+
+def test_predict_batch_validation():
+    """Test dimension and output-buffer validation."""
+    model = _stump_ensemble()
+
+    with pytest.raises(ModelIncompatibleError):
+        model.predict_batch(np.zeros((2, 3)))
+    with pytest.raises(BadInputError):
+        model.predict_batch(np.zeros((2, 2)), out=np.zeros((2, 3)))
+    with pytest.raises(BadInputError):
+        model.predict({"hr_mean": 60.0})
+
+    out = np.empty((1, 2))
+    assert model.predict_batch(np.array([[60.0, 50.0]]), out=out) is out
+
+
+def test_save_load_and_registry(tmp_path):
+    """Test JSON + npz round trip and discovery through ModelRegistry."""
+    model = _stump_ensemble(scaler_mean=[1.0, 2.0], scaler_scale=[2.0, 4.0])
+    model.save(tmp_path / "stumps.json")
+
+    loaded = TreeEnsembleModel.load(tmp_path / "stumps.json")
+    X = np.array([[130.0, 150.0], [200.0, 100.0]])
+    np.testing.assert_array_equal(loaded.predict_batch(X), model.predict_batch(X))
+
+    registry = ModelRegistry(search_paths=[tmp_path], include_packaged=False)
+    shared = registry.load("stumps")
+    assert isinstance(shared, TreeEnsembleModel)
+    assert not shared.threshold.flags.writeable
+
+    (tmp_path / "stumps.npz").unlink()
+    with pytest.raises(ModelLoadError):
+        TreeEnsembleModel.load(tmp_path / "stumps.json")
+
+
+@pytest.mark.parametrize(
+    "estimator_name",
+    [
+        "DecisionTreeClassifier",
+        "RandomForestClassifier",
+        "ExtraTreesClassifier",
+        "GradientBoostingClassifier",
+        "AdaBoostClassifier",
+    ],
+)
+def test_sklearn_parity(estimator_name):
+    """Test probability parity with scikit-learn tree classifiers."""
+    ensemble = pytest.importorskip("sklearn.ensemble")
+    tree = pytest.importorskip("sklearn.tree")
+    preprocessing = pytest.importorskip("sklearn.preprocessing")
+
+    X, y = _classification_data()
+    scaler = preprocessing.StandardScaler().fit(X)
+    estimator_cls = getattr(ensemble, estimator_name, None) or getattr(tree, estimator_name)
+    kwargs = {"n_estimators": 20} if hasattr(ensemble, estimator_name) else {}
+    estimator = estimator_cls(random_state=0, **kwargs).fit(scaler.transform(X), y)
+
+    model = TreeEnsembleModel.from_sklearn(estimator, "parity", scaler=scaler)
+    expected = estimator.predict_proba(scaler.transform(X))
+    np.testing.assert_allclose(model.predict_batch(X), expected, atol=1e-12)
+
+
+def test_xgboost_parity():
+    """Test probability parity with an XGBoost multi:softprob classifier."""
+    xgb = pytest.importorskip("xgboost")
+
+    X, y = _classification_data()
+    X[::7, 1] = np.nan
+    classifier = xgb.XGBClassifier(n_estimators=20, max_depth=3, objective="multi:softprob")
+    classifier.fit(X, y)
+
+    model = TreeEnsembleModel.from_xgboost(classifier, "parity")
+    np.testing.assert_allclose(model.predict_batch(X), classifier.predict_proba(X), atol=1e-5)
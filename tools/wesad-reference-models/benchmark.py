@@ -0,0 +1,185 @@
+"""Benchmark the WESAD reference models: load time, footprint, latency and throughput.
+
+Usage:
+    python benchmark.py [--models ExtraTrees RF ...] [--batch-sizes 1 100 10000]
+                        [--single-runs 1000] [--out benchmark_report.json]
+
+For every model the report records:
+    - load_seconds: wall time of joblib.load / XGBClassifier.load_model, with
+      cold_load_seconds for the first load (including library imports)
+    - file_bytes / traced_bytes: size on disk and Python-heap memory retained
+      after loading (tracemalloc; native xgboost buffers are not traced)
+    - single_row_ms: p50/p90/p99/max latency of predict_proba on one row
+    - batches: best-of-repeats seconds per call and rows/second per batch size
+    - macro_f1 / accuracy from models/model_results.csv, when present
+
+Inputs are synthetic standardized feature rows (the models consume
+StandardScaler output), so timings do not depend on the scaler.
+"""
+
+import argparse
+import csv
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+MODELS_DIR = Path(__file__).resolve().parent / "models"
+DEFAULT_BATCH_SIZES = [1, 10, 100, 1000, 10000]
+
+
+def available_models():
+    names = [p.stem for p in MODELS_DIR.glob("*.joblib") if p.stem not in ("scaler", "models_all")]
+    names += [p.stem for p in MODELS_DIR.glob("*.xgb")]
+    return sorted(names)
+
+
+def load_model(model_name: str):
+    xgb_path = MODELS_DIR / f"{model_name}.xgb"
+    if xgb_path.exists():
+        from xgboost import XGBClassifier
+
+        model = XGBClassifier()
+        model.load_model(str(xgb_path))
+        return model, xgb_path
+    path = MODELS_DIR / f"{model_name}.joblib"
+    return joblib.load(path), path
+
+
+def score_fn(model):
+    """predict_proba where available (Ridge and friends only have decision_function)."""
+    if hasattr(model, "predict_proba"):
+        try:
+            model.predict_proba(np.zeros((1, model.n_features_in_)))
+            return model.predict_proba
+        except AttributeError:
+            pass
+    return model.decision_function
+
+
+def measure_load(model_name: str):
+    # The first load also pays for importing the estimator's modules
+    start = time.perf_counter()
+    load_model(model_name)
+    cold_seconds = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    model, path = load_model(model_name)
+    load_seconds = time.perf_counter() - start
+    traced_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return model, {
+        "cold_load_seconds": cold_seconds,
+        "load_seconds": load_seconds,
+        "file_bytes": path.stat().st_size,
+        "traced_bytes": traced_bytes,
+    }
+
+
+def measure_single_row(fn, X: np.ndarray, runs: int):
+    # Warm up caches and lazy initialization before timing
+    for row in X[:10]:
+        fn(row[np.newaxis, :])
+    latencies = np.empty(runs)
+    for i in range(runs):
+        row = X[i % len(X)][np.newaxis, :]
+        start = time.perf_counter()
+        fn(row)
+        latencies[i] = time.perf_counter() - start
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e3
+    return {"p50": p50, "p90": p90, "p99": p99, "max": latencies.max() * 1e3, "runs": runs}
+
+
+def measure_batches(fn, X: np.ndarray, batch_sizes, repeats: int):
+    batches = []
+    for size in batch_sizes:
+        batch = X[:size]
+        fn(batch)
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn(batch)
+            best = min(best, time.perf_counter() - start)
+        batches.append(
+            {"batch_size": size, "seconds_per_call": best, "rows_per_second": size / best}
+        )
+    return batches
+
+
+def read_quality():
+    path = MODELS_DIR / "model_results.csv"
+    if not path.exists():
+        return {}
+    with open(path, newline="") as f:
+        return {
+            row["model"]: {"macro_f1": float(row["macro_f1"]), "accuracy": float(row["accuracy"])}
+            for row in csv.DictReader(f)
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", nargs="+", default=None)
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=DEFAULT_BATCH_SIZES)
+    parser.add_argument("--single-runs", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=Path("benchmark_report.json"))
+    args = parser.parse_args()
+
+    with open(MODELS_DIR / "feature_names.json", "r") as f:
+        n_features = len(json.load(f))
+    rng = np.random.default_rng(args.seed)
+    X = rng.standard_normal((max(args.batch_sizes + [args.single_runs]), n_features))
+
+    quality = read_quality()
+    results = []
+    for model_name in args.models or available_models():
+        model, entry = measure_load(model_name)
+        fn = score_fn(model)
+        entry = {"model": model_name, **entry, **quality.get(model_name, {})}
+        entry["score_fn"] = fn.__name__
+        entry["single_row_ms"] = measure_single_row(fn, X, args.single_runs)
+        entry["batches"] = measure_batches(fn, X, args.batch_sizes, args.repeats)
+        results.append(entry)
+
+        largest = entry["batches"][-1]
+        print(
+            f"{model_name:14s} load={entry['load_seconds'] * 1e3:8.1f} ms "
+            f"file={entry['file_bytes'] / 1024:8.1f} KiB "
+            f"p50={entry['single_row_ms']['p50']:7.3f} ms "
+            f"p99={entry['single_row_ms']['p99']:7.3f} ms "
+            f"N={largest['batch_size']}: {largest['rows_per_second']:12.0f} rows/s"
+        )
+
+    report = {
+        "created_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "numpy": np.__version__,
+        },
+        "settings": {
+            "n_features": n_features,
+            "batch_sizes": args.batch_sizes,
+            "single_runs": args.single_runs,
+            "repeats": args.repeats,
+            "seed": args.seed,
+        },
+        "models": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
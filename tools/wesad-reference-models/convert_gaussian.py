@@ -0,0 +1,93 @@
+"""Convert the NaiveBayes and QDA reference models to the SDK's native gaussian format.
+
+Usage:
+    python convert_gaussian.py [--out converted] [--models NaiveBayes QDA]
+
+Each model is written as <out>/<model_id>.json plus <model_id>.npz and checked
+against the joblib model's predict_proba before it is kept. The output
+directory can be added to a ModelRegistry search path.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "sdks" / "python" / "src"))
+
+from synheart_emotion.gaussian import GaussianModel  # noqa: E402
+
+MODELS_DIR = Path(__file__).resolve().parent / "models"
+GAUSSIAN_MODELS = ["NaiveBayes", "QDA"]
+PARITY_TOLERANCE = 1e-9
+
+
+def model_id_for(model_name: str) -> str:
+    return f"wesad_{model_name.lower().replace('-', '_')}_v1_0"
+
+
+def load_reference():
+    scaler = joblib.load(MODELS_DIR / "scaler.joblib")
+    with open(MODELS_DIR / "feature_names.json", "r") as f:
+        feature_names = json.load(f)
+    with open(MODELS_DIR / "label_map_0based.json", "r") as f:
+        label_map = {int(k): v for k, v in json.load(f).items()}
+    labels = [label_map[k] for k in sorted(label_map)]
+    return scaler, feature_names, labels
+
+
+def check_parity(native, estimator, scaler, n_samples: int = 2000, seed: int = 0):
+    """Compare native and reference probabilities on synthetic HRV feature rows."""
+    rng = np.random.default_rng(seed)
+    X = scaler.mean_ + rng.normal(size=(n_samples, scaler.mean_.size)) * scaler.scale_
+    expected = estimator.predict_proba(scaler.transform(X))
+    actual = native.predict_batch(X)
+
+    start = time.perf_counter()
+    for row in X[:500]:
+        native.predict_batch(row[np.newaxis, :])
+    row_ms = (time.perf_counter() - start) / 500 * 1e3
+
+    max_error = float(np.abs(actual - expected).max())
+    agreement = float((actual.argmax(axis=1) == expected.argmax(axis=1)).mean())
+    return max_error, agreement, row_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path(__file__).resolve().parent / "converted")
+    parser.add_argument("--models", nargs="+", default=GAUSSIAN_MODELS)
+    args = parser.parse_args()
+
+    scaler, feature_names, labels = load_reference()
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    failed = []
+    for model_name in args.models:
+        estimator = joblib.load(MODELS_DIR / f"{model_name}.joblib")
+        native = GaussianModel.from_sklearn(
+            estimator, model_id_for(model_name), feature_names, labels, scaler
+        )
+        max_error, agreement, row_ms = check_parity(native, estimator, scaler)
+        status = "ok" if max_error <= PARITY_TOLERANCE else "MISMATCH"
+        rank = native.get_metadata().get("rank", len(feature_names))
+        print(
+            f"{model_name:12s} covariance={native.covariance:8s} rank={rank:3d} "
+            f"max_err={max_error:.2e} argmax_agree={agreement:.4f} row={row_ms:.3f} ms {status}"
+        )
+        if status != "ok":
+            failed.append(model_name)
+            continue
+        native.save(args.out / f"{native.model_id}.json")
+
+    if failed:
+        print(f"Parity check failed for: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Convert the linear reference models to the SDK's svm_json format.
+
+Usage:
+    python convert_linear.py [--out converted] [--models LDA LogReg Ridge LinearSVM]
+
+The StandardScaler is folded into the weights (W / scale, b - W . mean / scale),
+so each <out>/<model_id>.json takes raw HRV features and carries an identity
+scaler. Each model is checked against scikit-learn before it is written:
+decision values must match, and for LDA and LogReg the SDK's softmax must
+match predict_proba. Ridge and LinearSVM have no probabilities; the SDK's
+softmax over their margins is uncalibrated but preserves the predicted class.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "sdks" / "python" / "src"))
+
+from synheart_emotion import LinearSvmModel  # noqa: E402
+
+MODELS_DIR = Path(__file__).resolve().parent / "models"
+LINEAR_MODELS = ["LDA", "LogReg", "Ridge", "LinearSVM"]
+PARITY_TOLERANCE = 1e-8
+
+# svm_json "type" per scikit-learn estimator, and whether softmax(decision) == predict_proba
+ESTIMATOR_TYPES = {
+    "LinearDiscriminantAnalysis": ("lda", True),
+    "LogisticRegression": ("logistic_regression", True),
+    "RidgeClassifier": ("ridge", False),
+    "LinearSVC": ("linear_svm_ovr", False),
+}
+
+
+def model_id_for(model_name: str) -> str:
+    return f"wesad_{model_name.lower().replace('-', '_')}_v1_0"
+
+
+def load_reference():
+    scaler = joblib.load(MODELS_DIR / "scaler.joblib")
+    with open(MODELS_DIR / "feature_names.json", "r") as f:
+        feature_names = json.load(f)
+    with open(MODELS_DIR / "label_map_0based.json", "r") as f:
+        label_map = {int(k): v for k, v in json.load(f).items()}
+    labels = [label_map[k] for k in sorted(label_map)]
+    return scaler, feature_names, labels
+
+
+def read_quality():
+    path = MODELS_DIR / "model_results.csv"
+    if not path.exists():
+        return {}
+    with open(path, newline="") as f:
+        return {
+            row["model"]: {"accuracy": float(row["accuracy"]), "f1_score": float(row["macro_f1"])}
+            for row in csv.DictReader(f)
+        }
+
+
+def fold_scaler(coef: np.ndarray, intercept: np.ndarray, scaler):
+    """Fold z = (x - mean) / scale into a linear decision function."""
+    coef = np.asarray(coef, dtype=np.float64)
+    weights = coef / scaler.scale_
+    bias = np.asarray(intercept, dtype=np.float64) - coef @ (scaler.mean_ / scaler.scale_)
+    return weights, bias
+
+
+def convert(model_name: str, scaler, feature_names, labels, quality=None):
+    """Return (svm_json document, fitted estimator)."""
+    estimator = joblib.load(MODELS_DIR / f"{model_name}.joblib")
+    kind = type(estimator).__name__
+    if kind not in ESTIMATOR_TYPES:
+        raise TypeError(f"{model_name}: unsupported estimator {kind}")
+    if estimator.coef_.shape != (len(labels), len(feature_names)):
+        raise ValueError(f"{model_name}: expected one-vs-rest/multinomial coefficients per class")
+    if kind == "LogisticRegression" and getattr(estimator, "multi_class", "auto") == "ovr":
+        raise ValueError(f"{model_name}: one-vs-rest LogisticRegression is not softmax-based")
+
+    model_type, calibrated = ESTIMATOR_TYPES[kind]
+    weights, bias = fold_scaler(estimator.coef_, estimator.intercept_, scaler)
+    document = {
+        "type": model_type,
+        "version": "1.0",
+        "model_id": model_id_for(model_name),
+        "format": "svm_json",
+        "feature_order": list(feature_names),
+        "classes": list(labels),
+        "scaler": {"mean": [0.0] * len(feature_names), "std": [1.0] * len(feature_names)},
+        "weights": weights.tolist(),
+        "bias": bias.tolist(),
+        "inference": {"score_fn": "softmax", "temperature": 1.0, "calibrated": calibrated},
+        "training": {"dataset": "WESAD", **(quality or {}).get(model_name, {})},
+        "export_time_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "notes": f"Converted from {kind} ({model_name}.joblib) with scaler.joblib folded in",
+    }
+    return document, estimator
+
+
+def check_parity(document, estimator, scaler, n_samples: int = 5000, seed: int = 0):
+    """Compare the SDK model with scikit-learn on synthetic raw feature rows."""
+    model = LinearSvmModel.from_dict(document)
+    rng = np.random.default_rng(seed)
+    X = scaler.mean_ + rng.normal(size=(n_samples, scaler.mean_.size)) * scaler.scale_
+    X_scaled = scaler.transform(X)
+
+    margins = X @ model.folded_weights.T + model.folded_biases
+    expected = estimator.decision_function(X_scaled)
+    scale = max(1.0, float(np.abs(expected).max()))
+    report = {
+        "max_decision_error": float(np.abs(margins - expected).max() / scale),
+        "argmax_agreement": float(np.mean(margins.argmax(axis=1) == expected.argmax(axis=1))),
+    }
+    if document["inference"]["calibrated"]:
+        probabilities = model.predict_batch(X)
+        report["max_proba_error"] = float(
+            np.abs(probabilities - estimator.predict_proba(X_scaled)).max()
+        )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path(__file__).resolve().parent / "converted")
+    parser.add_argument("--models", nargs="+", default=LINEAR_MODELS)
+    args = parser.parse_args()
+
+    scaler, feature_names, labels = load_reference()
+    quality = read_quality()
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    failed = []
+    for model_name in args.models:
+        document, estimator = convert(model_name, scaler, feature_names, labels, quality)
+        report = check_parity(document, estimator, scaler)
+        errors = [report["max_decision_error"], report.get("max_proba_error", 0.0)]
+        status = "ok" if max(errors) <= PARITY_TOLERANCE else "MISMATCH"
+        proba = report.get("max_proba_error")
+        print(
+            f"{model_name:10s} type={document['type']:20s} "
+            f"max_decision_err={report['max_decision_error']:.2e} "
+            f"max_proba_err={'n/a' if proba is None else f'{proba:.2e}':>8s} "
+            f"argmax_agree={report['argmax_agreement']:.4f} {status}"
+        )
+        if status != "ok":
+            failed.append(model_name)
+            continue
+        with open(args.out / f"{document['model_id']}.json", "w") as f:
+            json.dump(document, f, indent=2)
+
+    if failed:
+        print(f"Parity check failed for: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Convert the KNN reference model to the SDK's native knn format.
+
+Usage:
+    python convert_neighbors.py [--out converted] [--models KNN]
+
+Each model is written as <out>/<model_id>.json plus <model_id>.npz and checked
+against the joblib model's kneighbors and predict_proba before it is kept. The
+output directory can be added to a ModelRegistry search path.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "sdks" / "python" / "src"))
+
+from synheart_emotion.neighbors import KNeighborsModel  # noqa: E402
+
+MODELS_DIR = Path(__file__).resolve().parent / "models"
+NEIGHBOR_MODELS = ["KNN"]
+PARITY_TOLERANCE = 1e-6
+
+
+def model_id_for(model_name: str) -> str:
+    return f"wesad_{model_name.lower().replace('-', '_')}_v1_0"
+
+
+def load_reference():
+    scaler = joblib.load(MODELS_DIR / "scaler.joblib")
+    with open(MODELS_DIR / "feature_names.json", "r") as f:
+        feature_names = json.load(f)
+    with open(MODELS_DIR / "label_map_0based.json", "r") as f:
+        label_map = {int(k): v for k, v in json.load(f).items()}
+    labels = [label_map[k] for k in sorted(label_map)]
+    return scaler, feature_names, labels
+
+
+def check_parity(native, estimator, scaler, n_samples: int = 2000, seed: int = 0):
+    """Compare neighbour distances and probabilities on synthetic HRV feature rows.
+
+    Half the rows are jittered training points, so queries land both near
+    and far from the stored data.
+    """
+    rng = np.random.default_rng(seed)
+    near = estimator._fit_X[rng.integers(0, estimator._fit_X.shape[0], n_samples // 2)]
+    near = near + rng.normal(scale=0.25, size=near.shape)
+    far = rng.normal(size=(n_samples - near.shape[0], scaler.mean_.size))
+    X_scaled = np.vstack((near, far))
+    X = scaler.inverse_transform(X_scaled)
+
+    expected_distances, _ = estimator.kneighbors(X_scaled)
+    distances, _ = native.kneighbors(X)
+    expected = estimator.predict_proba(X_scaled)
+    actual = native.predict_batch(X)
+
+    start = time.perf_counter()
+    for row in X[:200]:
+        native.predict_batch(row[np.newaxis, :])
+    row_ms = (time.perf_counter() - start) / 200 * 1e3
+
+    return {
+        "max_distance_error": float(np.abs(distances - expected_distances).max()),
+        "max_proba_error": float(np.abs(actual - expected).max()),
+        "argmax_agreement": float((actual.argmax(axis=1) == expected.argmax(axis=1)).mean()),
+        "single_row_ms": row_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path(__file__).resolve().parent / "converted")
+    parser.add_argument("--models", nargs="+", default=NEIGHBOR_MODELS)
+    parser.add_argument("--leaf-size", type=int, default=None, help="KD-tree leaf size")
+    args = parser.parse_args()
+
+    scaler, feature_names, labels = load_reference()
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    failed = []
+    for model_name in args.models:
+        estimator = joblib.load(MODELS_DIR / f"{model_name}.joblib")
+        native = KNeighborsModel.from_sklearn(
+            estimator,
+            model_id_for(model_name),
+            feature_names,
+            labels,
+            scaler,
+            leaf_size=args.leaf_size,
+        )
+        report = check_parity(native, estimator, scaler)
+        errors = (report["max_distance_error"], report["max_proba_error"])
+        status = "ok" if max(errors) <= PARITY_TOLERANCE else "MISMATCH"
+        print(
+            f"{model_name:6s} points={native.n_points:5d} leaves={native.n_leaves:4d} "
+            f"k={native.n_neighbors} max_dist_err={report['max_distance_error']:.2e} "
+            f"max_proba_err={report['max_proba_error']:.2e} "
+            f"argmax_agree={report['argmax_agreement']:.4f} "
+            f"row={report['single_row_ms']:.3f} ms {status}"
+        )
+        if status != "ok":
+            failed.append(model_name)
+            continue
+        native.save(args.out / f"{native.model_id}.json")
+
+    if failed:
+        print(f"Parity check failed for: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
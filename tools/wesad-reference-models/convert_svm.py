@@ -0,0 +1,119 @@
+"""Convert the RBF-SVM reference model to the SDK's native rbf_svm format and benchmark it.
+
+Usage:
+    python convert_svm.py [--out converted] [--reduce 0.5 0.25 0.1] [--rows 10000]
+
+The model is written as <out>/<model_id>.json plus <model_id>.npz after its
+decision values are checked against the joblib model. Batch throughput and
+single-row latency are then compared with joblib for the full model and for
+reduced-set approximations keeping each --reduce fraction of the support
+vectors, together with their argmax agreement and decision error.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "sdks" / "python" / "src"))
+
+from synheart_emotion.rbf_svm import RbfSvmModel  # noqa: E402
+
+MODELS_DIR = Path(__file__).resolve().parent / "models"
+MODEL_NAME = "RBF-SVM"
+PARITY_TOLERANCE = 1e-9
+
+
+def model_id_for(model_name: str) -> str:
+    return f"wesad_{model_name.lower().replace('-', '_')}_v1_0"
+
+
+def load_reference():
+    scaler = joblib.load(MODELS_DIR / "scaler.joblib")
+    with open(MODELS_DIR / "feature_names.json", "r") as f:
+        feature_names = json.load(f)
+    with open(MODELS_DIR / "label_map_0based.json", "r") as f:
+        label_map = {int(k): v for k, v in json.load(f).items()}
+    labels = [label_map[k] for k in sorted(label_map)]
+    return scaler, feature_names, labels
+
+
+def synthetic_rows(scaler, n_samples: int, seed: int = 0) -> np.ndarray:
+    """Synthetic HRV feature rows around the scaler's training distribution."""
+    rng = np.random.default_rng(seed)
+    return scaler.mean_ + rng.normal(size=(n_samples, scaler.mean_.size)) * scaler.scale_
+
+
+def timed(predict, X: np.ndarray, n_single: int = 300):
+    """Return (batch ms per 1k rows, single-row ms) for a predict callable."""
+    predict(X[:10])
+    start = time.perf_counter()
+    predict(X)
+    batch_ms = (time.perf_counter() - start) / X.shape[0] * 1e6
+
+    start = time.perf_counter()
+    for row in X[:n_single]:
+        predict(row[np.newaxis, :])
+    row_ms = (time.perf_counter() - start) / n_single * 1e3
+    return batch_ms, row_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path(__file__).resolve().parent / "converted")
+    parser.add_argument("--reduce", type=float, nargs="*", default=[0.5, 0.25, 0.1])
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    scaler, feature_names, labels = load_reference()
+    estimator = joblib.load(MODELS_DIR / f"{MODEL_NAME}.joblib")
+    native = RbfSvmModel.from_sklearn(
+        estimator, model_id_for(MODEL_NAME), feature_names, labels, scaler
+    )
+
+    def reference(rows):
+        return estimator.decision_function((rows - scaler.mean_) / scaler.scale_)
+
+    X = synthetic_rows(scaler, args.rows)
+    expected = reference(X)
+    exact = native.ovr_scores(X)
+    max_error = float(np.abs(exact - expected).max())
+    status = "ok" if max_error <= PARITY_TOLERANCE else "MISMATCH"
+    print(f"{MODEL_NAME} vectors={native.n_vectors} max_err={max_error:.2e} {status}")
+    if status != "ok":
+        print(f"Parity check failed for: {MODEL_NAME}")
+        sys.exit(1)
+    args.out.mkdir(parents=True, exist_ok=True)
+    native.save(args.out / f"{native.model_id}.json")
+
+    batch_ms, row_ms = timed(reference, X)
+    print(
+        f"{'joblib':14s} vectors={native.n_vectors:4d} batch={batch_ms:7.2f} ms/1k row={row_ms:.3f} ms"
+    )
+
+    exact_argmax = exact.argmax(axis=1)
+    for fraction in [1.0] + sorted(args.reduce, reverse=True):
+        model = (
+            native
+            if fraction == 1.0
+            else native.reduced(max(1, round(native.n_vectors * fraction)))
+        )
+        batch_ms, row_ms = timed(model.predict_batch, X)
+        scores = model.ovr_scores(X)
+        decision_error = float(
+            np.abs(model.decision_function(X) - native.decision_function(X)).max()
+        )
+        agreement = float((scores.argmax(axis=1) == exact_argmax).mean())
+        print(
+            f"{f'native x{fraction:g}':14s} vectors={model.n_vectors:4d} "
+            f"batch={batch_ms:7.2f} ms/1k row={row_ms:.3f} ms "
+            f"decision_err={decision_error:.2e} argmax_agree={agreement:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
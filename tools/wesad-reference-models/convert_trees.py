@@ -0,0 +1,103 @@
+"""Convert the tree-based reference models to the SDK's native tree_ensemble format.
+
+Usage:
+    python convert_trees.py [--out converted] [--models ExtraTrees RF ...]
+
+Each model is written as <out>/<model_id>.json plus <model_id>.npz and checked
+against the original library's predict_proba before it is kept. The output
+directory can be added to a ModelRegistry search path.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+import xgboost as xgb
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "sdks" / "python" / "src"))
+
+from synheart_emotion.trees import TreeEnsembleModel  # noqa: E402
+
+MODELS_DIR = Path(__file__).resolve().parent / "models"
+TREE_MODELS = ["DecisionTree", "ExtraTrees", "RF", "GradBoost", "AdaBoost", "XGB"]
+PARITY_TOLERANCE = 1e-5
+
+
+def model_id_for(model_name: str) -> str:
+    return f"wesad_{model_name.lower().replace('-', '_')}_v1_0"
+
+
+def load_reference():
+    scaler = joblib.load(MODELS_DIR / "scaler.joblib")
+    with open(MODELS_DIR / "feature_names.json", "r") as f:
+        feature_names = json.load(f)
+    with open(MODELS_DIR / "label_map_0based.json", "r") as f:
+        label_map = {int(k): v for k, v in json.load(f).items()}
+    labels = [label_map[k] for k in sorted(label_map)]
+    return scaler, feature_names, labels
+
+
+def convert(model_name: str, scaler, feature_names, labels):
+    """Return (native model, reference predict_proba on scaled input)."""
+    model_id = model_id_for(model_name)
+    xgb_path = MODELS_DIR / f"{model_name}.xgb"
+    if xgb_path.exists():
+        booster = xgb.Booster()
+        booster.load_model(str(xgb_path))
+        native = TreeEnsembleModel.from_xgboost(booster, model_id, feature_names, labels, scaler)
+
+        def reference(X):
+            return booster.predict(xgb.DMatrix(X, feature_names=booster.feature_names))
+
+    else:
+        estimator = joblib.load(MODELS_DIR / f"{model_name}.joblib")
+        native = TreeEnsembleModel.from_sklearn(estimator, model_id, feature_names, labels, scaler)
+        reference = estimator.predict_proba
+    return native, reference
+
+
+def check_parity(native, reference, scaler, n_samples: int = 2000, seed: int = 0):
+    """Compare native and reference probabilities on synthetic HRV feature rows."""
+    rng = np.random.default_rng(seed)
+    X = scaler.mean_ + rng.normal(size=(n_samples, scaler.mean_.size)) * scaler.scale_
+    expected = reference(scaler.transform(X))
+    actual = native.predict_batch(X)
+    max_error = float(np.abs(actual - expected).max())
+    agreement = float((actual.argmax(axis=1) == expected.argmax(axis=1)).mean())
+    return max_error, agreement
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path(__file__).resolve().parent / "converted")
+    parser.add_argument("--models", nargs="+", default=TREE_MODELS)
+    args = parser.parse_args()
+
+    scaler, feature_names, labels = load_reference()
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    failed = []
+    for model_name in args.models:
+        native, reference = convert(model_name, scaler, feature_names, labels)
+        max_error, agreement = check_parity(native, reference, scaler)
+        status = "ok" if max_error <= PARITY_TOLERANCE else "MISMATCH"
+        print(
+            f"{model_name:14s} trees={native.n_trees:4d} nodes={native.feature.size:6d} "
+            f"depth={native.max_depth:2d} max_err={max_error:.2e} "
+            f"argmax_agree={agreement:.4f} {status}"
+        )
+        if status != "ok":
+            failed.append(model_name)
+            continue
+        native.save(args.out / f"{native.model_id}.json")
+
+    if failed:
+        print(f"Parity check failed for: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
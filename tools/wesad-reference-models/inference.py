@@ -1,26 +1,75 @@
-import joblib
+"""Reference inference for the WESAD models.
+
+Models are kept in an LRU cache, and the scaler, feature names, label map and
+xgboost are loaded on first use. score_file streams arbitrarily large CSV or
+Parquet feature files chunk by chunk, optionally across a process pool.
+
+Usage:
+    python inference.py                                   # score one random sample
+    python inference.py features.csv --model ExtraTrees --out predictions.csv
+    python inference.py features.parquet --chunksize 50000 --workers 4
+"""
+
+import argparse
 import json
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import joblib
 import numpy as np
 import pandas as pd
-from xgboost import XGBClassifier
 
-OUT_DIR = Path("models")
+OUT_DIR = Path(__file__).resolve().parent / "models"
+
+# Number of models kept in memory by load_model_by_name
+MODEL_CACHE_SIZE = 4
+
+# Rows per chunk when streaming feature files
+DEFAULT_CHUNKSIZE = 10_000
+
+
+@lru_cache(maxsize=None)
+def get_scaler():
+    return joblib.load(OUT_DIR / "scaler.joblib")
 
-scaler = joblib.load(OUT_DIR / "scaler.joblib")
-with open(OUT_DIR / "feature_names.json", "r") as f:
-    feature_names = json.load(f)
-with open(OUT_DIR / "label_map_0based.json", "r") as f:
-    raw = json.load(f)
-    label_map_0based = {int(k): v for k, v in raw.items()}
 
+@lru_cache(maxsize=None)
+def get_feature_names():
+    with open(OUT_DIR / "feature_names.json", "r") as f:
+        return tuple(json.load(f))
+
+
+@lru_cache(maxsize=None)
+def get_label_map():
+    with open(OUT_DIR / "label_map_0based.json", "r") as f:
+        raw = json.load(f)
+    return {int(k): v for k, v in raw.items()}
+
+
+def __getattr__(name):
+    # Backwards-compatible module attributes, now loaded lazily
+    if name == "scaler":
+        return get_scaler()
+    if name == "feature_names":
+        return list(get_feature_names())
+    if name == "label_map_0based":
+        return get_label_map()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=MODEL_CACHE_SIZE)
 def load_model_by_name(model_name: str):
     jb_path = OUT_DIR / f"{model_name}.joblib"
     xgb_path = OUT_DIR / f"{model_name}.xgb"
     if jb_path.exists():
         return joblib.load(jb_path)
     elif xgb_path.exists():
+        from xgboost import XGBClassifier
+
         model = XGBClassifier()
         model.load_model(str(xgb_path))
         return model
@@ -32,29 +81,142 @@ def load_model_by_name(model_name: str):
                 return all_models[model_name]
         raise FileNotFoundError(f"No saved model found for {model_name}")
 
-def prepare_input(df: pd.DataFrame) -> np.ndarray:
+
+def clear_model_cache():
+    load_model_by_name.cache_clear()
+
+
+def prepare_input(df: pd.DataFrame, fill_values: Optional[pd.Series] = None) -> np.ndarray:
+    """Select, fill and scale features.
+
+    Missing values are filled with fill_values if given, else with the
+    column medians of df (the original behaviour for whole DataFrames).
+    """
     if not isinstance(df, pd.DataFrame):
         df = pd.DataFrame([df])
+    feature_names = list(get_feature_names())
     missing = [c for c in feature_names if c not in df.columns]
     if missing:
         raise ValueError(f"Input is missing these required features: {missing}")
     df = df[feature_names].copy()
-    df = df.fillna(df.median())
-    X_scaled = scaler.transform(df.values)
+    df = df.fillna(df.median() if fill_values is None else fill_values)
+    X_scaled = get_scaler().transform(df.values)
     return X_scaled
 
+
 def predict_dataframe(df: pd.DataFrame, model_name: str):
     model = load_model_by_name(model_name)
     X = prepare_input(df)
-    start_time = time.time()
+    start_time = time.perf_counter()
     pred_nums = model.predict(X)
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
+    label_map_0based = get_label_map()
     pred_names = [label_map_0based[int(p)] for p in pred_nums]
     print(f"\n⏱ Inference time: {elapsed:.4f} seconds")
     return list(zip(pred_nums.tolist(), pred_names))
 
+
+def training_means() -> pd.Series:
+    """Per-feature training means (from the scaler), used to fill gaps in streamed chunks."""
+    return pd.Series(get_scaler().mean_, index=list(get_feature_names()))
+
+
+def _score_chunk(chunk: pd.DataFrame, model_name: str) -> pd.DataFrame:
+    model = load_model_by_name(model_name)
+    X = prepare_input(chunk, fill_values=training_means())
+    pred_nums = np.asarray(model.predict(X)).astype(int)
+    label_map_0based = get_label_map()
+    result = pd.DataFrame(
+        {"label": pred_nums, "label_name": [label_map_0based[p] for p in pred_nums]},
+        index=chunk.index,
+    )
+    if hasattr(model, "predict_proba"):
+        probabilities = model.predict_proba(X)
+        for k, name in sorted(label_map_0based.items()):
+            result[f"p_{name}"] = probabilities[:, k]
+    return result
+
+
+def iter_feature_chunks(
+    path: Union[str, Path], chunksize: int = DEFAULT_CHUNKSIZE
+) -> Iterator[pd.DataFrame]:
+    """Yield feature chunks from a CSV or Parquet file, reading only the model columns."""
+    path = Path(path)
+    columns = list(get_feature_names())
+    if path.suffix.lower() in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+
+        start = 0
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+
+
+def score_file(
+    path: Union[str, Path],
+    model_name: str,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    workers: int = 0,
+) -> Iterator[pd.DataFrame]:
+    """Score a feature file chunk by chunk, yielding prediction DataFrames in input order.
+
+    Memory stays bounded by the chunk size: at most ``2 * workers`` chunks are
+    in flight when a process pool is used. Missing values are filled with the
+    training means so results do not depend on how the file is chunked.
+    """
+    chunks = iter_feature_chunks(path, chunksize)
+    if workers <= 0:
+        for chunk in chunks:
+            yield _score_chunk(chunk, model_name)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_score_chunk, chunk, model_name))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score HRV feature files with a WESAD model")
+    parser.add_argument("input", nargs="?", help="CSV or Parquet feature file")
+    parser.add_argument("--model", default="ExtraTrees")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--workers", type=int, default=0, help="process pool size (0 = serial)")
+    parser.add_argument("--out", type=Path, help="write predictions to this CSV file")
+    args = parser.parse_args()
+
+    if args.input is None:
+        feature_names = list(get_feature_names())
+        sample = pd.DataFrame([np.random.rand(len(feature_names))], columns=feature_names)
+        preds = predict_dataframe(sample, args.model)
+        print("Predictions (numeric, label):", preds)
+        return
+
+    start_time = time.perf_counter()
+    rows = 0
+    for i, predictions in enumerate(
+        score_file(args.input, args.model, args.chunksize, args.workers)
+    ):
+        rows += len(predictions)
+        if args.out:
+            predictions.to_csv(
+                args.out, mode="w" if i == 0 else "a", header=i == 0, index_label="row"
+            )
+        else:
+            print(predictions.to_string(header=i == 0))
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"\n⏱ Scored {rows} rows in {elapsed:.2f} seconds ({rows / max(elapsed, 1e-9):.0f} rows/s)"
+    )
+
+
 if __name__ == "__main__":
-    sample = pd.DataFrame([np.random.rand(len(feature_names))], columns=feature_names)
-    model_to_test = "ExtraTrees"
-    preds = predict_dataframe(sample, model_to_test)
-    print("Predictions (numeric, label):", preds)
+    main()